@@ -0,0 +1,28 @@
+"""
+Settings for running benchmarks against a throwaway database.
+
+Usage:
+    python manage.py migrate --settings=resolveme.benchmark_settings
+    python manage.py benchmark_dashboard --settings=resolveme.benchmark_settings
+    python manage.py benchmark_concurrency --settings=resolveme.benchmark_settings
+    python manage.py benchmark_rendering --settings=resolveme.benchmark_settings
+    python manage.py benchmark_contention --settings=resolveme.benchmark_settings
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import BASE_DIR
+
+DEBUG = False
+
+# Host used by the in-process load generator of benchmark_concurrency.
+ALLOWED_HOSTS = ['localhost']
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'benchmark.sqlite3',
+    }
+}
+
+# Benchmark commands reseed the database; they only run when this is set.
+BENCHMARK_SCRATCH_DATABASE = True
@@ -0,0 +1,68 @@
+"""
+Production profile: the project settings tuned for serving from SQLite under load.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=resolveme.production_settings DJANGO_ALLOWED_HOSTS=tickets.example.com \
+        gunicorn resolveme.wsgi
+
+Under WSGI the live ticket event stream is switched off (it answers 204 and pages
+do not open it); serve resolveme.asgi instead to keep it.
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+from .settings import CACHES, DATABASES
+
+DEBUG = False
+
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', 'localhost').split(',')
+
+NPLUSONE_MODE = None
+
+DATABASES = {
+    'default': {
+        **DATABASES['default'],
+        # Reuse each worker's connection for up to ten minutes instead of reconnecting (and
+        # re-running the pragmas below) per request; a dead connection is replaced first.
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Take the write lock at BEGIN. A deferred transaction that reads and then writes
+            # fails at once with "database is locked" if another writer got there first,
+            # however long the busy timeout.
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+}
+
+# Run on every new connection by tickets.signals.sqlite_pragmas.
+SQLITE_PRAGMAS = {
+    # Readers and the single writer no longer block each other.
+    'journal_mode': 'WAL',
+    # With WAL, only checkpoints fsync; a power cut may lose the last commits, never corrupt.
+    'synchronous': 'NORMAL',
+    # Milliseconds a connection waits for a lock before giving up with "database is locked".
+    'busy_timeout': 5000,
+    # Page cache per connection: negative values are KiB, so 64 MiB.
+    'cache_size': -64000,
+    # Read the database through a 256 MiB memory map instead of read() calls.
+    'mmap_size': 256 * 1024 * 1024,
+    # Sorts and temporary indexes stay in memory.
+    'temp_store': 'MEMORY',
+}
+
+# Sessions and request.user are served from 'default', so it must be shared by every
+# worker for logouts and password changes to reach them all (system check tickets.E001
+# refuses to start on a per-process cache). Needs the redis package.
+CACHES = {
+    **CACHES,
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('DJANGO_CACHE_URL', 'redis://127.0.0.1:6379/0'),
+    },
+}
+
+# Serve sessions and request.user from the cache instead of two queries per request.
+SESSION_ENGINE = 'tickets.sessions'
+AUTHENTICATION_BACKENDS = ['tickets.auth_backends.CachedModelBackend']
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+from datetime import timedelta
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,7 +42,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'tickets.middleware.RequestMetricsMiddleware',
+    'tickets.middleware.NPlusOneMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'tickets.middleware.StaticAssetsMiddleware',
+    'tickets.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -54,15 +59,26 @@ ROOT_URLCONF = 'resolveme.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # Django's backend, with renders timed for RequestMetricsMiddleware.
+        'BACKEND': 'tickets.middleware.request_metrics.TimedDjangoTemplates',
+        'NAME': 'django',
         'DIRS': [BASE_DIR / 'templates']
         ,
-        'APP_DIRS': True,
         'OPTIONS': {
+            # Compile each template once per process. This is what Django picks when no
+            # loaders are given; spelled out so adding a loader cannot silently drop caching.
+            # The dev server still picks up template edits, as it clears these caches on change.
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'tickets.context_processors.live_events',
             ],
         },
     },
@@ -82,6 +98,123 @@ DATABASES = {
 }
 AUTH_USER_MODEL = 'tickets.User'
 
+# Seconds tickets.auth_backends.CachedModelBackend keeps a user cached for
+# request.user. Saves and deletes drop the entry at once in this process; keep it
+# short so other processes, and bulk update()s, catch up quickly.
+AUTH_USER_CACHE_TIMEOUT = 60
+# Expired sessions deleted per statement by `manage.py clearsessions` with the
+# tickets.sessions engine.
+SESSION_CLEANUP_BATCH_SIZE = 1000
+
+# PRAGMAs run on every new SQLite connection (tickets.signals.sqlite_pragmas), as
+# {'journal_mode': 'WAL', ...}. Development keeps SQLite's defaults; the tuned set
+# lives in resolveme.production_settings.
+SQLITE_PRAGMAS = {}
+
+# Read replicas (tickets.routers.ReplicaRouter): aliases in DATABASES that GET
+# requests to REPLICA_READ_VIEWS read from. Empty sends every query to 'default'.
+DATABASE_REPLICAS = []
+DATABASE_ROUTERS = ['tickets.routers.ReplicaRouter']
+# URL names, as fnmatch patterns, of read-only views that may be served from a replica.
+REPLICA_READ_VIEWS = ['home', 'ticket_tab', 'ticket_thread', 'search', 'department_report', 'admin:*_changelist']
+# Seconds a client reads from the primary after a request of theirs wrote, so replica
+# lag never hides their own changes (e.g. the page a form redirects to).
+REPLICA_PIN_SECONDS = 5
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Rendered dashboard rows; the {% cache %} tag uses this alias when it exists. Kept
+    # apart, and sized for heavy users, so rows never evict dashboards from 'default'.
+    'template_fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'template-fragments',
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    },
+}
+
+# Seconds a user's computed dashboard may be served from the cache.
+DASHBOARD_CACHE_TIMEOUT = 300
+
+# Seconds a rendered dashboard row may be reused. Rows are keyed on the ticket's id and
+# updated_at, its latest message and that message's edited_at, and the owner's avatar, so
+# ticket changes, new messages and edits show at once; a renamed owner or sender still
+# waits out this timeout.
+TICKET_ROW_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Seconds an admin changelist's row count is reused before counting again.
+ADMIN_COUNT_CACHE_TIMEOUT = 60
+
+# Serve the dashboard with the async-ORM AsyncHomeView instead of HomeView.
+# Only worth turning on under ASGI; under WSGI Django runs it on a fresh event loop per request.
+ASYNC_DASHBOARD = False
+
+# An open ticket becomes overdue once its customer has waited this long for a
+# staff reply, counted from their oldest unanswered message (Ticket.awaiting_staff_since). Run `manage.py sweep_overdue` periodically (at least as often as
+# its --window) to pick up tickets as they cross the line.
+TICKET_OVERDUE_AFTER = timedelta(days=7)
+
+# Closed tickets untouched for this long are moved, with their messages and
+# assignments, into the archive tables by `manage.py archive_tickets`; thread
+# links keep working through tickets.services.archive.read_through.
+TICKET_ARCHIVE_AFTER = timedelta(days=90)
+# Tickets moved per archive transaction, bounding how long each one holds the write lock.
+TICKET_ARCHIVE_CHUNK_SIZE = 500
+# Rows read per keyset query by the streaming exports (TicketExportView, `manage.py export_tickets`).
+TICKET_EXPORT_BATCH_SIZE = 2000
+
+# Newest messages per ticket kept in the search index. Every post rewrites its
+# ticket's index row, so this bounds the write cost of long threads; words only
+# in older messages stop matching. Run `manage.py rebuild_search_index` after changing it.
+SEARCH_INDEX_MESSAGES = 200
+
+# Per department and day rollups (DepartmentDailyMetrics) behind the department
+# report. Run `manage.py rollup_metrics` periodically; it only recomputes the
+# days touched since its last run.
+# Days recomputed per rollup transaction.
+ROLLUP_CHUNK_DAYS = 31
+# Days covered by the department report unless ?days= says otherwise.
+ROLLUP_REPORT_DAYS = 30
+
+
+# Request metrics (tickets.middleware.RequestMetricsMiddleware)
+# Per-request summaries are logged at INFO on the "tickets.metrics" logger.
+
+# Log any single query that takes at least this many milliseconds.
+REQUEST_METRICS_SLOW_QUERY_MS = 100
+# Log the request summary as a warning when it runs more queries than this.
+REQUEST_METRICS_QUERY_BUDGET = 20
+# Number of slowest statements included in each request summary.
+REQUEST_METRICS_SLOWEST = 3
+
+
+# N+1 detection (tickets.middleware.NPlusOneMiddleware)
+# "raise", "log" (warning on the "tickets.nplusone" logger) or None to switch it off.
+# The test runner always uses "raise".
+NPLUSONE_MODE = 'log' if DEBUG else None
+# Lazy loads of one relation from one template/source line that count as an N+1.
+NPLUSONE_THRESHOLD = 2
+
+TEST_RUNNER = 'tickets.test_runner.NPlusOneTestRunner'
+
+
+# Live ticket events (tickets.views.TicketEventsView, served over ASGI only:
+# under WSGI the stream answers 204 and pages leave out their EventSource)
+# Broker fanning events out to open event streams. LocalBroker only reaches
+# streams in the same process; run one ASGI process or plug in a shared backend.
+TICKET_EVENTS_BROKER = 'tickets.services.events.LocalBroker'
+# Events buffered per open stream before the oldest are dropped for a slow client.
+TICKET_EVENTS_QUEUE_SIZE = 100
+# Seconds of silence after which a keepalive comment is sent down each stream.
+TICKET_EVENTS_KEEPALIVE = 15
+# Milliseconds browsers wait before reconnecting a dropped stream.
+TICKET_EVENTS_RETRY_MS = 5000
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -120,6 +253,42 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [
     BASE_DIR / "static",
 ]
+# Where collectstatic gathers files; StaticAssetsMiddleware serves them from here.
+STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    # Content-hashed names plus optimised PNGs and .br/.gz copies, written by collectstatic.
+    # `manage.py static_report` shows the bytes saved by the last run.
+    'staticfiles': {
+        'BACKEND': 'tickets.storage.PrecompressedManifestStaticFilesStorage',
+    },
+}
+# Collected files with these extensions get precompressed copies...
+STATIC_PRECOMPRESS_EXTENSIONS = ('.css', '.js', '.mjs', '.json', '.map', '.svg', '.txt', '.xml', '.html')
+# ...once they are at least this many bytes; smaller ones barely shrink.
+STATIC_PRECOMPRESS_MIN_SIZE = 256
+# Hashed static files never change, so browsers may keep them for a year without revalidating.
+STATIC_IMMUTABLE_SECONDS = 60 * 60 * 24 * 365
+# Unhashed static files (e.g. linked from outside the templates) are only cached briefly.
+STATIC_REVALIDATE_SECONDS = 60
+
+# Uploaded files (profile pictures and their resized avatars)
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Square avatar sizes, in pixels, generated for every profile picture. Templates
+# pick the 2x size for high-density screens when it is in this list.
+AVATAR_SIZES = (20, 40, 80)
+# Encodings generated for each size; browsers that accept WebP get it, the rest JPEG.
+AVATAR_FORMATS = ('webp', 'jpeg')
+# Encoder quality for avatar variants (0-100).
+AVATAR_QUALITY = 80
+# Avatar variants are named by content hash, so browsers may keep them forever.
+AVATAR_CACHE_SECONDS = 60 * 60 * 24 * 365
+
+LOGIN_URL = 'login'
 LOGIN_REDIRECT_URL = 'home'
 LOGOUT_REDIRECT_URL = 'home'
\ No newline at end of file
@@ -14,14 +14,23 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
-from tickets.views import HomeView, CustomLoginView
+from tickets.views import AsyncHomeView, HomeView, CustomLoginView, TicketTabView, SearchView, TicketThreadView, TicketThreadStreamView, TicketEventsView, AvatarView, TicketExportView, DepartmentReportView
 from django.contrib.auth.views import LogoutView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('', HomeView.as_view(), name='home'),
+    path('', (AsyncHomeView if settings.ASYNC_DASHBOARD else HomeView).as_view(), name='home'),
+    path('tabs/<slug:tab>/', TicketTabView.as_view(), name='ticket_tab'),
+    path('search/', SearchView.as_view(), name='search'),
+    path('tickets/<int:pk>/', TicketThreadView.as_view(), name='ticket_thread'),
+    path('tickets/<int:pk>/full/', TicketThreadStreamView.as_view(), name='ticket_thread_full'),
+    path('events/', TicketEventsView.as_view(), name='ticket_events'),
+    path('avatars/<str:name>', AvatarView.as_view(), name='avatar'),
+    path('export/<slug:dataset>/', TicketExportView.as_view(), name='ticket_export'),
+    path('reports/departments/', DepartmentReportView.as_view(), name='department_report'),
     path('login/', CustomLoginView.as_view(), name='login'),
     path('logout/', LogoutView.as_view(), name='logout'),
 ]
@@ -1,3 +1,108 @@
-from django.contrib import admin
+from hashlib import md5
 
-# Register your models here.
+from django import forms
+from django.conf import settings
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+from .models import Department, Ticket, TicketAssigned, TicketMessage
+from .services.ticket_actions import close_tickets, reassign_tickets
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that reuses a changelist's row count for a while instead of counting on every page view."""
+
+    @cached_property
+    def count(self):
+        """The cached number of rows, counted again once ``ADMIN_COUNT_CACHE_TIMEOUT`` has passed."""
+        try:
+            key = self.count_key()
+        except EmptyResultSet:
+            return 0
+        return cache.get_or_set(key, self.exact_count, settings.ADMIN_COUNT_CACHE_TIMEOUT)
+
+    def count_key(self):
+        """Cache key naming the filtered query being counted."""
+        sql, params = self.object_list.query.sql_with_params()
+        return "admin:count:" + md5(f"{sql}|{params}".encode(), usedforsecurity=False).hexdigest()
+
+    def exact_count(self):
+        """Run the real COUNT(*)."""
+        return super().count
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """Changelist defaults for tables with millions of rows: no unfiltered COUNT(*), cached page counts."""
+    show_full_result_count = False
+    paginator = CachedCountPaginator
+    list_per_page = 50
+
+
+class DepartmentChoiceForm(forms.Form):
+    """The department picked for the reassign action."""
+    department = forms.ModelChoiceField(queryset=Department.objects.all(), required=False)
+
+
+class TicketActionForm(ActionForm, DepartmentChoiceForm):
+    """Action bar with a department picker for the reassign action."""
+
+
+@admin.register(Ticket)
+class TicketAdmin(LargeTableAdmin):
+    """Admin for tickets, with bulk close and reassign actions."""
+    list_display = ("id", "title", "status", "created_by", "created_at", "updated_at")
+    list_filter = ("status",)
+    list_select_related = ("created_by",)
+    raw_id_fields = ("created_by",)
+    search_fields = ("=id", "title")
+    action_form = TicketActionForm
+    actions = ("close_selected", "reassign_selected")
+
+    @admin.action(description="Close selected tickets")
+    def close_selected(self, request, queryset):
+        """Close the selected tickets with one UPDATE."""
+        closed = close_tickets(queryset)
+        self.message_user(request, f"Closed {closed} tickets.", messages.SUCCESS)
+
+    @admin.action(description="Reassign selected tickets to the chosen department")
+    def reassign_selected(self, request, queryset):
+        """Replace the selected tickets' assignments with the department picked in the action bar."""
+        form = DepartmentChoiceForm(request.POST)
+        if not form.is_valid() or form.cleaned_data["department"] is None:
+            self.message_user(request, "Choose a department to reassign to.", messages.WARNING)
+            return
+        department = form.cleaned_data["department"]
+        moved = reassign_tickets(queryset, department)
+        self.message_user(request, f"Reassigned {moved} tickets to {department}.", messages.SUCCESS)
+
+
+@admin.register(TicketMessage)
+class TicketMessageAdmin(LargeTableAdmin):
+    """Admin for ticket messages."""
+    list_display = ("id", "ticket", "sender", "timestamp")
+    list_select_related = ("ticket", "sender")
+    raw_id_fields = ("ticket", "sender")
+    search_fields = ("=ticket__id",)
+
+
+@admin.register(Department)
+class DepartmentAdmin(admin.ModelAdmin):
+    """Admin for departments; searchable so other admins can autocomplete them."""
+    list_display = ("name", "created_by", "created_on")
+    list_select_related = ("created_by",)
+    raw_id_fields = ("created_by",)
+    search_fields = ("name",)
+
+
+@admin.register(TicketAssigned)
+class TicketAssignedAdmin(LargeTableAdmin):
+    """Admin for ticket-to-department assignments."""
+    list_display = ("ticket", "department")
+    list_filter = ("department",)
+    list_select_related = ("ticket", "department")
+    raw_id_fields = ("ticket",)
+    autocomplete_fields = ("department",)
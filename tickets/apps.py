@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TicketsConfig(AppConfig):
     """Configuration for the tickets app."""
     name = 'tickets'
+
+    def ready(self):
+        """Register the app's signal receivers and system checks."""
+        from . import checks, signals  # noqa: F401
@@ -0,0 +1,39 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+USER_KEY = "auth:user:{user_id}"
+
+
+def user_cache_key(user_id):
+    """Cache key of the user loaded for ``request.user``."""
+    return USER_KEY.format(user_id=user_id)
+
+
+def forget_user(user_id):
+    """Drop a cached user so the next request loads it from the database."""
+    cache.delete(user_cache_key(user_id))
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend whose ``get_user`` serves ``request.user`` from the cache for ``AUTH_USER_CACHE_TIMEOUT``.
+
+    tickets.signals.user_cache drops the entry whenever the user is saved or
+    deleted, which covers password changes and logins; bulk ``update()`` calls
+    are only picked up once the entry expires.
+    """
+
+    def get_user(self, user_id):
+        """The active user ``user_id``, from the cache when it is there."""
+        user = cache.get(user_cache_key(user_id))
+        if user is not None:
+            return user
+        user = super().get_user(user_id)
+        if user is not None:
+            cache.set(user_cache_key(user_id), user, settings.AUTH_USER_CACHE_TIMEOUT)
+        return user
+
+    async def aget_user(self, user_id):
+        """Async ``get_user``; cache backends' async methods run in a thread anyway."""
+        return await sync_to_async(self.get_user)(user_id)
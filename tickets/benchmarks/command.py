@@ -0,0 +1,47 @@
+import json
+import sys
+from abc import ABC, abstractmethod
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+
+class BenchmarkCommand(ABC, BaseCommand):
+    """Base of the benchmark commands: reseed only the scratch database and write one JSON report.
+
+    Subclasses name their ``benchmark``, add their own options after calling
+    ``super().add_arguments`` and return their results from ``run``.
+    """
+
+    benchmark = None
+
+    def add_arguments(self, parser):
+        """Register the seed and output options every benchmark takes."""
+        parser.add_argument("--seed", type=int, default=42, help="Random seed for the dataset.")
+        parser.add_argument("--output", help="Write JSON here instead of stdout.")
+
+    @abstractmethod
+    def run(self, options):
+        """Run the benchmark with the parsed ``options`` and return its results."""
+
+    def handle(self, *args, **options):
+        """Run the benchmark and emit one JSON report."""
+        if not getattr(settings, "BENCHMARK_SCRATCH_DATABASE", False):
+            raise CommandError("Refusing to reseed this database; use --settings=resolveme.benchmark_settings.")
+        report = {
+            "benchmark": self.benchmark,
+            "generated_at": timezone.now().isoformat(),
+            "python": sys.version.split()[0],
+            "results": self.run(options),
+        }
+        self.write_report(json.dumps(report, indent=2), options["output"])
+
+    def write_report(self, payload, path):
+        """Write the report to ``path``, or to stdout when no path is given."""
+        if not path:
+            self.stdout.write(payload)
+            return
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+        self.stdout.write(self.style.SUCCESS(f"Wrote {path}"))
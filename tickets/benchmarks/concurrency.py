@@ -0,0 +1,184 @@
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management import call_command
+from django.core.wsgi import get_wsgi_application
+from django.test import Client, override_settings
+from django.urls import path
+
+from resolveme import urls
+from .dashboard import heaviest_user, volumes_for
+from ..views import AsyncHomeView, HomeView
+
+# Cache backend that never stores anything, so every request builds the dashboard.
+NO_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+class SyncDashboardURLs:
+    """URLconf (usable as ROOT_URLCONF) serving the dashboard with HomeView."""
+    urlpatterns = [path("", HomeView.as_view(), name="home"), *urls.urlpatterns]
+
+
+class AsyncDashboardURLs:
+    """URLconf (usable as ROOT_URLCONF) serving the dashboard with AsyncHomeView."""
+    urlpatterns = [path("", AsyncHomeView.as_view(), name="home"), *urls.urlpatterns]
+
+
+def benchmark_host():
+    """A Host header the project accepts."""
+    return next((host for host in settings.ALLOWED_HOSTS if host != "*"), "localhost")
+
+
+def session_cookie(user):
+    """Cookie header carrying a logged-in session for ``user``."""
+    client = Client()
+    client.force_login(user)
+    return f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+
+
+def wsgi_environ(cookie):
+    """WSGI environ for an authenticated GET of the dashboard."""
+    return {
+        "REQUEST_METHOD": "GET", "PATH_INFO": "/", "QUERY_STRING": "", "SCRIPT_NAME": "",
+        "SERVER_NAME": benchmark_host(), "SERVER_PORT": "80", "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": benchmark_host(), "HTTP_COOKIE": cookie, "REMOTE_ADDR": "127.0.0.1",
+        "wsgi.input": BytesIO(), "wsgi.errors": sys.stderr, "wsgi.url_scheme": "http",
+    }
+
+
+def asgi_scope(cookie):
+    """ASGI HTTP scope for an authenticated GET of the dashboard."""
+    return {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/", "raw_path": b"/", "query_string": b"", "root_path": "",
+        "headers": [(b"host", benchmark_host().encode()), (b"cookie", cookie.encode())],
+        "client": ("127.0.0.1", 0), "server": (benchmark_host(), 80),
+    }
+
+
+def serve_wsgi(application, cookie):
+    """Serve one request through the WSGI handler, returning (latency ms, status)."""
+    statuses = []
+    started = time.perf_counter()
+    response = application(wsgi_environ(cookie), lambda status, headers, exc_info=None: statuses.append(status))
+    try:
+        b"".join(response)
+    finally:
+        response.close()
+    return (time.perf_counter() - started) * 1000, int(statuses[0].split()[0])
+
+
+def receiver():
+    """ASGI ``receive``: an empty request body, then no further messages until cancelled."""
+    pending = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        """Hand over the body once, then wait like a client that stays connected."""
+        if pending:
+            return pending.pop()
+        await asyncio.Event().wait()
+
+    return receive
+
+
+async def serve_asgi(application, cookie):
+    """Serve one request through the ASGI handler, returning (latency ms, status)."""
+    sent = []
+
+    async def send(message):
+        """Collect the response messages."""
+        sent.append(message)
+
+    started = time.perf_counter()
+    await application(asgi_scope(cookie), receiver(), send)
+    return (time.perf_counter() - started) * 1000, sent[0]["status"]
+
+
+def percentile(ordered, fraction):
+    """The value ``fraction`` of the way through an already sorted list."""
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 3)
+
+
+def summarize_load(samples, seconds, concurrency):
+    """Reduce (latency, status) samples from one load run to throughput and latency percentiles."""
+    latencies = sorted(ms for ms, _ in samples)
+    return {
+        "requests": len(samples),
+        "concurrency": concurrency,
+        "errors": sum(status != 200 for _, status in samples),
+        "throughput_rps": round(len(samples) / seconds, 1),
+        "p50_ms": percentile(latencies, 0.5),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+    }
+
+
+def run_wsgi(cookie, requests, concurrency):
+    """Drive the WSGI handler from ``concurrency`` threads, like a threaded WSGI server."""
+    application = get_wsgi_application()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        samples = list(pool.map(lambda _: serve_wsgi(application, cookie), range(requests)))
+    return summarize_load(samples, time.perf_counter() - started, concurrency)
+
+
+async def drive_asgi(application, cookie, requests, concurrency):
+    """Keep ``concurrency`` requests in flight on one event loop until ``requests`` are served."""
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one():
+        """Serve a request once a slot is free."""
+        async with slots:
+            return await serve_asgi(application, cookie)
+
+    return await asyncio.gather(*(one() for _ in range(requests)))
+
+
+def run_asgi(cookie, requests, concurrency):
+    """Drive the ASGI handler with ``concurrency`` concurrent requests on one event loop."""
+    application = get_asgi_application()
+    started = time.perf_counter()
+    samples = asyncio.run(drive_asgi(application, cookie, requests, concurrency))
+    return summarize_load(samples, time.perf_counter() - started, concurrency)
+
+
+# Each mode: how requests are served, and which dashboard view answers them.
+MODES = {
+    "wsgi": (run_wsgi, SyncDashboardURLs),
+    "asgi_sync_view": (run_asgi, SyncDashboardURLs),
+    "asgi_async_view": (run_asgi, AsyncDashboardURLs),
+}
+
+
+def run_load(user, requests, concurrency, cached=False):
+    """Load the dashboard of ``user`` under every mode, with or without the dashboard cache."""
+    cache_settings = {} if cached else {"CACHES": NO_CACHE}
+    cookie = session_cookie(user)
+    with override_settings(**cache_settings):
+        return {name: run_mode(name, cookie, requests, concurrency) for name in MODES}
+
+
+def run_mode(name, cookie, requests, concurrency):
+    """Run one mode's load with its dashboard view routed at ``/``."""
+    run, urlconf = MODES[name]
+    with override_settings(ROOT_URLCONF=urlconf):
+        return run(cookie, requests, concurrency)
+
+
+def run_concurrency(tickets, requests, concurrency, seed, cached=False):
+    """Reseed the scratch database and compare WSGI and ASGI dashboards under concurrent load."""
+    volumes = volumes_for(tickets)
+    call_command("unseed", stdout=StringIO())
+    call_command("seed", seed=seed, stdout=StringIO(), **volumes)
+    user = heaviest_user()
+    return {
+        "volumes": volumes,
+        "user_tickets": user.total,
+        "cached": cached,
+        "modes": run_load(user, requests, concurrency, cached),
+    }
@@ -0,0 +1,135 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import OperationalError, connection, connections
+from django.test import override_settings
+
+from resolveme import production_settings
+from .concurrency import percentile
+from .dashboard import volumes_for
+from ..models import Ticket, TicketMessage
+from ..services.dashboard import summary_rows
+
+# Connection settings each profile overrides, taken from its settings module.
+PROFILE_KEYS = ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS", "OPTIONS")
+
+# Database settings and pragmas of each profile compared, "default" being SQLite's own behaviour.
+PROFILES = {
+    "default": ({"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False, "OPTIONS": {}}, {}),
+    "production": (
+        {key: production_settings.DATABASES["default"][key] for key in PROFILE_KEYS},
+        production_settings.SQLITE_PRAGMAS,
+    ),
+}
+
+
+@contextmanager
+def database_profile(name):
+    """Open connections made inside the block with profile ``name``'s database settings.
+
+    Only connections created in the block are affected, so the load must run on
+    fresh threads; the calling thread keeps its existing connection.
+    """
+    original = connections.settings["default"]
+    connections.settings["default"] = {**original, **PROFILES[name][0]}
+    try:
+        yield
+    finally:
+        connections.settings["default"] = original
+
+
+def read_dashboard(owner_ids):
+    """One dashboard read: a random owner's grouped tab counts."""
+    list(summary_rows(random.choice(owner_ids)))
+
+
+def post_message(ticket_ids, sender_id):
+    """Post a reply through the message's atomic save, so every post_save receiver takes its write locks too."""
+    TicketMessage.objects.create(ticket_id=random.choice(ticket_ids), sender_id=sender_id, body="Benchmark reply")
+
+
+def timed(operation):
+    """Run ``operation``, returning (latency ms, whether it failed on a lock)."""
+    started = time.perf_counter()
+    try:
+        operation()
+    except OperationalError:
+        return (time.perf_counter() - started) * 1000, True
+    return (time.perf_counter() - started) * 1000, False
+
+
+def served(operation):
+    """One operation, then the end-of-request check that closes connections past ``CONN_MAX_AGE``."""
+    sample = timed(operation)
+    connection.close_if_unusable_or_obsolete()
+    return sample
+
+
+def client(operation, count):
+    """Run ``operation`` ``count`` times as one client thread, closing its connection at the end."""
+    try:
+        return [served(operation) for _ in range(count)]
+    finally:
+        connection.close()
+
+
+def summarize_operations(batches, seconds):
+    """Reduce every client's (latency, failed) samples to successful throughput, lock errors and percentiles."""
+    samples = [sample for batch in batches for sample in batch]
+    latencies = sorted(ms for ms, _ in samples)
+    errors = sum(failed for _, failed in samples)
+    return {
+        "operations": len(samples),
+        "errors": errors,
+        "per_second": round((len(samples) - errors) / seconds, 1),
+        "p50_ms": percentile(latencies, 0.5),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+    }
+
+
+def run_profile(name, workload, readers, writers, operations):
+    """Hammer the database with ``readers`` dashboard and ``writers`` posting threads under one profile."""
+    clients = ([partial(read_dashboard, workload["owners"])] * readers
+               + [partial(post_message, workload["tickets"], workload["sender"])] * writers)
+    pragmas = override_settings(SQLITE_PRAGMAS=PROFILES[name][1])
+    with database_profile(name), pragmas, ThreadPoolExecutor(len(clients)) as pool:
+        started = time.perf_counter()
+        batches = list(pool.map(lambda operation: client(operation, operations), clients))
+        seconds = time.perf_counter() - started
+    return {"reads": summarize_operations(batches[:readers], seconds),
+            "writes": summarize_operations(batches[readers:], seconds)}
+
+
+def contention_workload():
+    """Ticket owners to read dashboards for, tickets to reply to, and who replies."""
+    owners = sorted(set(Ticket.objects.values_list("created_by_id", flat=True)))
+    return {"owners": owners, "tickets": list(Ticket.objects.values_list("pk", flat=True)), "sender": owners[0]}
+
+
+def reset_journal():
+    """Put the database back in rollback-journal mode; WAL sticks to the file once a run enables it."""
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA journal_mode = DELETE")
+    connection.close()
+
+
+def run_contention(tickets, readers, writers, operations, seed):
+    """Reseed the scratch database and compare SQLite profiles under concurrent reads and writes."""
+    volumes = volumes_for(tickets)
+    call_command("unseed", stdout=StringIO())
+    call_command("seed", seed=seed, stdout=StringIO(), **volumes)
+    workload = contention_workload()
+    reset_journal()
+    return {
+        "volumes": volumes,
+        "readers": readers,
+        "writers": writers,
+        "operations_per_client": operations,
+        "profiles": {name: run_profile(name, workload, readers, writers, operations) for name in PROFILES},
+    }
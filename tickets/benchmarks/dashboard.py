@@ -0,0 +1,90 @@
+import statistics
+import time
+import tracemalloc
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db.models import Count
+from django.test import RequestFactory
+
+from ..middleware.request_metrics import RequestMetrics, measuring
+from ..models import User
+from ..views import HomeView
+
+
+def volumes_for(tickets):
+    """Derive a production-shaped dataset from a ticket count."""
+    return {
+        "users": max(2, tickets // 100),
+        "departments": 10,
+        "tickets": tickets,
+        "messages": tickets * 10,
+    }
+
+
+def heaviest_user():
+    """Return the user who owns the most tickets."""
+    return User.objects.annotate(total=Count("tickets_created")).order_by("-total", "pk").first()
+
+
+def time_request(user, view=None):
+    """Serve the dashboard once, timing it whole and its database and template render phases."""
+    request = RequestFactory().get("/")
+    request.user = user
+    metrics = RequestMetrics()
+    started = time.perf_counter()
+    with measuring(metrics):
+        (view or HomeView.as_view())(request)
+    total = time.perf_counter() - started
+    return {"total": total * 1000, "db": metrics.db_seconds * 1000,
+            "render": metrics.template_seconds * 1000, "queries": len(metrics.queries)}
+
+
+def summarize(samples):
+    """Reduce per-request samples to p50/p95 latencies and query counts."""
+    totals = sorted(s["total"] for s in samples)
+    return {
+        "requests": len(samples),
+        "p50_ms": round(statistics.median(totals), 3),
+        "p95_ms": round(totals[min(len(totals) - 1, int(len(totals) * 0.95))], 3),
+        "db_p50_ms": round(statistics.median(s["db"] for s in samples), 3),
+        "render_p50_ms": round(statistics.median(s["render"] for s in samples), 3),
+        "queries": max(s["queries"] for s in samples),
+    }
+
+
+def measure(user, iterations, cold):
+    """Time ``iterations`` dashboard requests, clearing the cache first when ``cold``."""
+    prepare = cache.clear if cold else (lambda: None)
+    samples = []
+    for _ in range(iterations):
+        prepare()
+        samples.append(time_request(user))
+    return summarize(samples)
+
+
+def peak_memory_kib(user):
+    """Peak Python heap used by one cold dashboard request, in KiB."""
+    cache.clear()
+    tracemalloc.start()
+    try:
+        time_request(user)
+        return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+
+def run_scale(tickets, iterations, seed):
+    """Reseed the scratch database at one scale and benchmark the heaviest user's dashboard."""
+    volumes = volumes_for(tickets)
+    call_command("unseed", stdout=StringIO())
+    call_command("seed", seed=seed, stdout=StringIO(), **volumes)
+    user = heaviest_user()
+    return {
+        "volumes": volumes,
+        "user_tickets": user.total,
+        "cold": measure(user, iterations, cold=True),
+        "warm": measure(user, iterations, cold=False),
+        "peak_memory_kib": peak_memory_kib(user),
+    }
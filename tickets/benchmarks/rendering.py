@@ -0,0 +1,85 @@
+import statistics
+import time
+from io import StringIO
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import call_command
+from django.template.loader import render_to_string
+from django.test import RequestFactory, override_settings
+
+from .concurrency import NO_CACHE
+from .dashboard import heaviest_user
+from ..services.dashboard import tab_querysets
+
+
+def owner_volumes(tickets):
+    """A dataset where one customer (the other user is staff) owns all ``tickets`` tickets."""
+    return {"users": 2, "departments": 10, "tickets": tickets, "messages": tickets * 4}
+
+
+def tab_rows(user):
+    """Every ticket of ``user`` in each tab, fetched up front so only rendering is timed."""
+    return {tab: list(qs) for tab, qs in tab_querysets(user).items()}
+
+
+def viewer_request(user):
+    """A dashboard request made by ``user``."""
+    request = RequestFactory().get("/")
+    request.user = user
+    return request
+
+
+def render_tabs(request, rows):
+    """Render every tab's rows through the dashboard row partial, returning the time taken in ms."""
+    started = time.perf_counter()
+    for tab, tickets in rows.items():
+        render_to_string("partials/ticket_page.html", {"tab": tab, "tickets": tickets, "is_first_page": True}, request)
+    return (time.perf_counter() - started) * 1000
+
+
+def clear_caches():
+    """Empty every configured cache, fragment cache included."""
+    for alias in settings.CACHES:
+        caches[alias].clear()
+
+
+def time_renders(request, rows, iterations, prepare):
+    """Render all rows ``iterations`` times, calling ``prepare`` before each, and summarise."""
+    samples = []
+    for _ in range(iterations):
+        prepare()
+        samples.append(render_tabs(request, rows))
+    total_rows = sum(map(len, rows.values()))
+    return {
+        "renders": iterations,
+        "p50_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "per_row_us": round(statistics.median(samples) * 1000 / max(total_rows, 1), 2),
+    }
+
+
+def render_modes(request, rows, iterations):
+    """Time rendering without a fragment cache, into an emptied one, and out of a warm one."""
+    with override_settings(CACHES=NO_CACHE):
+        uncached = time_renders(request, rows, iterations, lambda: None)
+    cold = time_renders(request, rows, iterations, clear_caches)
+    warm = time_renders(request, rows, iterations, lambda: None)
+    return {"uncached": uncached, "cold": cold, "warm": warm}
+
+
+def run_rendering(tickets, iterations, seed):
+    """Reseed the scratch database and time rendering every dashboard row of a user with ``tickets`` tickets."""
+    volumes = owner_volumes(tickets)
+    call_command("unseed", stdout=StringIO())
+    call_command("seed", seed=seed, stdout=StringIO(), **volumes)
+    user = heaviest_user()
+    rows = tab_rows(user)
+    modes = render_modes(viewer_request(user), rows, iterations)
+    return {
+        "volumes": volumes,
+        "user_tickets": user.total,
+        "rows": {tab: len(tickets) for tab, tickets in rows.items()},
+        "modes": modes,
+        "warm_speedup": round(modes["uncached"]["p50_ms"] / max(modes["warm"]["p50_ms"], 0.001), 1),
+    }
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# Cache backends private to one process; a logout in one worker never reaches the others.
+PER_PROCESS_CACHES = {"django.core.cache.backends.locmem.LocMemCache", "django.core.cache.backends.dummy.DummyCache"}
+
+
+def cached_auth_aliases():
+    """Cache aliases the configured session engine and auth backends keep logins in."""
+    aliases = set()
+    if settings.SESSION_ENGINE == "tickets.sessions":
+        aliases.add(settings.SESSION_CACHE_ALIAS)
+    if "tickets.auth_backends.CachedModelBackend" in settings.AUTHENTICATION_BACKENDS:
+        aliases.add("default")
+    return aliases
+
+
+@register(Tags.caches)
+def check_shared_auth_cache(app_configs, **kwargs):
+    """Refuse cached sessions or users on a cache that other worker processes cannot see."""
+    return [
+        Error(
+            f"CACHES[{alias!r}] is per-process, but sessions or request.user are cached in it.",
+            hint="Use a cache shared by every worker (e.g. RedisCache), or the 'db' session engine and ModelBackend.",
+            id="tickets.E001",
+        )
+        for alias in sorted(cached_auth_aliases())
+        if settings.CACHES[alias]["BACKEND"] in PER_PROCESS_CACHES
+    ]
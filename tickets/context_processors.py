@@ -0,0 +1,6 @@
+from .services.events import served_over_asgi
+
+
+def live_events(request):
+    """Tell templates whether to open the live event stream, which only ASGI deployments serve."""
+    return {"live_events": served_over_asgi(request)}
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tickets.services.avatars import backfill_avatars
+
+
+class Command(BaseCommand):
+    """Generate resized avatar variants for profile pictures uploaded before they existed."""
+
+    help = (
+        "Create the WebP/JPEG avatar variants of stored profile pictures, in batches. "
+        "Pictures whose variants already exist (by content hash) are not re-encoded."
+    )
+
+    def add_arguments(self, parser):
+        """Register the batch size and re-check options."""
+        parser.add_argument("--batch-size", type=int, default=200, help="Users processed per batch.")
+        parser.add_argument("--all", action="store_true",
+                            help="Re-check every user with a picture, e.g. after adding a size or format.")
+
+    def handle(self, *args, **options):
+        """Backfill batch by batch, reporting progress."""
+        started = time.monotonic()
+        done = encoded = 0
+        for done, encoded in backfill_avatars(options["batch_size"], everyone=options["all"]):
+            self.stdout.write(f"  {done} users, {encoded} variants encoded")
+        self.stdout.write(self.style.SUCCESS(
+            f"Backfilled avatars for {done} users ({encoded} variants encoded) in {time.monotonic() - started:.1f}s"
+        ))
@@ -0,0 +1,27 @@
+from tickets.benchmarks.command import BenchmarkCommand
+from tickets.benchmarks.concurrency import run_concurrency
+
+
+class Command(BenchmarkCommand):
+    """Compare the dashboard's throughput and latency under WSGI and ASGI at high concurrency."""
+
+    benchmark = "concurrency"
+    help = (
+        "Seed the scratch database, then serve the dashboard concurrently through the WSGI handler "
+        "(HomeView on a thread pool) and the ASGI handler (HomeView and AsyncHomeView on one event loop). "
+        "Run with --settings=resolveme.benchmark_settings."
+    )
+
+    def add_arguments(self, parser):
+        """Register the dataset, load, cache and output options."""
+        super().add_arguments(parser)
+        parser.add_argument("--tickets", type=int, default=10000, help="Tickets to seed (default 10000).")
+        parser.add_argument("--requests", type=int, default=500, help="Requests served per mode.")
+        parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight at once.")
+        parser.add_argument("--cached", action="store_true",
+                            help="Keep the dashboard cache on (default: every request builds the dashboard).")
+
+    def run(self, options):
+        """Serve the dashboard in every mode."""
+        return run_concurrency(options["tickets"], options["requests"], options["concurrency"],
+                               options["seed"], options["cached"])
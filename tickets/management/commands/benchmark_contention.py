@@ -0,0 +1,26 @@
+from tickets.benchmarks.command import BenchmarkCommand
+from tickets.benchmarks.contention import run_contention
+
+
+class Command(BenchmarkCommand):
+    """Compare SQLite's default behaviour with the production profile under concurrent reads and writes."""
+
+    benchmark = "contention"
+    help = (
+        "Seed the scratch database, then run dashboard-reading and message-posting threads against it, "
+        "first with SQLite's defaults and then with resolveme.production_settings' connection settings "
+        "and pragmas. Run with --settings=resolveme.benchmark_settings."
+    )
+
+    def add_arguments(self, parser):
+        """Register the dataset, thread, operation, seed and output options."""
+        super().add_arguments(parser)
+        parser.add_argument("--tickets", type=int, default=10000, help="Tickets to seed (default 10000).")
+        parser.add_argument("--readers", type=int, default=8, help="Threads reading dashboards.")
+        parser.add_argument("--writers", type=int, default=4, help="Threads posting messages.")
+        parser.add_argument("--operations", type=int, default=200, help="Operations run by each thread.")
+
+    def run(self, options):
+        """Run the load under every profile."""
+        return run_contention(options["tickets"], options["readers"], options["writers"],
+                              options["operations"], options["seed"])
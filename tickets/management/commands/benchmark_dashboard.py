@@ -0,0 +1,24 @@
+from tickets.benchmarks.command import BenchmarkCommand
+from tickets.benchmarks.dashboard import run_scale
+
+
+class Command(BenchmarkCommand):
+    """Benchmark the dashboard across growing dataset sizes and write the results as JSON."""
+
+    benchmark = "dashboard"
+    help = (
+        "Seed increasingly large datasets into the scratch database and time HomeView. "
+        "Run with --settings=resolveme.benchmark_settings."
+    )
+
+    def add_arguments(self, parser):
+        """Register the scale, iteration, seed and output options."""
+        super().add_arguments(parser)
+        parser.add_argument("--scales", default="1000,10000,100000",
+                            help="Comma-separated ticket counts to benchmark (default 1000,10000,100000).")
+        parser.add_argument("--iterations", type=int, default=20, help="Requests timed per scale.")
+
+    def run(self, options):
+        """Benchmark every requested scale in turn."""
+        scales = [int(value) for value in options["scales"].split(",")]
+        return [run_scale(tickets, options["iterations"], options["seed"]) for tickets in scales]
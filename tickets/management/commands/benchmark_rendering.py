@@ -0,0 +1,23 @@
+from tickets.benchmarks.command import BenchmarkCommand
+from tickets.benchmarks.rendering import run_rendering
+
+
+class Command(BenchmarkCommand):
+    """Time rendering a heavy user's dashboard rows with and without the row fragment cache."""
+
+    benchmark = "rendering"
+    help = (
+        "Seed the scratch database so one user owns --tickets tickets, then render all of their "
+        "dashboard rows with no fragment cache, an empty one and a warm one. "
+        "Run with --settings=resolveme.benchmark_settings."
+    )
+
+    def add_arguments(self, parser):
+        """Register the dataset, iteration, seed and output options."""
+        super().add_arguments(parser)
+        parser.add_argument("--tickets", type=int, default=5000, help="Tickets owned by the user (default 5000).")
+        parser.add_argument("--iterations", type=int, default=10, help="Renders timed per mode.")
+
+    def run(self, options):
+        """Render the rows in every mode."""
+        return run_rendering(options["tickets"], options["iterations"], options["seed"])
@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tickets.models import Ticket, TicketMessage
+from tickets.services.bulk import preserve_auto_timestamps
+from tickets.services.importer import checkpoint_for, import_tickets
+
+
+def rate(rows, seconds):
+    """Rows per second, guarding against a zero-length run."""
+    return round(rows / seconds) if seconds else rows
+
+
+class Command(BaseCommand):
+    """Bulk import tickets with their messages and assignments from a JSON Lines file."""
+
+    help = (
+        "Import one ticket per line: {title, status, created_by, created_at, updated_at, "
+        "messages: [{sender, body, timestamp}], departments: [name]}. Users are matched by "
+        "username and departments by name. Re-running resumes after the last committed batch."
+    )
+
+    def add_arguments(self, parser):
+        """Register the file, batch size and restart options."""
+        parser.add_argument("path", help="JSON Lines file to import.")
+        parser.add_argument("--batch-size", type=int, default=1_000, help="Tickets inserted per transaction.")
+        parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and import from line 1.")
+
+    def handle(self, *args, **options):
+        """Import batch by batch, reporting progress and throughput in rows per second."""
+        checkpoint = checkpoint_for(options["path"], options["restart"])
+        if checkpoint.lines:
+            self.stdout.write(f"Resuming after line {checkpoint.lines}")
+        started = time.monotonic()
+        with preserve_auto_timestamps(Ticket, TicketMessage):
+            rows = self.run(options["path"], options["batch_size"], checkpoint, started)
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f"Imported {rows} rows in {elapsed:.1f}s ({rate(rows, elapsed)} rows/s)"))
+
+    def run(self, path, batch_size, checkpoint, started):
+        """Run the import, turning a bad file or record into an error that says where to resume."""
+        try:
+            return self.report(import_tickets(path, batch_size, checkpoint), started)
+        except (OSError, ValueError) as error:
+            raise CommandError(f"{error}; rerun to resume after line {checkpoint.lines}.") from error
+
+    def report(self, progress, started):
+        """Print the running totals after each batch, returning the rows imported."""
+        rows = 0
+        for totals in progress:
+            rows = totals["tickets"] + totals["messages"] + totals["assignments"]
+            self.stdout.write(f"  line {totals['lines']}: {totals['tickets']} tickets, {totals['messages']} messages, "
+                              f"{totals['assignments']} assignments ({rate(rows, time.monotonic() - started)} rows/s)")
+        return rows
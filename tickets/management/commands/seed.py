@@ -0,0 +1,173 @@
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from tickets.models import Department, Ticket, TicketAssigned, TicketMessage, User
+from tickets.services.bulk import preserve_auto_timestamps
+from tickets.services.search import index_tickets
+from tickets.signals.awaiting_staff import awaiting_since
+from tickets.signals.latest_message import latest_message_id
+
+SEED_PREFIX = "seed_"
+SEED_PASSWORD = "password123"
+STAFF_RATIO = 0.05
+ASSIGNED_RATIO = 0.8
+
+SCALES = {
+    "small": {"users": 100, "departments": 5, "tickets": 1_000, "messages": 10_000},
+    "medium": {"users": 1_000, "departments": 20, "tickets": 100_000, "messages": 1_000_000},
+    "large": {"users": 10_000, "departments": 50, "tickets": 1_000_000, "messages": 10_000_000},
+}
+
+STATUS_WEIGHTS = {Ticket.Status.OPEN: 35, Ticket.Status.PENDING: 15, Ticket.Status.CLOSED: 50}
+FIRST_NAMES = ["Amira", "Ben", "Chen", "Dara", "Eli", "Farah", "Gus", "Hana", "Ivan", "Jo"]
+LAST_NAMES = ["Khan", "Lopez", "Moreau", "Nowak", "Okafor", "Patel", "Quinn", "Rossi", "Smith", "Tanaka"]
+DEPARTMENTS = ["IT Support", "Registry", "Finance", "Accommodation", "Library", "Wellbeing", "Careers"]
+SUBJECTS = ["Cannot log in", "Fee payment", "Module enrolment", "Room issue", "Library fine", "Wi-Fi down"]
+BODIES = [
+    "Could you take a look at this please?",
+    "Any update on this?",
+    "Thanks, that fixed it.",
+    "We are looking into it and will get back to you.",
+    "Please send a screenshot of the error.",
+    "This is still happening for me.",
+]
+HISTORY = timedelta(days=365)
+
+
+class SeedGenerator:
+    """Deterministically generates users, departments, tickets, messages and assignments."""
+
+    def __init__(self, rng, batch_size, stdout):
+        """Keep the random source, insert batch size and output stream."""
+        self.rng = rng
+        self.batch_size = batch_size
+        self.stdout = stdout
+        self.now = timezone.now().replace(microsecond=0)
+        self.password = make_password(SEED_PASSWORD)
+
+    def _user(self, index, is_staff):
+        """Build one unsaved user sharing the precomputed password hash."""
+        return User(
+            username=f"{SEED_PREFIX}{index:06d}",
+            email=f"{SEED_PREFIX}{index:06d}@example.com",
+            first_name=self.rng.choice(FIRST_NAMES),
+            last_name=self.rng.choice(LAST_NAMES),
+            password=self.password,
+            is_staff=is_staff,
+        )
+
+    def create_users(self, count):
+        """Bulk create users, the first few percent of them staff."""
+        staff_count = max(1, int(count * STAFF_RATIO))
+        users = [self._user(i, i < staff_count) for i in range(count)]
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=self.batch_size)
+        self.staff_ids = [u.pk for u in users[:staff_count]]
+        self.customer_ids = [u.pk for u in users[staff_count:]] or self.staff_ids
+        self.stdout.write(f"  users: {count} ({staff_count} staff)")
+
+    def create_departments(self, count):
+        """Bulk create departments owned by staff members."""
+        departments = [
+            Department(name=f"{DEPARTMENTS[i % len(DEPARTMENTS)]} {i // len(DEPARTMENTS) + 1}",
+                       created_by_id=self.rng.choice(self.staff_ids), created_on=self.now - HISTORY)
+            for i in range(count)
+        ]
+        with transaction.atomic():
+            Department.objects.bulk_create(departments, batch_size=self.batch_size)
+        self.department_ids = [d.pk for d in departments]
+        self.stdout.write(f"  departments: {count}")
+
+    def _ticket(self):
+        """Build one unsaved ticket with a created/updated window inside the history period."""
+        created_at = self.now - timedelta(seconds=self.rng.randrange(int(HISTORY.total_seconds())))
+        updated_at = created_at + (self.now - created_at) * self.rng.random()
+        return Ticket(
+            title=f"{self.rng.choice(SUBJECTS)} #{self.rng.randrange(10_000)}",
+            status=self.rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()))[0],
+            created_by_id=self.rng.choice(self.customer_ids),
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+    def _sender(self, ticket, position):
+        """The owner opens the thread; later messages come from staff or the owner."""
+        if position == 0 or self.rng.random() < 0.5:
+            return ticket.created_by_id
+        return self.rng.choice(self.staff_ids)
+
+    def _messages(self, ticket, average):
+        """Build a thread of messages spread between the ticket's creation and last update."""
+        count = self.rng.randint(0, 2 * average)
+        span = ticket.updated_at - ticket.created_at
+        offsets = sorted(self.rng.random() for _ in range(count))
+        return [
+            TicketMessage(ticket_id=ticket.pk, sender_id=self._sender(ticket, i),
+                          body=self.rng.choice(BODIES), timestamp=ticket.created_at + span * offset)
+            for i, offset in enumerate(offsets)
+        ]
+
+    def _assignments(self, tickets):
+        """Assign most tickets to one department."""
+        return [
+            TicketAssigned(ticket_id=t.pk, department_id=self.rng.choice(self.department_ids))
+            for t in tickets
+            if self.department_ids and self.rng.random() < ASSIGNED_RATIO
+        ]
+
+    def _ticket_batch(self, count, average):
+        """Insert one batch of tickets with their threads and assignments in one transaction."""
+        tickets = [self._ticket() for _ in range(count)]
+        with transaction.atomic():
+            Ticket.objects.bulk_create(tickets)
+            messages = [m for t in tickets for m in self._messages(t, average)]
+            TicketMessage.objects.bulk_create(messages, batch_size=self.batch_size)
+            TicketAssigned.objects.bulk_create(self._assignments(tickets), batch_size=self.batch_size)
+            batch = Ticket.objects.filter(pk__in=[t.pk for t in tickets])
+            batch.update(last_message=latest_message_id())
+            batch.exclude(status=Ticket.Status.CLOSED).update(awaiting_staff_since=awaiting_since())
+            index_tickets([t.pk for t in tickets])
+        return len(messages)
+
+    def create_tickets(self, count, messages):
+        """Create tickets in batches, spreading roughly ``messages`` messages across them."""
+        average = round(messages / count) if count else 0
+        created = 0
+        for start in range(0, count, self.batch_size):
+            created += self._ticket_batch(min(self.batch_size, count - start), average)
+            self.stdout.write(f"  tickets: {min(start + self.batch_size, count)}/{count}, messages: {created}")
+
+
+class Command(BaseCommand):
+    """Populate the database with a deterministic, production-shaped dataset for load testing."""
+
+    help = "Seed users, departments, tickets, messages and assignments from a fixed random seed."
+
+    def add_arguments(self, parser):
+        """Register the scale preset, per-model overrides, seed and batch size options."""
+        parser.add_argument("--scale", choices=SCALES, default="small", help="Volume preset.")
+        for name in SCALES["small"]:
+            parser.add_argument(f"--{name}", type=int, help=f"Override the number of {name}.")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed (default 42).")
+        parser.add_argument("--batch-size", type=int, default=5_000, help="Rows per INSERT batch.")
+
+    def handle(self, *args, **options):
+        """Generate the requested volumes and report how long it took."""
+        if User.objects.filter(username__startswith=SEED_PREFIX).exists():
+            raise CommandError("Seed data already present; run `manage.py unseed` first.")
+        scale = SCALES[options["scale"]]
+        volumes = {name: scale[name] if options[name] is None else options[name] for name in scale}
+        started = time.monotonic()
+        generator = SeedGenerator(random.Random(options["seed"]), options["batch_size"], self.stdout)
+        with preserve_auto_timestamps(Department, Ticket, TicketMessage):
+            generator.create_users(max(2, volumes["users"]))
+            generator.create_departments(volumes["departments"])
+            generator.create_tickets(volumes["tickets"], volumes["messages"])
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f"Seeded {volumes} in {elapsed:.1f}s"))
@@ -0,0 +1,30 @@
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """Report the bytes saved by the last collectstatic run."""
+
+    help = (
+        "Show how much PNG optimisation and the precompressed .br/.gz copies written by "
+        "collectstatic save over the original static files."
+    )
+
+    def add_arguments(self, parser):
+        """Register the per-file listing option."""
+        parser.add_argument("--files", action="store_true", help="List the sizes of every collected file.")
+
+    def handle(self, *args, **options):
+        """Print the per-file sizes if asked, then the totals."""
+        read_report = getattr(staticfiles_storage, "read_report", lambda: None)
+        report = read_report()
+        if report is None:
+            raise CommandError("No static savings report; run collectstatic with the precompressing storage first.")
+        for file in report["files"] if options["files"] else []:
+            sizes = ", ".join(f"{column} {size}" for column, size in file.items() if column not in ("name", "original"))
+            self.stdout.write(f"  {file['name']}: {file['original']} bytes -> {sizes}")
+        for column, total in report["totals"].items():
+            self.stdout.write(f"  {column}: {total} bytes ({report['saved'][column]} saved)")
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(report['files'])} static files, {report['original']} bytes before optimisation"
+        ))
@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from tickets.services.overdue import sweep_overdue
+
+
+class Command(BaseCommand):
+    """Pick up tickets that have just gone overdue, for every user at once."""
+
+    help = "Find tickets that crossed the overdue cutoff recently and refresh their owners' dashboards."
+
+    def add_arguments(self, parser):
+        """Register the look-back window."""
+        parser.add_argument(
+            "--window", type=int, default=60,
+            help="Minutes to look back past the cutoff; match how often the sweep runs (default 60).",
+        )
+
+    def handle(self, *args, **options):
+        """Run one sweep and report what turned overdue."""
+        ticket_ids, owners = sweep_overdue(timedelta(minutes=options["window"]))
+        if options["verbosity"] > 1 and ticket_ids:
+            self.stdout.write("Tickets: " + ", ".join(f"#{pk}" for pk in ticket_ids))
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(ticket_ids)} ticket(s) became overdue for {len(owners)} user(s)."
+        ))
@@ -0,0 +1,4 @@
+from .nplusone import NPlusOneMiddleware
+from .replica_routing import ReplicaRoutingMiddleware
+from .request_metrics import RequestMetricsMiddleware
+from .static_assets import StaticAssetsMiddleware
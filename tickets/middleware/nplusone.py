@@ -0,0 +1,135 @@
+import logging
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.models.fields.related_descriptors import ForwardManyToOneDescriptor
+from django.template.base import Node
+
+logger = logging.getLogger("tickets.nplusone")
+
+_current = ContextVar("nplusone_detector", default=None)
+
+
+class NPlusOneError(AssertionError):
+    """The same relation was lazily loaded repeatedly from one place."""
+
+
+def _frames(frame):
+    """Walk the stack outwards from ``frame``."""
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+
+def _template_site(frame):
+    """``template:line`` if ``frame`` is a template node rendering, else None."""
+    node = frame.f_locals.get("self")
+    if not isinstance(node, Node) or getattr(node, "origin", None) is None:
+        return None
+    return f"{node.origin.template_name or node.origin.name}:{node.token.lineno}"
+
+
+def _project_site(frame):
+    """``file:line`` if ``frame`` runs project code, else None."""
+    filename = frame.f_code.co_filename
+    ours = filename.startswith(str(settings.BASE_DIR)) and "site-packages" not in filename
+    return f"{filename}:{frame.f_lineno}" if ours and filename != __file__ else None
+
+
+def call_site():
+    """Where a lazy load came from: the template line being rendered, else the nearest project line."""
+    frames = list(_frames(sys._getframe(1)))
+    return (
+        next(filter(None, map(_template_site, frames)), None)
+        or next(filter(None, map(_project_site, frames)), "<unknown>")
+    )
+
+
+class NPlusOneDetector:
+    """Counts lazy foreign-key loads per relation and call site."""
+
+    def __init__(self, mode, threshold=None):
+        """``mode`` is "raise" or "log"; ``threshold`` loads from one site make an N+1."""
+        self.mode = mode
+        self.threshold = threshold or settings.NPLUSONE_THRESHOLD
+        self.loads = Counter()
+
+    def record(self, field):
+        """Count one lazy load of ``field`` and report it once it repeats."""
+        key = (f"{field.model._meta.label}.{field.name}", call_site())
+        self.loads[key] += 1
+        if self.loads[key] == self.threshold:
+            self.report(*key)
+
+    def report(self, relation, site):
+        """Raise or log a detected N+1."""
+        message = (f"N+1 query: {relation} loaded lazily {self.threshold} times from {site}; "
+                   "use select_related() or prefetch_related().")
+        if self.mode == "raise":
+            raise NPlusOneError(message)
+        logger.warning(message)
+
+
+def _detected(get_object):
+    """Wrap the forward descriptor's database fetch so active detectors see it."""
+    @wraps(get_object)
+    def detected_get_object(self, instance):
+        """Record the lazy load, then fetch the related object."""
+        detector = _current.get()
+        if detector is not None:
+            detector.record(self.field)
+        return get_object(self, instance)
+    detected_get_object.is_detected = True
+    return detected_get_object
+
+
+def install_lazy_load_hook():
+    """Patch forward relation descriptors once so lazy loads can be detected."""
+    if not getattr(ForwardManyToOneDescriptor.get_object, "is_detected", False):
+        ForwardManyToOneDescriptor.get_object = _detected(ForwardManyToOneDescriptor.get_object)
+
+
+@contextmanager
+def detecting(mode="raise", threshold=None):
+    """Detect N+1 lazy loads inside the block, raising or logging per ``mode``."""
+    install_lazy_load_hook()
+    token = _current.set(NPlusOneDetector(mode, threshold))
+    try:
+        yield _current.get()
+    finally:
+        _current.reset(token)
+
+
+class NPlusOneMiddleware:
+    """Run each request under the N+1 detector when ``settings.NPLUSONE_MODE`` is set."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """Keep the next handler and install the lazy-load hook."""
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        install_lazy_load_hook()
+
+    def __call__(self, request):
+        """Serve the request, watching for N+1 lazy loads if enabled."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.NPLUSONE_MODE:
+            return self.get_response(request)
+        with detecting(settings.NPLUSONE_MODE):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        """Async counterpart of ``__call__``; the detector follows the request across threads."""
+        if not settings.NPLUSONE_MODE:
+            return await self.get_response(request)
+        with detecting(settings.NPLUSONE_MODE):
+            return await self.get_response(request)
@@ -0,0 +1,43 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from ..routers import choose_replica, replica_reads
+
+# Cookie telling the router a client wrote recently and must read its own writes from the primary.
+PIN_COOKIE = "replica_pin"
+
+
+def pinned(response, reads):
+    """Keep the client on the primary for ``REPLICA_PIN_SECONDS`` after a request that wrote."""
+    if reads.wrote:
+        response.set_cookie(PIN_COOKIE, "1", max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite="Lax")
+    return response
+
+
+class ReplicaRoutingMiddleware:
+    """Serve read-only views from a replica, keeping writes and reads that follow them on the primary.
+
+    Must wrap the session and authentication middleware so their queries are
+    routed with the rest of the request.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """Keep the next handler."""
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """Serve the request with its reads routed to the chosen database."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with replica_reads(choose_replica(request, PIN_COOKIE in request.COOKIES)) as reads:
+            return pinned(self.get_response(request), reads)
+
+    async def __acall__(self, request):
+        """Async counterpart of ``__call__``; ORM calls run in threads that share the request's routing."""
+        with replica_reads(choose_replica(request, PIN_COOKIE in request.COOKIES)) as reads:
+            return pinned(await self.get_response(request), reads)
@@ -0,0 +1,172 @@
+import heapq
+import json
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import DjangoTemplates, Template, reraise
+
+logger = logging.getLogger("tickets.metrics")
+
+_current = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """Queries, database time and template render time collected for one request."""
+
+    def __init__(self):
+        """Start with empty counters."""
+        self.queries = []
+        self.db_seconds = 0.0
+        self.template_seconds = 0.0
+        self.total_seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        """``execute_wrapper`` hook: time one statement and remember it."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record_query(sql, time.perf_counter() - started)
+
+    def record_query(self, sql, seconds):
+        """Add one statement, warning straight away if it was slow."""
+        self.queries.append((seconds, sql))
+        self.db_seconds += seconds
+        if seconds * 1000 >= settings.REQUEST_METRICS_SLOW_QUERY_MS:
+            logger.warning("Slow query (%.1f ms): %s", seconds * 1000, sql[:500])
+
+    def slowest(self):
+        """The slowest statements, slowest first, as (ms, sql) pairs."""
+        top = heapq.nlargest(settings.REQUEST_METRICS_SLOWEST, self.queries, key=lambda q: q[0])
+        return [(round(seconds * 1000, 2), sql[:200]) for seconds, sql in top]
+
+    def server_timing(self):
+        """Format the timings as a ``Server-Timing`` header value."""
+        return (
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{len(self.queries)} queries", '
+            f"tpl;dur={self.template_seconds * 1000:.2f}, "
+            f"total;dur={self.total_seconds * 1000:.2f}"
+        )
+
+
+class TimedTemplate(Template):
+    """A Django template whose renders add to the active request's metrics."""
+
+    def render(self, context=None, request=None):
+        """Render, timing it when a request is being measured."""
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(context, request)
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_seconds += time.perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """The Django template backend, handing out templates that report their render time."""
+
+    def from_string(self, template_code):
+        """Compile ``template_code`` into a timed template."""
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        """Load ``template_name`` as a timed template."""
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+def _wrap_connections(stack, metrics):
+    """Route every database connection's statements through ``metrics``."""
+    for conn in connections.all():
+        stack.enter_context(conn.execute_wrapper(metrics))
+
+
+def _wrapped_connections(metrics):
+    """Wrap the calling thread's connections with ``metrics``, returning the stack that unwraps them."""
+    stack = ExitStack()
+    _wrap_connections(stack, metrics)
+    return stack
+
+
+@contextmanager
+def measuring(metrics):
+    """Make ``metrics`` the active collector and wrap every database connection."""
+    with ExitStack() as stack:
+        stack.callback(_current.reset, _current.set(metrics))
+        _wrap_connections(stack, metrics)
+        yield metrics
+
+
+class RequestMetricsMiddleware:
+    """Report per-request SQL and render timings via Server-Timing and a structured log line.
+
+    Render time comes from ``TimedDjangoTemplates``, the configured template backend.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """Keep the next handler, matching its sync or async style."""
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """Measure the request, then annotate the response and log the summary."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        started = time.perf_counter()
+        with measuring(metrics):
+            response = self.get_response(request)
+        return self.finish(request, response, metrics, started)
+
+    async def __acall__(self, request):
+        """Async counterpart of ``__call__`` that never blocks the event loop.
+
+        The ORM runs async queries on the request's thread-sensitive worker thread,
+        so the connections are wrapped there rather than on the event loop.
+        """
+        metrics = RequestMetrics()
+        started = time.perf_counter()
+        wrapped = await sync_to_async(_wrapped_connections)(metrics)
+        token = _current.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+            await sync_to_async(wrapped.close)()
+        return self.finish(request, response, metrics, started)
+
+    def finish(self, request, response, metrics, started):
+        """Stamp the total time and Server-Timing header, then log the summary."""
+        metrics.total_seconds = time.perf_counter() - started
+        response["Server-Timing"] = metrics.server_timing()
+        self.report(request, response, metrics)
+        return response
+
+    def report(self, request, response, metrics):
+        """Log one JSON line per request and warn when the query budget is exceeded."""
+        line = json.dumps({
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": len(metrics.queries),
+            "db_ms": round(metrics.db_seconds * 1000, 2),
+            "template_ms": round(metrics.template_seconds * 1000, 2),
+            "total_ms": round(metrics.total_seconds * 1000, 2),
+            "slowest": metrics.slowest(),
+        })
+        over_budget = len(metrics.queries) > settings.REQUEST_METRICS_QUERY_BUDGET
+        logger.log(logging.WARNING if over_budget else logging.INFO, line)
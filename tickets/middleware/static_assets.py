@@ -0,0 +1,94 @@
+import mimetypes
+import os
+import re
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse
+from django.utils.cache import patch_vary_headers
+
+from ..storage import ENCODING_SUFFIXES
+
+# An Accept-Encoding parameter refusing a coding.
+REFUSED = re.compile(r"\s*q\s*=\s*0(\.0*)?\s*")
+
+
+def accepted_codings(header):
+    """Content codings a client accepts, from its Accept-Encoding header."""
+    parts = (part.partition(";") for part in header.split(","))
+    return {coding.strip().lower() for coding, _, params in parts if not REFUSED.fullmatch(params)}
+
+
+def static_name(path):
+    """The collected file a request path names, or None if it is not under ``STATIC_URL``."""
+    if not path.startswith(settings.STATIC_URL):
+        return None
+    return path[len(settings.STATIC_URL):] or None
+
+
+def collected(name):
+    """Whether ``name`` is a file in ``STATIC_ROOT``; paths escaping it are not."""
+    try:
+        return os.path.isfile(staticfiles_storage.path(name))
+    except SuspiciousFileOperation:
+        return False
+
+
+def collected_variant(name, accept_encoding):
+    """(stored name, content coding) of the best copy of ``name`` the client accepts, or None."""
+    accepted = accepted_codings(accept_encoding)
+    candidates = [(name + suffix, coding) for coding, suffix in ENCODING_SUFFIXES.items() if coding in accepted]
+    return next((c for c in [*candidates, (name, None)] if collected(c[0])), None)
+
+
+def cache_control(name):
+    """Hashed names never change content, so they are immutable; the rest must revalidate soon."""
+    if name in getattr(staticfiles_storage, "immutable_names", ()):
+        return f"public, max-age={settings.STATIC_IMMUTABLE_SECONDS}, immutable"
+    return f"public, max-age={settings.STATIC_REVALIDATE_SECONDS}"
+
+
+def asset_response(name, stored_name, coding):
+    """Stream a collected file, labelled with the type of ``name`` and the coding it was stored in."""
+    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    response = FileResponse(staticfiles_storage.open(stored_name), content_type=content_type)
+    if coding:
+        response["Content-Encoding"] = coding
+    patch_vary_headers(response, ["Accept-Encoding"])
+    response["Cache-Control"] = cache_control(name)
+    return response
+
+
+class StaticAssetsMiddleware:
+    """Serve collected static files from ``STATIC_ROOT`` with precompressed copies and long cache lifetimes.
+
+    Hashed names from the manifest are sent as ``immutable``; a ``.br`` or ``.gz``
+    copy written by collectstatic is sent instead when the client accepts it.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """Keep the next handler."""
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """Answer static file requests directly; pass everything else on."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.serve(request) or self.get_response(request)
+
+    async def __acall__(self, request):
+        """Async counterpart of ``__call__``."""
+        return self.serve(request) or await self.get_response(request)
+
+    def serve(self, request):
+        """The response for a collected static file, or None if the request is not for one."""
+        name = static_name(request.path_info) if request.method in ("GET", "HEAD") else None
+        variant = collected_variant(name, request.headers.get("Accept-Encoding", "")) if name else None
+        return asset_response(name, *variant) if variant else None
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-18 01:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_last_message(apps, schema_editor):
+    """Point every ticket at its most recent message in a single UPDATE."""
+    Ticket = apps.get_model('tickets', 'Ticket')
+    TicketMessage = apps.get_model('tickets', 'TicketMessage')
+    latest = (
+        TicketMessage.objects.filter(ticket_id=models.OuterRef('pk'))
+        .order_by('-timestamp', '-id')
+        .values('id')[:1]
+    )
+    Ticket.objects.update(last_message=models.Subquery(latest))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0006_alter_user_profile_picture'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='last_message',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Most recent message on this ticket, maintained by signals.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='tickets.ticketmessage'),
+        ),
+        migrations.RunPython(backfill_last_message, migrations.RunPython.noop),
+    ]
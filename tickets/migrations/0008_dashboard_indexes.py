@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-18 01:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0007_ticket_last_message'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['created_by', 'status', '-updated_at'], name='ticket_owner_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticketmessage',
+            index=models.Index(fields=['ticket', '-timestamp', '-id'], name='msg_ticket_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticketmessage',
+            index=models.Index(fields=['-timestamp'], name='msg_timestamp_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.1 on 2026-10-18 02:00
+
+from django.db import migrations, models
+
+
+def backfill_awaiting_staff_since(apps, schema_editor):
+    """Set each open ticket's oldest unanswered customer message time in a single UPDATE."""
+    Ticket = apps.get_model('tickets', 'Ticket')
+    TicketMessage = apps.get_model('tickets', 'TicketMessage')
+    answered = TicketMessage.objects.filter(
+        ticket_id=models.OuterRef('ticket_id'),
+        sender__is_staff=True,
+        timestamp__gte=models.OuterRef('timestamp'),
+    )
+    waiting = (
+        TicketMessage.objects.filter(ticket_id=models.OuterRef('pk'), sender__is_staff=False)
+        .filter(~models.Exists(answered))
+        .order_by('timestamp')
+        .values('timestamp')[:1]
+    )
+    Ticket.objects.exclude(status='closed').update(awaiting_staff_since=models.Subquery(waiting))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0008_dashboard_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='awaiting_staff_since',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When the oldest message not yet answered by staff was posted; cleared by a staff reply or when the ticket is closed. Maintained by signals.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(condition=models.Q(('awaiting_staff_since__isnull', False)), fields=['awaiting_staff_since'], name='ticket_awaiting_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(condition=models.Q(('awaiting_staff_since__isnull', False)), fields=['created_by', 'awaiting_staff_since'], name='ticket_owner_awaiting_idx'),
+        ),
+        migrations.RunPython(backfill_awaiting_staff_since, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-18 02:40
+
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    """Create the FTS5 ticket search table on SQLite and fill it in one statement."""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE ticket_search USING fts5("
+        "title, body, tokenize = 'porter unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(
+        "INSERT INTO ticket_search (rowid, title, body) "
+        "SELECT t.id, t.title, (SELECT group_concat(m.body, ' ') FROM ticket_messages m WHERE m.ticket_id = t.id) "
+        "FROM tickets_ticket t"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    """Drop the FTS5 ticket search table."""
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS ticket_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0009_ticket_awaiting_staff_since'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
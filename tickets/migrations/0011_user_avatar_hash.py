@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 02:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0010_ticket_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='avatar_hash',
+            field=models.CharField(blank=True, editable=False, help_text='SHA-256 of the profile picture, naming its resized avatar variants. Maintained by signals.', max_length=64),
+        ),
+    ]
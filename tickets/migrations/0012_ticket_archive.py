@@ -0,0 +1,68 @@
+# Generated by Django 6.0.1 on 2026-10-18 03:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0011_user_avatar_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedTicket',
+            fields=[
+                ('id', models.IntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=200)),
+                ('status', models.CharField(choices=[('open', 'Open'), ('pending', 'Pending'), ('closed', 'Closed')], default='closed', max_length=20)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('awaiting_staff_since', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_tickets', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedTicketMessage',
+            fields=[
+                ('id', models.IntegerField(primary_key=True, serialize=False)),
+                ('body', models.TextField()),
+                ('timestamp', models.DateTimeField()),
+                ('sender', models.ForeignKey(db_column='sender', on_delete=django.db.models.deletion.CASCADE, related_name='archived_ticket_messages', to=settings.AUTH_USER_MODEL)),
+                ('ticket', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='tickets.archivedticket')),
+            ],
+            options={
+                'db_table': 'ticket_messages_archive',
+                'ordering': ['-timestamp'],
+            },
+        ),
+        migrations.AddField(
+            model_name='archivedticket',
+            name='last_message',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='tickets.archivedticketmessage'),
+        ),
+        migrations.CreateModel(
+            name='ArchivedTicketAssigned',
+            fields=[
+                ('id', models.IntegerField(primary_key=True, serialize=False)),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_assignments', to='tickets.department')),
+                ('ticket', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='tickets.archivedticket')),
+            ],
+            options={
+                'verbose_name_plural': 'Archived Ticket Assignments',
+                'db_table': 'ticket_assigned_archive',
+                'unique_together': {('ticket', 'department')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivedticketmessage',
+            index=models.Index(fields=['ticket', '-timestamp', '-id'], name='archived_msg_ticket_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedticket',
+            index=models.Index(fields=['created_by', '-updated_at'], name='archived_owner_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-18 03:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0012_ticket_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(help_text='Absolute path of the imported file.', max_length=1024, unique=True)),
+                ('offset', models.PositiveBigIntegerField(default=0, help_text='Bytes of the file already imported.')),
+                ('lines', models.PositiveBigIntegerField(default=0, help_text='Lines of the file already imported.')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.1 on 2026-10-18 03:57
+
+import datetime
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0013_import_checkpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='The rollup this watermark belongs to.', max_length=64, unique=True)),
+                ('message_id', models.PositiveBigIntegerField(default=0, help_text='Highest message id already rolled up.')),
+                ('assignment_id', models.PositiveBigIntegerField(default=0, help_text='Highest assignment id already rolled up.')),
+                ('tickets_updated', models.DateTimeField(blank=True, help_text='Tickets updated after this are rolled up next.', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DepartmentDailyMetrics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('opened', models.PositiveIntegerField(default=0, help_text='Assigned tickets created on the day.')),
+                ('closed', models.PositiveIntegerField(default=0, help_text='Assigned tickets last updated on the day while closed.')),
+                ('close_time', models.DurationField(default=datetime.timedelta, help_text='Total creation-to-close time of the closed tickets.')),
+                ('first_replies', models.PositiveIntegerField(default=0, help_text='Assigned tickets first answered by staff on the day.')),
+                ('first_reply_time', models.DurationField(default=datetime.timedelta, help_text='Total creation-to-first-staff-reply time.')),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_metrics', to='tickets.department')),
+            ],
+            options={
+                'verbose_name_plural': 'Department Daily Metrics',
+                'db_table': 'department_daily_metrics',
+                'unique_together': {('department', 'day')},
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-18 04:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0014_department_daily_metrics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ticket_id', models.PositiveIntegerField(help_text='Live or archived ticket id.', unique=True)),
+                ('day', models.DateField(db_index=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 04:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0015_rollup_closure'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticketmessage',
+            name='edited_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -2,4 +2,11 @@ from .user import User
 from .ticket import Ticket
 from .ticket_message import TicketMessage
 from .department import Department
-from .ticket_assigned import TicketAssigned
\ No newline at end of file
+from .ticket_assigned import TicketAssigned
+from .archived_ticket import ArchivedTicket
+from .archived_ticket_message import ArchivedTicketMessage
+from .archived_ticket_assigned import ArchivedTicketAssigned
+from .import_checkpoint import ImportCheckpoint
+from .department_daily_metrics import DepartmentDailyMetrics
+from .rollup_watermark import RollupWatermark
+from .rollup_closure import RollupClosure
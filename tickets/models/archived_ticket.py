@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.db import models
+
+from .ticket import Ticket
+
+
+class ArchivedTicket(models.Model):
+    """A closed ticket moved out of ``tickets_ticket`` by ``archive_tickets``, keeping its id and columns."""
+
+    Status = Ticket.Status
+
+    id = models.IntegerField(primary_key=True)
+    title = models.CharField(max_length=200)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.CLOSED)
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_tickets'
+    )
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    last_message = models.ForeignKey(
+        'tickets.ArchivedTicketMessage',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+'
+    )
+
+    awaiting_staff_since = models.DateTimeField(null=True, blank=True, editable=False)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta options for the ArchivedTicket model."""
+        indexes = [
+            models.Index(fields=['created_by', '-updated_at'], name='archived_owner_idx'),
+        ]
+
+    def __str__(self):
+        """Returns a string representation of the archived ticket."""
+        return f"#{self.id} - {self.title} (archived)"
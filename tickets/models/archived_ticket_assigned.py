@@ -0,0 +1,30 @@
+from django.db import models
+
+from .archived_ticket import ArchivedTicket
+from .department import Department
+
+
+class ArchivedTicketAssigned(models.Model):
+    """A department assignment of an archived ticket, moved out of ``ticket_assigned`` with its ticket."""
+
+    id = models.IntegerField(primary_key=True)
+    ticket = models.ForeignKey(
+        ArchivedTicket,
+        on_delete=models.CASCADE,
+        related_name='assignments'
+    )
+    department = models.ForeignKey(
+        Department,
+        on_delete=models.CASCADE,
+        related_name='archived_assignments'
+    )
+
+    class Meta:
+        """Meta options for the ArchivedTicketAssigned model."""
+        db_table = "ticket_assigned_archive"
+        verbose_name_plural = "Archived Ticket Assignments"
+        unique_together = ('ticket', 'department')
+
+    def __str__(self):
+        """String representation of the ArchivedTicketAssigned instance."""
+        return f"Archived assignment: Ticket #{self.ticket_id} -> {self.department.name}"
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.db import models
+
+from .archived_ticket import ArchivedTicket
+
+
+class ArchivedTicketMessage(models.Model):
+    """A message of an archived ticket, moved out of ``ticket_messages`` with its ticket."""
+
+    id = models.IntegerField(primary_key=True)
+    ticket = models.ForeignKey(ArchivedTicket, on_delete=models.CASCADE)
+    body = models.TextField()
+    sender = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_ticket_messages",
+        db_column="sender",
+    )
+    timestamp = models.DateTimeField()
+
+    class Meta:
+        """Meta information for the ArchivedTicketMessage model."""
+        db_table = "ticket_messages_archive"
+        ordering = ["-timestamp"]
+        indexes = [
+            models.Index(fields=["ticket", "-timestamp", "-id"], name="archived_msg_ticket_ts_idx"),
+        ]
+
+    def __str__(self):
+        """String representation of the ArchivedTicketMessage instance."""
+        return f"Archived message {self.id} for Ticket {self.ticket_id} by User {self.sender_id}"
@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.db import models
+
+from .department import Department
+
+
+class DepartmentDailyMetrics(models.Model):
+    """One department's ticket activity on one day, rolled up by ``rollup_metrics`` for reporting."""
+
+    department = models.ForeignKey(
+        Department,
+        on_delete=models.CASCADE,
+        related_name='daily_metrics'
+    )
+    day = models.DateField()
+    opened = models.PositiveIntegerField(default=0, help_text='Assigned tickets created on the day.')
+    closed = models.PositiveIntegerField(default=0, help_text='Assigned tickets last updated on the day while closed.')
+    close_time = models.DurationField(default=timedelta, help_text='Total creation-to-close time of the closed tickets.')
+    first_replies = models.PositiveIntegerField(default=0, help_text='Assigned tickets first answered by staff on the day.')
+    first_reply_time = models.DurationField(default=timedelta, help_text='Total creation-to-first-staff-reply time.')
+
+    class Meta:
+        """Meta options for the DepartmentDailyMetrics model."""
+        db_table = "department_daily_metrics"
+        verbose_name_plural = "Department Daily Metrics"
+        unique_together = ('department', 'day')
+
+    def __str__(self):
+        """String representation of the DepartmentDailyMetrics instance."""
+        return f"{self.department.name} on {self.day}"
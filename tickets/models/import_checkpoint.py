@@ -0,0 +1,14 @@
+from django.db import models
+
+
+class ImportCheckpoint(models.Model):
+    """How far ``import_tickets`` has got through a source file; saved in each batch's transaction."""
+
+    source = models.CharField(max_length=1024, unique=True, help_text='Absolute path of the imported file.')
+    offset = models.PositiveBigIntegerField(default=0, help_text='Bytes of the file already imported.')
+    lines = models.PositiveBigIntegerField(default=0, help_text='Lines of the file already imported.')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """String representation of the ImportCheckpoint instance."""
+        return f"{self.source} @ line {self.lines}"
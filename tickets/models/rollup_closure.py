@@ -0,0 +1,12 @@
+from django.db import models
+
+
+class RollupClosure(models.Model):
+    """The day ``rollup_metrics`` last counted a ticket as closed, so a reopen can uncount it."""
+
+    ticket_id = models.PositiveIntegerField(unique=True, help_text='Live or archived ticket id.')
+    day = models.DateField(db_index=True)
+
+    def __str__(self):
+        """String representation of the RollupClosure instance."""
+        return f"Ticket {self.ticket_id} closed on {self.day}"
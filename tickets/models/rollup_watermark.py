@@ -0,0 +1,15 @@
+from django.db import models
+
+
+class RollupWatermark(models.Model):
+    """How far ``rollup_metrics`` has got through the live tables; saved after each run."""
+
+    name = models.CharField(max_length=64, unique=True, help_text='The rollup this watermark belongs to.')
+    message_id = models.PositiveBigIntegerField(default=0, help_text='Highest message id already rolled up.')
+    assignment_id = models.PositiveBigIntegerField(default=0, help_text='Highest assignment id already rolled up.')
+    tickets_updated = models.DateTimeField(null=True, blank=True, help_text='Tickets updated after this are rolled up next.')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """String representation of the RollupWatermark instance."""
+        return f"{self.name} @ message {self.message_id}"
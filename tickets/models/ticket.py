@@ -1,6 +1,10 @@
 from django.db import models
 from django.conf import settings
 
+# Columns kept current by queryset updates in tickets.signals; a full save of a
+# loaded ticket must not write its possibly stale copies back over them.
+SIGNAL_MAINTAINED_FIELDS = frozenset({'last_message', 'awaiting_staff_since'})
+
 
 class Ticket(models.Model):
     """Represents a support ticket in the system."""
@@ -27,6 +31,64 @@ class Ticket(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    last_message = models.ForeignKey(
+        'tickets.TicketMessage',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+',
+        help_text='Most recent message on this ticket, maintained by signals.'
+    )
+
+    awaiting_staff_since = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text='When the oldest message not yet answered by staff was posted; '
+                  'cleared by a staff reply or when the ticket is closed. Maintained by signals.'
+    )
+
+    class Meta:
+        """Meta options for the Ticket model."""
+        indexes = [
+            models.Index(
+                fields=['created_by', 'status', '-updated_at'],
+                name='ticket_owner_status_idx',
+            ),
+            # awaiting_staff_since is only ever set on open/pending tickets, so
+            # these partial indexes hold exactly the tickets waiting on staff.
+            # (SQLite cannot match a status IN (...) predicate against bound
+            # query parameters, but any range on the column implies NOT NULL.)
+            models.Index(
+                fields=['awaiting_staff_since'],
+                name='ticket_awaiting_idx',
+                condition=models.Q(awaiting_staff_since__isnull=False),
+            ),
+            models.Index(
+                fields=['created_by', 'awaiting_staff_since'],
+                name='ticket_owner_awaiting_idx',
+                condition=models.Q(awaiting_staff_since__isnull=False),
+            ),
+        ]
+
+    def save(self, **kwargs):
+        """Save the ticket, leaving the signal-maintained fields out of updates unless named."""
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = self.saved_field_names()
+        super().save(**kwargs)
+
+    def saved_field_names(self):
+        """Fields a full save of an existing ticket writes.
+
+        awaiting_staff_since is written when the ticket is closed or reopened,
+        as the awaiting_staff signal then sets it (see ticket_events for
+        ``_saved_status``).
+        """
+        resets_wait = self.Status.CLOSED in (self.status, getattr(self, '_saved_status', None))
+        skipped = SIGNAL_MAINTAINED_FIELDS - ({'awaiting_staff_since'} if resets_wait else set())
+        return [f.name for f in self._meta.concrete_fields if not f.primary_key and f.name not in skipped]
+
     def __str__(self):
         """Returns a string representation of the ticket."""
         return f"#{self.id} - {self.title}"
@@ -26,4 +26,4 @@ class TicketAssigned(models.Model):
 
     def __str__(self):
         """String representation of the TicketAssigned instance."""
-        return f"Assignment: Ticket #{self.ticket.id} -> {self.department.name}"
\ No newline at end of file
+        return f"Assignment: Ticket #{self.ticket_id} -> {self.department.name}"
\ No newline at end of file
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 
 from resolveme import settings
@@ -17,13 +18,28 @@ class TicketMessage(models.Model):
        related_name="ticket_messages",
        db_column="sender",)
    timestamp = models.DateTimeField(auto_now_add=True)
+   edited_at = models.DateTimeField(null=True, blank=True)
 
 
    class Meta:
        """Meta information for the TicketMessage model."""
        db_table = "ticket_messages"
        ordering = ["-timestamp"]
-  
+       indexes = [
+           models.Index(fields=["ticket", "-timestamp", "-id"], name="msg_ticket_ts_idx"),
+           models.Index(fields=["-timestamp"], name="msg_timestamp_idx"),
+       ]
+
+   def save(self, *args, **kwargs):
+       """Save atomically so the ticket's latest-message pointer commits with the message.
+
+       Saving an existing message stamps ``edited_at``, which cached views key on.
+       """
+       if not self._state.adding:
+           self.edited_at = timezone.now()
+       with transaction.atomic(using=kwargs.get("using")):
+           super().save(*args, **kwargs)
+
    def __str__(self):
        """String representation of the TicketMessage instance."""
-       return f"Message {self.id} for Ticket {self.ticket.id} by User {self.sender.id}"
\ No newline at end of file
+       return f"Message {self.id} for Ticket {self.ticket_id} by User {self.sender_id}"
\ No newline at end of file
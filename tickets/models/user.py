@@ -12,6 +12,13 @@ class User(AbstractUser):
 
     profile_picture = models.ImageField(upload_to='profile_pictures/', blank=True, null=True, help_text='User profile picture')
 
+    avatar_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text='SHA-256 of the profile picture, naming its resized avatar variants. Maintained by signals.'
+    )
+
     bio = models.CharField(max_length=500, blank=True)
 
     class Meta:
@@ -0,0 +1,76 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from fnmatch import fnmatchcase
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.urls import Resolver404, resolve
+
+_current = ContextVar("replica_reads", default=None)
+
+
+class ReplicaReads:
+    """Where one request's reads go: its replica until the request first writes, then the primary."""
+
+    def __init__(self, alias):
+        """Read from ``alias`` until a write is routed."""
+        self.alias = alias
+        self.wrote = False
+
+    @property
+    def read_alias(self):
+        """The replica, or the primary once this request has written."""
+        return DEFAULT_DB_ALIAS if self.wrote else self.alias
+
+
+@contextmanager
+def replica_reads(alias):
+    """Route reads inside the block to ``alias`` until the first write, which pins them to the primary."""
+    token = _current.set(ReplicaReads(alias))
+    try:
+        yield _current.get()
+    finally:
+        _current.reset(token)
+
+
+def replica_view(path):
+    """Whether ``path`` resolves to one of ``settings.REPLICA_READ_VIEWS``."""
+    try:
+        view_name = resolve(path).view_name
+    except Resolver404:
+        return False
+    return any(fnmatchcase(view_name, pattern) for pattern in settings.REPLICA_READ_VIEWS)
+
+
+def choose_replica(request, pinned):
+    """A random replica for a read-only view the client has not just written through, else the primary."""
+    eligible = settings.DATABASE_REPLICAS and request.method in ("GET", "HEAD") and not pinned
+    if not eligible or not replica_view(request.path_info):
+        return DEFAULT_DB_ALIAS
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+class ReplicaRouter:
+    """Send reads inside ``replica_reads`` to its replica, and writes and all other reads to the primary."""
+
+    def db_for_read(self, model, **hints):
+        """The current request's read alias, or the primary outside one."""
+        reads = _current.get()
+        return reads.read_alias if reads else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        """Always the primary; later reads in the same request follow the write there."""
+        reads = _current.get()
+        if reads:
+            reads.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Rows from the primary and its replicas are the same data, so they may be related."""
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        return {obj1._state.db, obj2._state.db} <= databases or None
+
+    def allow_migrate(self, db, app_label, **hints):
+        """Replicas receive the schema through replication, never from migrate."""
+        return False if db in settings.DATABASE_REPLICAS else None
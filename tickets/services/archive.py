@@ -0,0 +1,74 @@
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
+
+from .bulk import chunked
+from .dashboard_cache import bump_dashboard_version
+from .search import unindex_tickets
+from .thread import visible_tickets
+from ..models import (
+    ArchivedTicket, ArchivedTicketAssigned, ArchivedTicketMessage, Ticket, TicketAssigned, TicketMessage,
+)
+
+# (live model, archive model, lookup to a ticket id), in the order rows are copied.
+ARCHIVES = (
+    (Ticket, ArchivedTicket, "pk"),
+    (TicketMessage, ArchivedTicketMessage, "ticket_id"),
+    (TicketAssigned, ArchivedTicketAssigned, "ticket_id"),
+)
+
+
+def archivable(older_than):
+    """Closed tickets untouched for longer than ``older_than``; ``updated_at`` stands in for the closing time."""
+    cutoff = timezone.now() - older_than
+    return Ticket.objects.filter(status=Ticket.Status.CLOSED, updated_at__lt=cutoff)
+
+
+def shared_columns(model, archive):
+    """Attribute names ``archive`` shares with ``model``, so rows copy across with their ids."""
+    names = {field.attname for field in model._meta.concrete_fields}
+    return [field.attname for field in archive._meta.concrete_fields if field.attname in names]
+
+
+def copy_rows(rows, archive):
+    """Insert the live ``rows`` into ``archive``, returning how many were copied."""
+    columns = shared_columns(rows.model, archive)
+    return len(archive.objects.bulk_create(archive(**row) for row in rows.values(*columns)))
+
+
+def delete_rows(sources):
+    """Delete copied rows children first, without per-row signals for tickets that are leaving anyway."""
+    for rows, _ in reversed(sources):
+        rows._raw_delete(rows.db)
+
+
+def archive_chunk(ticket_ids, older_than):
+    """Move the still-archivable tickets among ``ticket_ids`` with their messages and assignments, atomically."""
+    with transaction.atomic():
+        ids = list(archivable(older_than).filter(pk__in=ticket_ids).values_list("pk", flat=True))
+        sources = [(model.objects.filter(**{f"{lookup}__in": ids}), archive) for model, archive, lookup in ARCHIVES]
+        moved = {archive._meta.db_table: copy_rows(rows, archive) for rows, archive in sources}
+        delete_rows(sources)
+        unindex_tickets(ids)
+    return moved
+
+
+def archive_tickets(older_than, chunk_size):
+    """Archive every archivable ticket, ``chunk_size`` tickets per transaction; returns rows moved per table."""
+    rows = list(archivable(older_than).order_by("pk").values_list("pk", "created_by_id"))
+    moved = Counter(dict.fromkeys((archive._meta.db_table for _, archive, _ in ARCHIVES), 0))
+    for chunk in chunked(rows, chunk_size):
+        moved.update(archive_chunk([pk for pk, _ in chunk], older_than))
+    for owner_id in {owner_id for _, owner_id in rows}:
+        bump_dashboard_version(owner_id)
+    return dict(moved)
+
+
+def read_through(user, pk):
+    """Ticket ``pk`` if ``user`` may open it, live or else archived; None if it is neither."""
+    found = (
+        visible_tickets(user, model).select_related("created_by").filter(pk=pk).first()
+        for model in (Ticket, ArchivedTicket)
+    )
+    return next(filter(None, found), None)
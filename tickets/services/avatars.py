@@ -0,0 +1,150 @@
+import hashlib
+import logging
+from io import BytesIO
+from itertools import product
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from PIL import Image, ImageOps
+
+from ..models import User
+
+logger = logging.getLogger("tickets.avatars")
+
+AVATAR_DIR = "avatars"
+
+# File extension and Pillow encoder for each avatar format.
+FORMATS = {
+    "webp": ("webp", "WEBP"),
+    "jpeg": ("jpg", "JPEG"),
+}
+CONTENT_TYPES = {"webp": "image/webp", "jpg": "image/jpeg"}
+
+
+def content_hash(data):
+    """SHA-256 hex digest of a picture's bytes; identical uploads share their variants."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def variant_name(digest, size, fmt):
+    """File name of one resized variant, e.g. ``<digest>-80.webp``."""
+    return f"{digest}-{size}.{FORMATS[fmt][0]}"
+
+
+def variant_path(name):
+    """Storage path of a variant, sharded by the first two hex digits of its hash."""
+    return f"{AVATAR_DIR}/{name[:2]}/{name}"
+
+
+def variants():
+    """Every (size, format) pair configured in ``AVATAR_SIZES`` and ``AVATAR_FORMATS``."""
+    return list(product(settings.AVATAR_SIZES, settings.AVATAR_FORMATS))
+
+
+def missing_variants(digest):
+    """Variants of ``digest`` not yet in storage."""
+    return [
+        (size, fmt) for size, fmt in variants()
+        if not default_storage.exists(variant_path(variant_name(digest, size, fmt)))
+    ]
+
+
+def load_image(data):
+    """Decode a picture, letting JPEG decode at reduced scale and honouring EXIF rotation."""
+    image = Image.open(BytesIO(data))
+    largest = max(settings.AVATAR_SIZES)
+    image.draft("RGB", (largest, largest))
+    return flatten(ImageOps.exif_transpose(image))
+
+
+def flatten(image):
+    """Composite any transparency onto white, since JPEG has no alpha channel."""
+    if image.mode not in ("RGBA", "LA", "P"):
+        return image.convert("RGB")
+    rgba = image.convert("RGBA")
+    return Image.alpha_composite(Image.new("RGBA", rgba.size, "white"), rgba).convert("RGB")
+
+
+def encode_variant(image, size, fmt):
+    """Centre-crop and resize ``image`` to a ``size`` square, encoded as ``fmt``."""
+    thumbnail = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+    buffer = BytesIO()
+    thumbnail.save(buffer, FORMATS[fmt][1], quality=settings.AVATAR_QUALITY)
+    return buffer.getvalue()
+
+
+def write_variants(image, digest, wanted):
+    """Encode and store each (size, format) variant in ``wanted``."""
+    for size, fmt in wanted:
+        content = ContentFile(encode_variant(image, size, fmt))
+        default_storage.save(variant_path(variant_name(digest, size, fmt)), content)
+
+
+def ensure_variants(data):
+    """Store any missing variants of a picture; return its digest and how many were encoded.
+
+    Pictures already seen (by content hash) are not decoded again.
+    """
+    digest = content_hash(data)
+    missing = missing_variants(digest)
+    if missing:
+        write_variants(load_image(data), digest, missing)
+    return digest, len(missing)
+
+
+def read_picture(picture):
+    """The bytes of an uploaded or stored picture, rewound so it can still be saved."""
+    picture.open("rb")
+    data = picture.read()
+    picture.seek(0)
+    return data
+
+
+def picture_variants(picture):
+    """Digest of ``picture`` and how many variants had to be encoded; blank and 0 if it is unusable."""
+    if not picture:
+        return "", 0
+    try:
+        return ensure_variants(read_picture(picture))
+    except (OSError, Image.DecompressionBombError) as error:
+        logger.warning("Could not make avatars from %s: %s", picture.name, error)
+        return "", 0
+
+
+def avatar_hash_for(picture):
+    """Digest naming ``picture``'s variants, generating them if needed; blank if there is no usable picture."""
+    return picture_variants(picture)[0]
+
+
+def users_with_pictures(everyone=False):
+    """Users with a stored picture, by id; only those without avatars unless ``everyone``."""
+    users = User.objects.exclude(profile_picture="").exclude(profile_picture__isnull=True)
+    users = users if everyone else users.filter(avatar_hash="")
+    return users.only("pk", "profile_picture", "avatar_hash").order_by("pk")
+
+
+def backfill_user(user):
+    """Point ``user.avatar_hash`` at variants of their stored picture; return how many were encoded."""
+    user.avatar_hash, encoded = picture_variants(user.profile_picture)
+    user.profile_picture.close()
+    return encoded
+
+
+def backfill_avatars(batch_size, everyone=False):
+    """Make avatars for stored pictures in keyset batches, yielding (users done, variants encoded) so far."""
+    users = users_with_pictures(everyone)
+    done = encoded = last_pk = 0
+    while batch := list(users.filter(pk__gt=last_pk)[:batch_size]):
+        encoded += sum(backfill_user(user) for user in batch)
+        User.objects.bulk_update(batch, ["avatar_hash"])
+        done, last_pk = done + len(batch), batch[-1].pk
+        yield done, encoded
+
+
+def avatar_url(user, size, fmt):
+    """URL of a user's ``size`` avatar in ``fmt``, or blank if they have none."""
+    if not user.avatar_hash:
+        return ""
+    return reverse("avatar", args=[variant_name(user.avatar_hash, size, fmt)])
@@ -0,0 +1,37 @@
+from contextlib import contextmanager
+from itertools import islice
+
+
+def chunked(iterable, size):
+    """Yield successive lists of at most ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def auto_timestamp_fields(*models):
+    """Return the auto_now/auto_now_add date fields declared on ``models``."""
+    return [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+
+
+def _set_auto_flags(states):
+    """Apply (field, auto_now, auto_now_add) triples to their fields."""
+    for field, auto_now, auto_now_add in states:
+        field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+@contextmanager
+def preserve_auto_timestamps(*models):
+    """Let saves and bulk inserts keep explicit values in auto_now/auto_now_add fields."""
+    fields = auto_timestamp_fields(*models)
+    original = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    _set_auto_flags((field, False, False) for field in fields)
+    try:
+        yield
+    finally:
+        _set_auto_flags(original)
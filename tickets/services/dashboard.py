@@ -0,0 +1,184 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.conf import settings
+from django.db.models import Case, CharField, Count, F, Min, Q, Value, When
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ..models import Ticket
+
+PAGE_SIZE = 20
+OPEN_STATUSES = [Ticket.Status.OPEN, Ticket.Status.PENDING]
+
+# Column each tab is ordered (and keyset-paginated) by, newest first.
+TAB_SORT_FIELDS = {
+    "active": "updated_at",
+    "overdue": "awaiting_staff_since",
+    "completed": "updated_at",
+}
+
+def annotated_tickets(user):
+    """Annotate a user's tickets with their latest message details."""
+    return (
+        Ticket.objects
+        .filter(created_by=user)
+        .select_related("created_by")
+        .annotate(
+            last_message_at=F("last_message__timestamp"),
+            last_message_body=F("last_message__body"),
+            last_message_edited_at=F("last_message__edited_at"),
+            last_message_sender_id=F("last_message__sender_id"),
+            last_sender_is_staff=F("last_message__sender__is_staff"),
+            last_sender_first=F("last_message__sender__first_name"),
+            last_sender_last=F("last_message__sender__last_name"),
+        )
+    )
+
+
+def overdue_cutoff():
+    """Tickets waiting on staff since before this moment are overdue."""
+    return timezone.now() - settings.TICKET_OVERDUE_AFTER
+
+
+def overdue_filter():
+    """Open or pending tickets that have been waiting on a staff reply since before the cutoff.
+
+    Waiting is measured from the oldest customer message staff have not answered,
+    not from the latest message: a customer who keeps following up does not
+    reset the clock.
+    """
+    return Q(status__in=OPEN_STATUSES, awaiting_staff_since__lt=overdue_cutoff())
+
+
+# Active and completed tabs use the (created_by, status, -updated_at) index; the
+# overdue tab is a range scan on the partial (created_by, awaiting_staff_since) index.
+def bucket_filters():
+    """Sargable filter implied by each bucket, so tab queries can use an index before the CASE."""
+    return {
+        "active": Q(status__in=OPEN_STATUSES),
+        "overdue": overdue_filter(),
+        "completed": Q(status=Ticket.Status.CLOSED),
+    }
+
+
+def bucket_case():
+    """Classify a ticket as completed, overdue or active in one CASE expression."""
+    return Case(
+        When(status=Ticket.Status.CLOSED, then=Value("completed")),
+        When(overdue_filter(), then=Value("overdue")),
+        When(status__in=OPEN_STATUSES, then=Value("active")),
+        default=None,
+        output_field=CharField(),
+    )
+
+
+def tab_querysets(user):
+    """Return the lazily evaluated, ordered queryset behind each dashboard tab."""
+    qs = annotated_tickets(user).alias(bucket=bucket_case())
+    filters = bucket_filters()
+    return {
+        tab: qs.filter(filters[tab], bucket=tab).order_by(f"-{field}", "-id")
+        for tab, field in TAB_SORT_FIELDS.items()
+    }
+
+
+def summary_rows(user):
+    """Grouped query giving each tab's ticket count and oldest unanswered message."""
+    return (
+        Ticket.objects.filter(created_by=user)
+        .annotate(bucket=bucket_case())
+        .values("bucket")
+        .annotate(
+            total=Count("pk"),
+            oldest_unanswered=Min("awaiting_staff_since"),
+        )
+        .order_by()
+    )
+
+
+def summarize_buckets(found):
+    """Turn grouped rows keyed by bucket into tab counts and the next overdue moment."""
+    counts = {tab: found.get(tab, {}).get("total", 0) for tab in TAB_SORT_FIELDS}
+    oldest = found.get("active", {}).get("oldest_unanswered")
+    return counts, oldest and oldest + settings.TICKET_OVERDUE_AFTER
+
+
+def tab_summary(user):
+    """Count every tab in one grouped query and find when the next active ticket turns overdue."""
+    return summarize_buckets({row["bucket"]: row for row in summary_rows(user)})
+
+
+async def atab_summary(user):
+    """Async ``tab_summary``: the same grouped query, read with the async ORM."""
+    return summarize_buckets({row["bucket"]: row async for row in summary_rows(user).aiterator()})
+
+
+def tab_counts(user):
+    """Count the tickets in every tab with a single grouped query."""
+    return tab_summary(user)[0]
+
+
+def dashboard_summary(user):
+    """Compute everything the dashboard renders up front: tab counts and the first active page."""
+    counts, next_overdue_at = tab_summary(user)
+    tickets, next_cursor = paginate(tab_querysets(user)["active"], "active")
+    return summary_context(counts, next_overdue_at, tickets, next_cursor)
+
+
+async def adashboard_summary(user):
+    """Async ``dashboard_summary``, built without blocking the event loop."""
+    counts, next_overdue_at = await atab_summary(user)
+    tickets, next_cursor = await apaginate(tab_querysets(user)["active"], "active")
+    return summary_context(counts, next_overdue_at, tickets, next_cursor)
+
+
+def summary_context(counts, next_overdue_at, tickets, next_cursor):
+    """The cached dashboard data shared by the sync and async builders."""
+    return {
+        "counts": counts,
+        "tickets": tickets,
+        "next_cursor": next_cursor,
+        "next_overdue_at": next_overdue_at,
+    }
+
+
+def encode_cursor(ticket, field):
+    """Encode a ticket's position in a tab as an opaque, URL-safe cursor."""
+    raw = f"{getattr(ticket, field).isoformat()}|{ticket.pk}"
+    return urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Decode a cursor into its (timestamp, id) pair, raising ValueError if malformed."""
+    value, _, pk = urlsafe_b64decode(cursor.encode()).decode().partition("|")
+    moment = parse_datetime(value)
+    if moment is None:
+        raise ValueError(f"Invalid cursor timestamp: {value!r}")
+    return moment, int(pk)
+
+
+def page_slice(qs, tab, cursor=None, size=None):
+    """The rows of one keyset page of a tab, plus one extra to tell whether another follows."""
+    field = TAB_SORT_FIELDS[tab]
+    if cursor:
+        value, pk = decode_cursor(cursor)
+        qs = qs.filter(Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk}))
+    return qs[:(size or PAGE_SIZE) + 1]
+
+
+def split_page(rows, tab, size=None):
+    """Trim the look-ahead row off a page and turn it into the next cursor."""
+    size = size or PAGE_SIZE
+    next_cursor = encode_cursor(rows[size - 1], TAB_SORT_FIELDS[tab]) if len(rows) > size else None
+    return rows[:size], next_cursor
+
+
+def paginate(qs, tab, cursor=None, size=None):
+    """Return one keyset page of a tab and the cursor for the page after it."""
+    return split_page(list(page_slice(qs, tab, cursor, size)), tab, size)
+
+
+async def apaginate(qs, tab, cursor=None, size=None):
+    """Async ``paginate``, streaming the page's rows with the async ORM."""
+    rows = [row async for row in page_slice(qs, tab, cursor, size).aiterator()]
+    return split_page(rows, tab, size)
@@ -0,0 +1,99 @@
+import math
+import time
+from contextlib import suppress
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+VERSION_KEY = "dashboard:version:{user_id}"
+DATA_KEY = "dashboard:data:{user_id}:{version}"
+STATS_KEY = "dashboard:stats:{outcome}"
+
+
+def dashboard_version(user_id):
+    """Return the user's current dashboard version, starting one if none is cached."""
+    return cache.get_or_set(VERSION_KEY.format(user_id=user_id), time.time_ns, None)
+
+
+async def adashboard_version(user_id):
+    """Async ``dashboard_version``."""
+    return await cache.aget_or_set(VERSION_KEY.format(user_id=user_id), time.time_ns, None)
+
+
+def bump_dashboard_version(user_id):
+    """Invalidate every cached dashboard for the user by moving to a new version."""
+    key = VERSION_KEY.format(user_id=user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def bump_dashboard_versions(user_ids):
+    """Bump the dashboard version of every user in ``user_ids``."""
+    for user_id in user_ids:
+        bump_dashboard_version(user_id)
+
+
+def bump_dashboard_versions_on_commit(user_ids, using=None):
+    """Bump each user's dashboard version once the current transaction commits.
+
+    Bumping before the commit would let a concurrent reader rebuild from the
+    old rows and cache them under the new version.
+    """
+    owners = set(user_ids)
+    transaction.on_commit(lambda: bump_dashboard_versions(owners), using=using)
+
+
+def record(outcome):
+    """Count a cache hit or miss; counters are best effort and skipped if the backend keeps nothing."""
+    key = STATS_KEY.format(outcome=outcome)
+    cache.add(key, 0, None)
+    with suppress(ValueError):
+        cache.incr(key)
+
+
+async def arecord(outcome):
+    """Async ``record``."""
+    key = STATS_KEY.format(outcome=outcome)
+    await cache.aadd(key, 0, None)
+    with suppress(ValueError):
+        await cache.aincr(key)
+
+
+def dashboard_cache_stats():
+    """Return the hit and miss counters recorded so far."""
+    return {outcome: cache.get(STATS_KEY.format(outcome=outcome), 0) for outcome in ("hits", "misses")}
+
+
+def cache_timeout(next_overdue_at):
+    """Keep an entry for the configured TTL, but never past the next ticket turning overdue."""
+    timeout = settings.DASHBOARD_CACHE_TIMEOUT
+    if next_overdue_at is None:
+        return timeout
+    remaining = (next_overdue_at - timezone.now()).total_seconds()
+    return max(1, min(timeout, math.ceil(remaining)))
+
+
+def cached_dashboard(user, build):
+    """Return the user's dashboard data from the cache, calling ``build`` on a miss."""
+    key = DATA_KEY.format(user_id=user.pk, version=dashboard_version(user.pk))
+    data = cache.get(key)
+    record("hits" if data is not None else "misses")
+    if data is None:
+        data = build(user)
+        cache.set(key, data, cache_timeout(data["next_overdue_at"]))
+    return data
+
+
+async def acached_dashboard(user, build):
+    """Async ``cached_dashboard``; ``build`` is a coroutine function run on a miss."""
+    key = DATA_KEY.format(user_id=user.pk, version=await adashboard_version(user.pk))
+    data = await cache.aget(key)
+    await arecord("hits" if data is not None else "misses")
+    if data is None:
+        data = await build(user)
+        await cache.aset(key, data, cache_timeout(data["next_overdue_at"]))
+    return data
@@ -0,0 +1,225 @@
+import asyncio
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from functools import cache
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from .dashboard import encode_cursor
+from ..models import Ticket, TicketAssigned
+
+
+def served_over_asgi(request):
+    """Whether ``request`` came through the ASGI handler, the only one that can hold a stream open cheaply."""
+    return isinstance(request, ASGIRequest)
+
+
+def user_channel(user_id):
+    """Channel carrying events about one user's tickets."""
+    return f"user:{user_id}"
+
+
+def department_channel(department_id):
+    """Channel carrying events about tickets assigned to one department."""
+    return f"department:{department_id}"
+
+
+class Broker(ABC):
+    """Fan-out backend interface: publish events to channels and subscribe to channels.
+
+    ``publish`` may be called from any thread; ``subscribe`` is called on the
+    event loop serving the connection and returns a ``Subscription``.
+    """
+
+    @abstractmethod
+    def publish(self, channels, event):
+        """Deliver ``event`` to every subscriber of any of ``channels``."""
+
+    @abstractmethod
+    def subscribe(self, channels):
+        """Start receiving events published to ``channels``."""
+
+    @abstractmethod
+    def unsubscribe(self, subscription):
+        """Stop delivering to ``subscription``."""
+
+
+class Subscription:
+    """A bounded per-connection queue of events, fed from any thread."""
+
+    def __init__(self, broker, channels, queue_size):
+        """Bind to the running event loop with an empty queue."""
+        self.broker = broker
+        self.channels = frozenset(channels)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(queue_size)
+        self.dropped = 0
+
+    def offer(self, event):
+        """Hand ``event`` to the subscriber's loop; safe to call from other threads."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            self.broker.unsubscribe(self)
+
+    def _put(self, event):
+        """Queue an event, dropping the oldest one if a slow client has fallen behind."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout):
+        """Wait up to ``timeout`` seconds for the next event, raising TimeoutError."""
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+    def close(self):
+        """Unsubscribe from the broker."""
+        self.broker.unsubscribe(self)
+
+
+class LocalBroker(Broker):
+    """In-process broker: fans events out to subscribers in this process only.
+
+    Suits a single ASGI process and tests; multi-process deployments need a
+    shared backend (e.g. Redis pub/sub) implementing ``Broker``.
+    """
+
+    def __init__(self, queue_size=None):
+        """Start with no subscribers."""
+        self.queue_size = queue_size or settings.TICKET_EVENTS_QUEUE_SIZE
+        self.lock = threading.Lock()
+        self.subscribers = defaultdict(set)
+
+    def publish(self, channels, event):
+        """Offer ``event`` once to each subscriber of any of ``channels``."""
+        with self.lock:
+            targets = {s for channel in channels for s in self.subscribers.get(channel, ())}
+        for subscription in targets:
+            subscription.offer(event)
+
+    def subscribe(self, channels):
+        """Register a new subscription on the running loop."""
+        subscription = Subscription(self, channels, self.queue_size)
+        with self.lock:
+            self._attach(subscription)
+        return subscription
+
+    def _attach(self, subscription):
+        """Add ``subscription`` under each of its channels; caller holds the lock."""
+        for channel in subscription.channels:
+            self.subscribers[channel].add(subscription)
+
+    def unsubscribe(self, subscription):
+        """Remove ``subscription`` from all of its channels."""
+        with self.lock:
+            self._detach(subscription)
+
+    def _detach(self, subscription):
+        """Drop ``subscription`` and any channels left empty; caller holds the lock."""
+        for channel in subscription.channels:
+            self.subscribers[channel].discard(subscription)
+        for channel in [c for c in subscription.channels if not self.subscribers[c]]:
+            del self.subscribers[channel]
+
+
+@cache
+def get_broker():
+    """The process-wide broker configured by ``settings.TICKET_EVENTS_BROKER``."""
+    return import_string(settings.TICKET_EVENTS_BROKER)()
+
+
+def ticket_audience(ticket_id, owner_id=None):
+    """Channels interested in a ticket: its owner and every department it is assigned to."""
+    if owner_id is None:
+        owner_id = Ticket.objects.filter(pk=ticket_id).values_list("created_by_id", flat=True).first()
+    departments = TicketAssigned.objects.filter(ticket_id=ticket_id).values_list("department_id", flat=True)
+    owners = [] if owner_id is None else [user_channel(owner_id)]
+    return owners + [department_channel(d) for d in departments]
+
+
+def publish_ticket_event(ticket_id, event, owner_id=None):
+    """Publish ``event`` to the ticket's audience once the current transaction commits."""
+    transaction.on_commit(lambda: get_broker().publish(ticket_audience(ticket_id, owner_id), event))
+
+
+def ticket_audiences(owners):
+    """Channels for many tickets at once; ``owners`` maps ticket id to owner id."""
+    audiences = {ticket_id: [user_channel(owner_id)] for ticket_id, owner_id in owners.items()}
+    assignments = TicketAssigned.objects.filter(ticket_id__in=owners).values_list("ticket_id", "department_id")
+    for ticket_id, department_id in assignments:
+        audiences[ticket_id].append(department_channel(department_id))
+    return audiences
+
+
+def publish_ticket_events(owners, events):
+    """Publish ``events[ticket_id]`` to each ticket's audience once the current transaction commits."""
+    transaction.on_commit(lambda: _publish_to_audiences(owners, events))
+
+
+def _publish_to_audiences(owners, events):
+    """Look up every ticket's audience in one query and publish its event."""
+    broker = get_broker()
+    for ticket_id, channels in ticket_audiences(owners).items():
+        broker.publish(channels, events[ticket_id])
+
+
+def message_event(message):
+    """Event payload for a newly posted message."""
+    return {
+        "type": "message",
+        "ticket": message.ticket_id,
+        "message": message.pk,
+        "sender": message.sender_id,
+        "body": message.body,
+        "timestamp": message.timestamp,
+        "cursor": encode_cursor(message, "timestamp"),
+    }
+
+
+def status_event(ticket, previous):
+    """Event payload for a ticket status change."""
+    return {"type": "status", "ticket": ticket.pk, "status": ticket.status, "previous": previous}
+
+
+def format_event(event):
+    """Serialise an event as one Server-Sent Events frame."""
+    return f"event: {event['type']}\ndata: {json.dumps(event, cls=DjangoJSONEncoder)}\n\n"
+
+
+async def next_frame(subscription, keepalive):
+    """The next event frame, or a comment frame after ``keepalive`` idle seconds."""
+    try:
+        event = await subscription.get(keepalive)
+    except TimeoutError:
+        return ": keepalive\n\n"
+    return format_event(event)
+
+
+class EventStream:
+    """Server-Sent Events frames for one subscription, for a ``StreamingHttpResponse``.
+
+    Django calls ``close`` when the response finishes or the client disconnects,
+    which ends the subscription.
+    """
+
+    def __init__(self, subscription, keepalive=None):
+        """Wrap ``subscription``, sending a keepalive comment after ``keepalive`` idle seconds."""
+        self.subscription = subscription
+        self.keepalive = keepalive or settings.TICKET_EVENTS_KEEPALIVE
+
+    async def __aiter__(self):
+        """Yield the reconnect hint, then one frame per event or keepalive, forever."""
+        yield f"retry: {settings.TICKET_EVENTS_RETRY_MS}\n: connected\n\n"
+        while True:
+            yield await next_frame(self.subscription, self.keepalive)
+
+    def close(self):
+        """Stop receiving events."""
+        self.subscription.close()
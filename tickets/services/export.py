@@ -0,0 +1,76 @@
+import csv
+import io
+import json
+import zlib
+from itertools import chain
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from ..models import (
+    ArchivedTicket, ArchivedTicketAssigned, ArchivedTicketMessage, Ticket, TicketAssigned, TicketMessage,
+)
+
+# Each exportable dataset: its live and archive tables, read in that order, and the
+# columns written for them, primary key first. Archived rows keep their live ids.
+DATASETS = {
+    "tickets": ((Ticket, ArchivedTicket), ("id", "title", "status", "created_by_id", "created_at", "updated_at")),
+    "messages": ((TicketMessage, ArchivedTicketMessage), ("id", "ticket_id", "sender_id", "timestamp", "body")),
+    "assignments": ((TicketAssigned, ArchivedTicketAssigned), ("id", "ticket_id", "department_id")),
+}
+# Response content types of the export formats.
+CONTENT_TYPES = {"csv": "text/csv; charset=utf-8", "jsonl": "application/jsonl; charset=utf-8"}
+
+
+def keyset_batches(model, columns, batch_size):
+    """Yield lists of at most ``batch_size`` rows in primary key order, one short query per batch.
+
+    Unlike one long cursor this holds no read transaction open between batches,
+    and memory stays bounded by the batch however large the table is.
+    """
+    rows = model.objects.order_by("pk").values_list(*columns)
+    batch = list(rows[:batch_size])
+    while batch:
+        yield batch
+        batch = list(rows.filter(pk__gt=batch[-1][0])[:batch_size])
+
+
+def csv_text(rows):
+    """Rows as CSV text."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def jsonl_text(columns, rows):
+    """Rows as JSON Lines objects keyed by column."""
+    return "".join(json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder) + "\n" for row in rows)
+
+
+def export_chunks(dataset, fmt, batch_size):
+    """Yield a dataset as encoded CSV (with a header row) or JSON Lines, one chunk per batch.
+
+    Live rows come first, then the rows ``archive_tickets`` has moved out of them.
+    """
+    models, columns = DATASETS[dataset]
+    if fmt == "csv":
+        yield csv_text([columns]).encode()
+    for batch in chain.from_iterable(keyset_batches(model, columns, batch_size) for model in models):
+        yield (csv_text(batch) if fmt == "csv" else jsonl_text(columns, batch)).encode()
+
+
+def gzipped(chunks):
+    """Compress a stream of byte chunks into one gzip stream as they arrive."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    yield from filter(None, map(compressor.compress, chunks))
+    yield compressor.flush()
+
+
+def export_stream(dataset, fmt, batch_size, compress=False):
+    """The export as a stream of byte chunks, gzipped on the fly if ``compress``."""
+    chunks = export_chunks(dataset, fmt, batch_size)
+    return gzipped(chunks) if compress else chunks
+
+
+def export_filename(dataset, fmt, compress=False):
+    """The download name of an export, e.g. ``messages.jsonl.gz``."""
+    return f"{dataset}.{fmt}" + (".gz" if compress else "")
@@ -0,0 +1,143 @@
+import json
+import os
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .bulk import chunked
+from .dashboard_cache import bump_dashboard_version
+from .search import index_tickets
+from ..models import Department, ImportCheckpoint, Ticket, TicketAssigned, TicketMessage, User
+from ..signals.awaiting_staff import awaiting_since
+from ..signals.latest_message import latest_message_id
+
+
+class Lookups:
+    """Users by username and departments by name, loaded once so records resolve without queries."""
+
+    def __init__(self):
+        """Load both maps; a department name used twice resolves to the oldest department."""
+        self.users = dict(User.objects.values_list("username", "pk"))
+        self.departments = dict(Department.objects.order_by("-pk").values_list("name", "pk"))
+
+    def user(self, username):
+        """The id of the user called ``username``."""
+        if username not in self.users:
+            raise ValueError(f"unknown user {username!r}")
+        return self.users[username]
+
+    def department(self, name):
+        """The id of the department called ``name``."""
+        if name not in self.departments:
+            raise ValueError(f"unknown department {name!r}")
+        return self.departments[name]
+
+
+def moment(value):
+    """An aware datetime from an ISO 8601 string; naive times are taken as the current time zone's."""
+    parsed = parse_datetime(value) if isinstance(value, str) else None
+    if parsed is None:
+        raise ValueError(f"invalid timestamp {value!r}")
+    return parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed)
+
+
+def build_ticket(record, lookups):
+    """An unsaved ticket, its messages and its assignments from one JSON Lines record."""
+    status = record.get("status", Ticket.Status.OPEN)
+    if status not in Ticket.Status.values:
+        raise ValueError(f"invalid status {status!r}")
+    created_at = moment(record["created_at"])
+    ticket = Ticket(
+        title=record["title"], status=status,
+        created_by_id=lookups.user(record["created_by"]),
+        created_at=created_at, updated_at=moment(record["updated_at"]) if "updated_at" in record else created_at,
+    )
+    departments = dict.fromkeys(map(lookups.department, record.get("departments", [])))
+    assignments = [TicketAssigned(ticket=ticket, department_id=pk) for pk in departments]
+    return ticket, build_messages(ticket, record.get("messages", []), lookups), assignments
+
+
+def build_messages(ticket, messages, lookups):
+    """Unsaved messages of ``ticket`` from a record's message list."""
+    return [
+        TicketMessage(ticket=ticket, sender_id=lookups.user(m["sender"]), body=m["body"], timestamp=moment(m["timestamp"]))
+        for m in messages
+    ]
+
+
+def parse_line(number, raw, lookups):
+    """Build the rows of line ``number``, naming the line in any error."""
+    try:
+        return build_ticket(json.loads(raw), lookups)
+    except KeyError as error:
+        raise ValueError(f"line {number}: missing field {error}") from error
+    except (ValueError, TypeError, AttributeError) as error:
+        raise ValueError(f"line {number}: {error}") from error
+
+
+def numbered_lines(handle, line):
+    """Yield (line number, offset after the line, raw line) from the handle's current position."""
+    offset = handle.tell()
+    for raw in handle:
+        line, offset = line + 1, offset + len(raw)
+        yield line, offset, raw
+
+
+def finish_tickets(tickets):
+    """Fill in what the skipped save signals would have: latest message, who is waiting and search rows."""
+    batch = Ticket.objects.filter(pk__in=[ticket.pk for ticket in tickets])
+    batch.update(last_message=latest_message_id())
+    batch.exclude(status=Ticket.Status.CLOSED).update(awaiting_staff_since=awaiting_since())
+    index_tickets([ticket.pk for ticket in tickets])
+
+
+def refresh_dashboards(tickets):
+    """Invalidate the cached dashboards of the imported tickets' owners."""
+    for owner_id in {ticket.created_by_id for ticket in tickets}:
+        bump_dashboard_version(owner_id)
+
+
+def import_batch(lines, checkpoint, lookups):
+    """Insert one batch of parsed lines and advance the checkpoint in the same transaction."""
+    rows = [parse_line(number, raw, lookups) for number, _, raw in lines if raw.strip()]
+    tickets = [ticket for ticket, _, _ in rows]
+    messages = [message for _, ticket_messages, _ in rows for message in ticket_messages]
+    assignments = [assignment for _, _, ticket_assignments in rows for assignment in ticket_assignments]
+    with transaction.atomic():
+        Ticket.objects.bulk_create(tickets)
+        TicketMessage.objects.bulk_create(messages)
+        TicketAssigned.objects.bulk_create(assignments)
+        finish_tickets(tickets)
+        checkpoint.lines, checkpoint.offset = lines[-1][:2]
+        checkpoint.save(update_fields=["lines", "offset", "updated_at"])
+    refresh_dashboards(tickets)
+    return Counter(tickets=len(tickets), messages=len(messages), assignments=len(assignments))
+
+
+def checkpoint_for(path, restart=False):
+    """The checkpoint of ``path``, reset to the start of the file if ``restart``."""
+    checkpoint, _ = ImportCheckpoint.objects.get_or_create(source=os.path.abspath(path))
+    if restart:
+        checkpoint.lines = checkpoint.offset = 0
+    return checkpoint
+
+
+def import_lines(lines, batch_size, checkpoint):
+    """Import numbered lines in batches of ``batch_size``, yielding running totals after each."""
+    lookups, totals = Lookups(), Counter(tickets=0, messages=0, assignments=0)
+    for batch in chunked(lines, batch_size):
+        totals.update(import_batch(batch, checkpoint, lookups))
+        yield {"lines": checkpoint.lines, **totals}
+
+
+def import_tickets(path, batch_size, checkpoint):
+    """Import the JSON Lines file ``path`` from ``checkpoint``, yielding running totals per batch.
+
+    Callers should wrap the import in ``preserve_auto_timestamps(Ticket, TicketMessage)``
+    so the records' own ``created_at``/``updated_at``/``timestamp`` are kept.
+    """
+    with open(path, "rb") as handle:
+        handle.seek(checkpoint.offset)
+        yield from import_lines(numbered_lines(handle, checkpoint.lines), batch_size, checkpoint)
@@ -0,0 +1,22 @@
+from .dashboard import OPEN_STATUSES, overdue_cutoff
+from .dashboard_cache import bump_dashboard_version
+from ..models import Ticket
+
+
+def newly_overdue(window):
+    """Tickets, across all users, that crossed the overdue cutoff within the last ``window``."""
+    cutoff = overdue_cutoff()
+    return Ticket.objects.filter(
+        status__in=OPEN_STATUSES,
+        awaiting_staff_since__lt=cutoff,
+        awaiting_staff_since__gte=cutoff - window,
+    ).order_by("awaiting_staff_since")
+
+
+def sweep_overdue(window):
+    """Find newly overdue tickets in one range scan and refresh their owners' dashboards."""
+    rows = list(newly_overdue(window).values_list("pk", "created_by_id"))
+    owners = {owner_id for _, owner_id in rows}
+    for owner_id in owners:
+        bump_dashboard_version(owner_id)
+    return [pk for pk, _ in rows], owners
@@ -0,0 +1,199 @@
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, Exists, F, Max, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .bulk import chunked
+from ..models import (
+    ArchivedTicket, ArchivedTicketAssigned, ArchivedTicketMessage, DepartmentDailyMetrics, RollupClosure,
+    RollupWatermark, Ticket, TicketAssigned, TicketMessage,
+)
+
+# Name of the department/day rollup's watermark row.
+WATERMARK = "department_daily"
+# Rollup metric columns and their value on a day without activity.
+METRICS = {
+    "opened": 0,
+    "closed": 0,
+    "close_time": timedelta(0),
+    "first_replies": 0,
+    "first_reply_time": timedelta(0),
+}
+# Assignment and message models of the live and archived tickets; a day's rollup counts both.
+SOURCES = {
+    Ticket: (TicketAssigned, TicketMessage),
+    ArchivedTicket: (ArchivedTicketAssigned, ArchivedTicketMessage),
+}
+
+
+def day_start(day):
+    """The aware start of ``day`` in the current time zone."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def on_days(field, days):
+    """A filter on ``field`` falling on one of ``days``, bounded by their range so indexes apply."""
+    return Q(**{
+        f"{field}__gte": day_start(min(days)),
+        f"{field}__lt": day_start(max(days) + timedelta(days=1)),
+        f"{field}__date__in": days,
+    })
+
+
+def staff_messages(model):
+    """Messages of ``model`` sent by staff."""
+    return model.objects.filter(sender__is_staff=True)
+
+
+def first_replies(model):
+    """Staff messages of ``model`` that are the first staff reply on their ticket."""
+    earlier = staff_messages(model).filter(ticket=OuterRef("ticket")).filter(
+        Q(timestamp__lt=OuterRef("timestamp")) | Q(timestamp=OuterRef("timestamp"), pk__lt=OuterRef("pk"))
+    )
+    return staff_messages(model).filter(~Exists(earlier))
+
+
+def metric_rows(assigned, messages, days):
+    """Querysets of per department and day metric values of ``days``, one per kind of event."""
+    closed = assigned.objects.filter(on_days("ticket__updated_at", days), ticket__status=Ticket.Status.CLOSED)
+    replies = first_replies(messages).filter(on_days("timestamp", days), ticket__assignments__isnull=False)
+    return [
+        assigned.objects.filter(on_days("ticket__created_at", days))
+        .values("department", day=TruncDate("ticket__created_at")).annotate(opened=Count("pk")),
+        closed.values("department", day=TruncDate("ticket__updated_at")).annotate(
+            closed=Count("pk"), close_time=Sum(F("ticket__updated_at") - F("ticket__created_at")),
+        ),
+        replies.values(department=F("ticket__assignments__department"), day=TruncDate("timestamp")).annotate(
+            first_replies=Count("pk"), first_reply_time=Sum(F("timestamp") - F("ticket__created_at")),
+        ),
+    ]
+
+
+def rollup_rows(days):
+    """Unsaved rollup rows of ``days``, one per department with activity on a day, live and archived."""
+    totals = {}
+    rows = [row for assigned, messages in SOURCES.values() for qs in metric_rows(assigned, messages, days) for row in qs]
+    for row in rows:
+        metrics = totals.setdefault((row.pop("department"), row.pop("day")), dict(METRICS))
+        metrics.update({name: metrics[name] + value for name, value in row.items()})
+    return [DepartmentDailyMetrics(department_id=pk, day=day, **metrics) for (pk, day), metrics in totals.items()]
+
+
+def closures(days):
+    """Unsaved ledger rows of the live and archived tickets counted as closed on ``days``."""
+    closed = [model.objects.filter(on_days("updated_at", days), status=Ticket.Status.CLOSED) for model in SOURCES]
+    return [
+        RollupClosure(ticket_id=pk, day=timezone.localdate(updated_at))
+        for tickets in closed for pk, updated_at in tickets.values_list("pk", "updated_at")
+    ]
+
+
+def rollup_days(days):
+    """Replace the rollup rows and closure ledger of ``days`` in one transaction, returning rows written."""
+    with transaction.atomic():
+        rows = rollup_rows(days)
+        DepartmentDailyMetrics.objects.filter(day__in=days).delete()
+        RollupClosure.objects.filter(day__in=days).delete()
+        RollupClosure.objects.bulk_create(closures(days))
+        return len(DepartmentDailyMetrics.objects.bulk_create(rows))
+
+
+def ticket_days(tickets):
+    """Days the given tickets count towards: created, first answered by staff and closed.
+
+    Includes the day each was last counted closed on, which a reopen or a later
+    close leaves behind, so that day is recomputed without it.
+    """
+    messages = SOURCES[tickets.model][1]
+    first = staff_messages(messages).filter(ticket=OuterRef("pk")).order_by("timestamp").values("timestamp")[:1]
+    rows = tickets.annotate(first_reply=Subquery(first)).values_list("created_at", "first_reply", "status", "updated_at")
+    counted = RollupClosure.objects.filter(ticket_id__in=tickets.values("pk")).values_list("day", flat=True)
+    return set(counted) | {
+        timezone.localdate(moment)
+        for created_at, first_reply, status, updated_at in rows
+        for moment in (created_at, first_reply, updated_at if status == Ticket.Status.CLOSED else None)
+        if moment
+    }
+
+
+def updated_tickets(since):
+    """Tickets updated after ``since``; before the first run, every live and archived ticket."""
+    if since is None:
+        return [Ticket.objects.all(), ArchivedTicket.objects.all()]
+    return [Ticket.objects.filter(updated_at__gt=since)]
+
+
+def current_marks():
+    """The watermark values covering everything in the live tables now."""
+    return {
+        "message_id": TicketMessage.objects.aggregate(pk=Max("pk"))["pk"] or 0,
+        "assignment_id": TicketAssigned.objects.aggregate(pk=Max("pk"))["pk"] or 0,
+        "tickets_updated": timezone.now(),
+    }
+
+
+def changed_days(watermark, marks):
+    """Days touched by staff messages, assignments and ticket updates between ``watermark`` and ``marks``."""
+    messages = staff_messages(TicketMessage).filter(pk__gt=watermark.message_id, pk__lte=marks["message_id"])
+    days = set(messages.annotate(day=TruncDate("timestamp")).values_list("day", flat=True).distinct())
+    assigned = Ticket.objects.filter(
+        assignments__pk__gt=watermark.assignment_id, assignments__pk__lte=marks["assignment_id"],
+    )
+    return days.union(*map(ticket_days, [assigned, *updated_tickets(watermark.tickets_updated)]))
+
+
+def clear_rollups():
+    """Delete every rollup row and the closure ledger ahead of a full rebuild."""
+    DepartmentDailyMetrics.objects.all().delete()
+    RollupClosure.objects.all().delete()
+
+
+def starting_watermark(full):
+    """The saved watermark, or an empty one after clearing every rollup row when ``full``."""
+    if full:
+        clear_rollups()
+        return RollupWatermark(name=WATERMARK)
+    return RollupWatermark.objects.filter(name=WATERMARK).first() or RollupWatermark(name=WATERMARK)
+
+
+def rollup_metrics(chunk_days, full=False):
+    """Recompute the rollup rows of every day changed since the watermark, then advance it.
+
+    Days are recomputed whole rather than incremented, so rerunning after a failure
+    gives the same rows. ``full`` deletes every rollup row and rebuilds from
+    scratch; the report is incomplete until it finishes.
+    Returns the number of days recomputed and rollup rows written.
+    """
+    watermark = starting_watermark(full)
+    marks = current_marks()
+    days = sorted(changed_days(watermark, marks))
+    rows = sum(rollup_days(chunk) for chunk in chunked(days, chunk_days))
+    RollupWatermark.objects.update_or_create(name=WATERMARK, defaults=marks)
+    return {"days": len(days), "rows": rows}
+
+
+def hours(total, count):
+    """The average of a total duration over ``count`` events in hours, or None without events."""
+    return round(total / count / timedelta(hours=1), 1) if count else None
+
+
+def report_row(row):
+    """One department's report line from its summed rollup rows."""
+    metrics = {name: row[f"total_{name}"] for name in METRICS}
+    return {
+        "department": row["department__name"], "backlog": row["backlog"], **metrics,
+        "first_reply_hours": hours(metrics["first_reply_time"], metrics["first_replies"]),
+        "close_hours": hours(metrics["close_time"], metrics["closed"]),
+    }
+
+
+def department_report(since):
+    """Per-department rollup totals from ``since`` on, their average times and the open backlog to date."""
+    recent = Q(day__gte=since)
+    rows = DepartmentDailyMetrics.objects.values("department_id", "department__name").annotate(
+        **{f"total_{name}": Sum(name, filter=recent, default=empty) for name, empty in METRICS.items()},
+        backlog=Sum("opened") - Sum("closed"),
+    ).order_by("department__name")
+    return [report_row(row) for row in rows]
@@ -0,0 +1,179 @@
+import re
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.conf import settings
+from django.db import connections, router
+from django.db.models import Exists, FloatField, OuterRef, Q, Value
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from .bulk import chunked
+from ..models import Ticket, TicketMessage
+
+PAGE_SIZE = 20
+SEARCH_TABLE = "ticket_search"
+# bm25 column weights: a hit in the title counts ten times one in a message body.
+TITLE_WEIGHT, BODY_WEIGHT = 10.0, 1.0
+SNIPPET_TOKENS = 12
+MARK_START, MARK_END = "\x02", "\x03"
+TERM = re.compile(r"\w+")
+
+TICKETS = Ticket._meta.db_table
+MESSAGES = TicketMessage._meta.db_table
+
+# One row per ticket: its title, and its newest SEARCH_INDEX_MESSAGES message bodies
+# joined together, read newest first off the (ticket, -timestamp, -id) index.
+INDEX_SQL = f"""
+    INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, title, body)
+    SELECT t.id, t.title, (
+        SELECT group_concat(body, ' ') FROM (
+            SELECT m.body FROM {MESSAGES} m WHERE m.ticket_id = t.id ORDER BY m.timestamp DESC, m.id DESC LIMIT %s
+        )
+    )
+    FROM {TICKETS} t WHERE t.id IN ({{placeholders}})
+"""
+
+SEARCH_SQL = f"""
+    SELECT t.*, s.score FROM (
+        SELECT rowid, bm25({SEARCH_TABLE}, {TITLE_WEIGHT}, {BODY_WEIGHT}) AS score
+        FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s
+    ) s JOIN {TICKETS} t ON t.id = s.rowid
+    WHERE {{where}}
+    ORDER BY s.score, t.id DESC
+    LIMIT %s
+"""
+
+SNIPPET_SQL = f"""
+    SELECT rowid, snippet({SEARCH_TABLE}, -1, char(2), char(3), '…', {SNIPPET_TOKENS})
+    FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s AND rowid IN ({{placeholders}})
+"""
+
+
+def fts_enabled(using="default"):
+    """Whether ``using`` is SQLite, where the FTS5 search table exists."""
+    return connections[using].vendor == "sqlite"
+
+
+def _execute(using, sql, params=()):
+    """Run one statement on ``using`` and return its rows."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def index_tickets(ticket_ids, using="default"):
+    """(Re)index the given tickets' titles and message bodies in one statement.
+
+    Each ticket's row is rewritten whole, so the cost grows with the messages
+    indexed per ticket; SEARCH_INDEX_MESSAGES caps it for long threads.
+    """
+    if ticket_ids and fts_enabled(using):
+        sql = INDEX_SQL.format(placeholders=", ".join(["%s"] * len(ticket_ids)))
+        _execute(using, sql, [settings.SEARCH_INDEX_MESSAGES, *ticket_ids])
+
+
+def unindex_ticket(ticket_id, using="default"):
+    """Drop a deleted ticket from the search index."""
+    unindex_tickets([ticket_id], using)
+
+
+def unindex_tickets(ticket_ids, using="default"):
+    """Drop deleted or archived tickets from the search index in one statement."""
+    if ticket_ids and fts_enabled(using):
+        placeholders = ", ".join(["%s"] * len(ticket_ids))
+        _execute(using, f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({placeholders})", ticket_ids)
+
+
+def prune_index(using="default"):
+    """Drop index rows whose ticket no longer exists, e.g. after bulk deletes."""
+    if fts_enabled(using):
+        _execute(using, f"DELETE FROM {SEARCH_TABLE} WHERE rowid NOT IN (SELECT id FROM {TICKETS})")
+
+
+def rebuild_index(batch_size, using="default"):
+    """Re-index every ticket in batches, yielding the running total, then prune and optimize."""
+    ids = Ticket.objects.using(using).order_by("pk").values_list("pk", flat=True)
+    done = 0
+    for batch in chunked(ids.iterator(chunk_size=batch_size), batch_size):
+        index_tickets(batch, using)
+        done += len(batch)
+        yield done
+    prune_index(using)
+    _execute(using, f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')")
+
+
+def match_expression(terms):
+    """Quote each term for FTS5, treating the last one as a prefix for search-as-you-type."""
+    return " ".join(f'"{term}"' for term in terms) + "*"
+
+
+def encode_search_cursor(ticket):
+    """Encode a result's (score, id) position as an opaque, URL-safe cursor."""
+    return urlsafe_b64encode(f"{ticket.score!r}|{ticket.pk}".encode()).decode()
+
+
+def decode_search_cursor(cursor):
+    """Decode a search cursor into its (score, id) pair, raising ValueError if malformed."""
+    score, _, pk = urlsafe_b64decode(cursor.encode()).decode().partition("|")
+    return float(score), int(pk)
+
+
+def highlight(snippet):
+    """Escape a snippet and turn its match markers into ``<mark>`` tags."""
+    return mark_safe(escape(snippet).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>"))
+
+
+def _fts_where(user, after):
+    """SQL conditions and params limiting FTS results to the user's tickets and the next page."""
+    clauses, params = ["1 = 1"], []
+    if not user.is_staff:
+        clauses, params = ["t.created_by_id = %s"], [user.pk]
+    if after:
+        clauses.append("(s.score > %s OR (s.score = %s AND t.id < %s))")
+        params += [after[0], after[0], after[1]]
+    return " AND ".join(clauses), params
+
+
+def _attach_snippets(rows, match, using):
+    """Set a highlighted ``snippet`` on each result, fetched for the page in one query on ``using``."""
+    ids = [row.pk for row in rows]
+    placeholders = ", ".join(["%s"] * len(ids))
+    snippets = dict(_execute(using, SNIPPET_SQL.format(placeholders=placeholders), [match, *ids])) if ids else {}
+    for row in rows:
+        row.snippet = highlight(snippets.get(row.pk, ""))
+    return rows
+
+
+def _fts_search(user, terms, after, limit, using):
+    """Rank matches with bm25 over the FTS5 index of ``using``."""
+    match = match_expression(terms)
+    where, params = _fts_where(user, after)
+    rows = list(Ticket.objects.db_manager(using).raw(SEARCH_SQL.format(where=where), [match, *params, limit]))
+    return _attach_snippets(rows, match, using)
+
+
+def _fallback_search(user, terms, after, limit, using):
+    """Unranked ``icontains`` search for backends without FTS5, newest tickets first."""
+    tickets = Ticket.objects.using(using)
+    qs = tickets.all() if user.is_staff else tickets.filter(created_by=user)
+    qs = qs.annotate(score=Value(0.0, output_field=FloatField())).order_by("score", "-pk")
+    for term in terms:
+        in_body = TicketMessage.objects.filter(ticket=OuterRef("pk"), body__icontains=term)
+        qs = qs.filter(Q(title__icontains=term) | Exists(in_body))
+    if after:
+        qs = qs.filter(Q(score__gt=after[0]) | Q(score=after[0], pk__lt=after[1]))
+    return list(qs[:limit])
+
+
+def search(user, query, cursor=None, size=None):
+    """Return one ranked keyset page of the tickets ``user`` may see that match ``query``."""
+    size = size or PAGE_SIZE
+    terms = TERM.findall(query)
+    if not terms:
+        return [], None
+    after = decode_search_cursor(cursor) if cursor else None
+    using = router.db_for_read(Ticket)
+    backend = _fts_search if fts_enabled(using) else _fallback_search
+    rows = backend(user, terms, after, size + 1, using)
+    next_cursor = encode_search_cursor(rows[size - 1]) if len(rows) > size else None
+    return rows[:size], next_cursor
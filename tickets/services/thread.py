@@ -0,0 +1,55 @@
+from django.db.models import Q
+
+from .dashboard import decode_cursor, encode_cursor
+from ..models import ArchivedTicket, ArchivedTicketMessage, Ticket, TicketMessage
+
+PAGE_SIZE = 50
+STREAM_BATCH_SIZE = 500
+
+# Keyset ordering and comparison for each paging direction over (timestamp, id).
+DIRECTIONS = {
+    "before": (("-timestamp", "-id"), "lt"),
+    "after": (("timestamp", "id"), "gt"),
+}
+
+# The message model of each ticket model, so archived threads page like live ones.
+THREAD_MESSAGES = {Ticket: TicketMessage, ArchivedTicket: ArchivedTicketMessage}
+
+
+def visible_tickets(user, model=Ticket):
+    """Tickets ``user`` may open: their own, or every ticket for staff; ``model`` picks live or archived."""
+    return model.objects.all() if user.is_staff else model.objects.filter(created_by=user)
+
+
+def thread_messages(ticket):
+    """A ticket's messages with their senders joined in."""
+    return THREAD_MESSAGES[type(ticket)].objects.filter(ticket=ticket).select_related("sender")
+
+
+def page_queryset(ticket, direction, cursor=None):
+    """Messages past ``cursor`` in ``direction``, in the order the thread index stores them."""
+    ordering, op = DIRECTIONS[direction]
+    qs = thread_messages(ticket).order_by(*ordering)
+    if cursor:
+        moment, pk = decode_cursor(cursor)
+        qs = qs.filter(Q(**{f"timestamp__{op}": moment}) | Q(timestamp=moment, **{f"pk__{op}": pk}))
+    return qs
+
+
+def thread_page(ticket, direction="before", cursor=None, size=None):
+    """One keyset page of a thread in reading order, and the cursor to keep going in ``direction``."""
+    size = size or PAGE_SIZE
+    rows = list(page_queryset(ticket, direction, cursor)[:size + 1])
+    next_cursor = encode_cursor(rows[size - 1], "timestamp") if len(rows) > size else None
+    rows = rows[:size]
+    return (rows[::-1] if direction == "before" else rows), next_cursor
+
+
+def iter_thread(ticket, batch_size=None):
+    """Yield a whole thread, oldest first, in keyset batches so memory stays flat."""
+    size = batch_size or STREAM_BATCH_SIZE
+    batch, cursor = thread_page(ticket, "after", size=size)
+    yield batch
+    while cursor:
+        batch, cursor = thread_page(ticket, "after", cursor, size)
+        yield batch
@@ -0,0 +1,48 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .dashboard_cache import bump_dashboard_versions_on_commit
+from .events import publish_ticket_events, status_event
+from ..models import Ticket, TicketAssigned
+
+# Per-object saves would run every Ticket signal receiver once per row. These
+# bulk versions write with single statements and redo the receivers' side
+# effects (dashboard versions, awaiting_staff_since, live events) in bulk.
+
+
+def owners_of(tickets):
+    """Map each ticket id in ``tickets`` to its owner's id."""
+    return dict(tickets.values_list("pk", "created_by_id"))
+
+
+def bump_owners(owners):
+    """Invalidate the cached dashboard of every owner in ``owners`` once the transaction commits."""
+    bump_dashboard_versions_on_commit(owners.values())
+
+
+@transaction.atomic
+def close_tickets(tickets):
+    """Close every ticket in ``tickets`` that is not already closed with one UPDATE; return how many."""
+    pending = tickets.exclude(status=Ticket.Status.CLOSED)
+    rows = list(pending.values_list("pk", "created_by_id", "status"))
+    closed = pending.update(status=Ticket.Status.CLOSED, awaiting_staff_since=None, updated_at=timezone.now())
+    owners = {pk: owner_id for pk, owner_id, _ in rows}
+    bump_owners(owners)
+    publish_ticket_events(owners, {
+        pk: status_event(Ticket(pk=pk, status=Ticket.Status.CLOSED), status) for pk, _, status in rows
+    })
+    return closed
+
+
+@transaction.atomic
+def reassign_tickets(tickets, department):
+    """Make ``department`` the only assignment of every ticket in ``tickets``; return how many."""
+    owners = owners_of(tickets)
+    others = TicketAssigned.objects.filter(ticket__in=tickets.values("pk")).exclude(department=department)
+    # One DELETE without per-row signals; their only effect, dashboard invalidation, is done in bulk below.
+    others._raw_delete(others.db)
+    TicketAssigned.objects.bulk_create(
+        [TicketAssigned(ticket_id=pk, department=department) for pk in owners], ignore_conflicts=True
+    )
+    bump_owners(owners)
+    return len(owners)
@@ -0,0 +1,30 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sessions.backends import cached_db
+from django.utils import timezone
+
+
+class SessionStore(cached_db.SessionStore):
+    """Cached-database sessions whose expired rows are cleared in batches.
+
+    Reads are served from the cache and fall back to the database; ``clearsessions``
+    deletes ``SESSION_CLEANUP_BATCH_SIZE`` expired rows per statement, so logins
+    never wait behind one huge DELETE for the write lock.
+    """
+
+    @classmethod
+    def expired_keys(cls):
+        """The next batch of expired session keys."""
+        expired = cls.get_model_class().objects.filter(expire_date__lt=timezone.now())
+        return list(expired.values_list("pk", flat=True)[:settings.SESSION_CLEANUP_BATCH_SIZE])
+
+    @classmethod
+    def clear_expired(cls):
+        """Delete expired sessions one batch at a time."""
+        while keys := cls.expired_keys():
+            cls.get_model_class().objects.filter(pk__in=keys).delete()
+
+    @classmethod
+    async def aclear_expired(cls):
+        """Async ``clear_expired``."""
+        await sync_to_async(cls.clear_expired)()
@@ -0,0 +1,8 @@
+from . import latest_message
+from . import awaiting_staff
+from . import dashboard_cache
+from . import search_index
+from . import ticket_events
+from . import avatars
+from . import sqlite_pragmas
+from . import user_cache
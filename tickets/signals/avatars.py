@@ -0,0 +1,35 @@
+from django.db.models.signals import post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from ..models import User
+from ..services.avatars import avatar_hash_for
+from ..services.dashboard_cache import bump_dashboard_version
+
+
+def picture_name(instance):
+    """Name of the profile picture currently on ``instance``, without loading a deferred field."""
+    value = instance.__dict__.get("profile_picture")
+    return getattr(value, "name", value) or None
+
+
+@receiver(post_init, sender=User)
+def remember_saved_picture(sender, instance, **kwargs):
+    """Note the picture as loaded so a later save can tell whether it changed."""
+    instance._saved_picture = picture_name(instance)
+
+
+@receiver(pre_save, sender=User)
+def refresh_avatar(sender, instance, update_fields=None, **kwargs):
+    """Generate resized variants of a new profile picture and record their content hash."""
+    if update_fields is not None and "profile_picture" not in update_fields:
+        return
+    if picture_name(instance) != instance._saved_picture:
+        instance.avatar_hash = avatar_hash_for(instance.profile_picture)
+
+
+@receiver(post_save, sender=User)
+def remember_stored_picture(sender, instance, **kwargs):
+    """Drop the cached dashboard showing an old avatar, then remember the stored picture."""
+    if picture_name(instance) != instance._saved_picture:
+        bump_dashboard_version(instance.pk)
+    instance._saved_picture = picture_name(instance)
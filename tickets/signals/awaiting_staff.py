@@ -0,0 +1,55 @@
+from django.db.models import Case, DateTimeField, Exists, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, pre_save
+from django.dispatch import receiver
+
+from ..models import Ticket, TicketMessage, User
+from .cascade import deleting_tickets
+
+
+def awaiting_since():
+    """Subquery for a ticket's oldest non-staff message that no staff message has followed."""
+    answered = TicketMessage.objects.filter(
+        ticket_id=OuterRef("ticket_id"), sender__is_staff=True, timestamp__gte=OuterRef("timestamp")
+    )
+    return Subquery(
+        TicketMessage.objects.filter(ticket_id=OuterRef("pk"), sender__is_staff=False)
+        .filter(~Exists(answered))
+        .order_by("timestamp")
+        .values("timestamp")[:1]
+    )
+
+
+def awaiting_after(message):
+    """Expression for awaiting_staff_since once ``message`` is posted to its ticket."""
+    staff_sender = User.objects.filter(pk=message.sender_id, is_staff=True)
+    return Case(
+        When(Q(status=Ticket.Status.CLOSED) | Exists(staff_sender), then=Value(None)),
+        default=Coalesce("awaiting_staff_since", Value(message.timestamp)),
+        output_field=DateTimeField(),
+    )
+
+
+def reopened(ticket):
+    """Whether saving ``ticket`` moves it out of CLOSED, going by the status it was loaded with (see ticket_events)."""
+    return ticket.status != Ticket.Status.CLOSED and getattr(ticket, "_saved_status", None) == Ticket.Status.CLOSED
+
+
+@receiver(pre_save, sender=Ticket)
+def track_waiting_on_status(sender, instance, **kwargs):
+    """Closed tickets are not waiting on anyone; a reopened one waits again from its oldest unanswered message."""
+    if instance.status == Ticket.Status.CLOSED:
+        instance.awaiting_staff_since = None
+    if reopened(instance):
+        waiting = Ticket.objects.filter(pk=instance.pk).annotate(since=awaiting_since())
+        instance.awaiting_staff_since = waiting.values_list("since", flat=True).get()
+
+
+@receiver(post_delete, sender=TicketMessage)
+def recompute_after_delete(sender, instance, origin=None, **kwargs):
+    """Work out again how long the customer has been waiting once a message is removed."""
+    if deleting_tickets(origin):
+        return
+    Ticket.objects.filter(pk=instance.ticket_id).exclude(
+        status=Ticket.Status.CLOSED
+    ).update(awaiting_staff_since=awaiting_since())
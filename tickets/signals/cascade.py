@@ -0,0 +1,14 @@
+from django.db.models import QuerySet
+
+from ..models import Ticket
+
+
+def deleting_tickets(origin):
+    """Whether a delete started at ``origin`` is removing whole tickets.
+
+    Messages and assignments then only go through the cascade from those
+    tickets, so the per-row upkeep of the ticket is pointless; the ticket's own
+    post_delete receivers unindex it and drop its owner's dashboard.
+    """
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return model is Ticket
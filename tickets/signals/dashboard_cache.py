@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..models import Ticket, TicketAssigned, TicketMessage
+from ..services.dashboard_cache import bump_dashboard_versions_on_commit
+from .cascade import deleting_tickets
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+def invalidate_for_ticket(sender, instance, using, **kwargs):
+    """Drop the owner's cached dashboard once a change to one of their tickets commits."""
+    bump_dashboard_versions_on_commit([instance.created_by_id], using)
+
+
+@receiver(post_save, sender=TicketMessage)
+@receiver(post_delete, sender=TicketMessage)
+@receiver(post_save, sender=TicketAssigned)
+@receiver(post_delete, sender=TicketAssigned)
+def invalidate_for_ticket_child(sender, instance, using, origin=None, **kwargs):
+    """Drop the ticket owner's cached dashboard once a message or assignment change commits."""
+    if deleting_tickets(origin):
+        return
+    owner_id = Ticket.objects.filter(pk=instance.ticket_id).values_list("created_by_id", flat=True).first()
+    if owner_id is not None:
+        bump_dashboard_versions_on_commit([owner_id], using)
@@ -0,0 +1,35 @@
+from django.db.models import OuterRef, Subquery
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..models import Ticket, TicketMessage
+from .awaiting_staff import awaiting_after
+from .cascade import deleting_tickets
+
+
+def latest_message_id():
+    """Subquery selecting the id of a ticket's most recent message."""
+    return Subquery(
+        TicketMessage.objects.filter(ticket_id=OuterRef("pk"))
+        .order_by("-timestamp", "-id")
+        .values("id")[:1]
+    )
+
+
+@receiver(post_save, sender=TicketMessage)
+def point_ticket_at_new_message(sender, instance, created, **kwargs):
+    """Make a newly created message the ticket's latest message and track who it waits on."""
+    if created:
+        Ticket.objects.filter(pk=instance.ticket_id).update(
+            last_message=instance, awaiting_staff_since=awaiting_after(instance)
+        )
+
+
+@receiver(post_delete, sender=TicketMessage)
+def repoint_ticket_after_delete(sender, instance, origin=None, **kwargs):
+    """Fall back to the next most recent message when the latest one is deleted."""
+    if deleting_tickets(origin):
+        return
+    Ticket.objects.filter(
+        pk=instance.ticket_id, last_message__isnull=True
+    ).update(last_message=latest_message_id())
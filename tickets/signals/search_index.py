@@ -0,0 +1,27 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..models import Ticket, TicketMessage
+from ..services.search import index_tickets, unindex_ticket
+from .cascade import deleting_tickets
+
+
+@receiver(post_save, sender=Ticket)
+def index_saved_ticket(sender, instance, using, update_fields=None, **kwargs):
+    """Index new tickets and re-index them when their title may have changed."""
+    if update_fields is None or "title" in update_fields:
+        index_tickets([instance.pk], using)
+
+
+@receiver(post_delete, sender=Ticket)
+def unindex_deleted_ticket(sender, instance, using, **kwargs):
+    """Remove a deleted ticket from the search index."""
+    unindex_ticket(instance.pk, using)
+
+
+@receiver(post_save, sender=TicketMessage)
+@receiver(post_delete, sender=TicketMessage)
+def reindex_message_ticket(sender, instance, using, origin=None, **kwargs):
+    """Re-index a ticket when one of its messages is posted, edited or deleted."""
+    if not deleting_tickets(origin):
+        index_tickets([instance.ticket_id], using)
@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+def pragma_statements(pragmas):
+    """``PRAGMA name = value`` statements for a mapping of pragma names to values."""
+    return [f"PRAGMA {name} = {value}" for name, value in pragmas.items()]
+
+
+@receiver(connection_created)
+def tune_sqlite_connection(sender, connection, **kwargs):
+    """Run ``settings.SQLITE_PRAGMAS`` on every new SQLite connection, before it serves any query."""
+    if connection.vendor != "sqlite":
+        return
+    for statement in pragma_statements(settings.SQLITE_PRAGMAS):
+        connection.connection.execute(statement)
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_init, post_save
+from django.dispatch import receiver
+
+from ..models import Ticket, TicketMessage
+from ..services.events import message_event, publish_ticket_event, status_event
+
+
+@receiver(post_save, sender=TicketMessage)
+def publish_new_message(sender, instance, created, **kwargs):
+    """Tell the ticket's owner and departments about a new message."""
+    if created:
+        publish_ticket_event(instance.ticket_id, message_event(instance))
+
+
+@receiver(post_init, sender=Ticket)
+def remember_saved_status(sender, instance, **kwargs):
+    """Note the status as loaded so a later save can tell whether it changed (None if deferred)."""
+    instance._saved_status = instance.__dict__.get("status")
+
+
+@receiver(post_save, sender=Ticket)
+def publish_status_change(sender, instance, created, **kwargs):
+    """Tell the ticket's owner and departments when its status changes."""
+    previous, instance._saved_status = instance._saved_status, instance.status
+    if not created and previous is not None and previous != instance.status:
+        publish_ticket_event(instance.pk, status_event(instance, previous), instance.created_by_id)
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..auth_backends import forget_user
+from ..models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_cached_user(sender, instance, **kwargs):
+    """Reload a saved or deleted user, e.g. after a password or permission change, on its next request."""
+    forget_user(instance.pk)
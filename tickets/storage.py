@@ -0,0 +1,148 @@
+import gzip
+import json
+from importlib import import_module
+from io import BytesIO
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.utils.functional import cached_property
+from PIL import Image
+
+# File suffix of the precompressed copy written for each content coding.
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def optional_module(name):
+    """``name`` imported, or None when it is not installed."""
+    try:
+        return import_module(name)
+    except ImportError:
+        return None
+
+
+def gzip_compress(data):
+    """Gzip ``data`` at the highest level, with a fixed mtime so output is reproducible."""
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_compress(data):
+    """Brotli ``data`` at the highest quality."""
+    return optional_module("brotli").compress(data, quality=11)
+
+
+def compressors():
+    """Content codings to precompress into, best first; brotli only when it is installed."""
+    available = {"br": optional_module("brotli") is not None, "gzip": True}
+    functions = {"br": brotli_compress, "gzip": gzip_compress}
+    return {coding: functions[coding] for coding, usable in available.items() if usable}
+
+
+def optimize_png(data):
+    """Re-encode a PNG with Pillow's optimiser; pixels are unchanged, and the original wins if not bigger."""
+    try:
+        image = Image.open(BytesIO(data))
+        buffer = BytesIO()
+        image.save(buffer, "PNG", optimize=True, dpi=image.info.get("dpi"))
+    except OSError:
+        return data
+    optimized = buffer.getvalue()
+    return optimized if len(optimized) < len(data) else data
+
+
+def compressible(name, size):
+    """Whether a file is text-like and big enough for precompression to pay off."""
+    return name.lower().endswith(settings.STATIC_PRECOMPRESS_EXTENSIONS) and size >= settings.STATIC_PRECOMPRESS_MIN_SIZE
+
+
+def savings_report(files, codings):
+    """Totals for a collectstatic run: bytes served per coding and bytes saved against the originals.
+
+    A file without a smaller precompressed copy counts at its optimised size.
+    """
+    original = sum(file["original"] for file in files)
+    totals = {column: sum(file.get(column, file["optimized"]) for file in files) for column in ["optimized", *codings]}
+    return {
+        "files": files,
+        "original": original,
+        "totals": totals,
+        "saved": {column: original - total for column, total in totals.items()},
+    }
+
+
+class PrecompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """Manifest-hashed static files, with PNGs optimised and text assets precompressed at collectstatic time.
+
+    Each hashed file gets ``.br`` (when brotli is installed) and ``.gz`` siblings
+    for ``StaticAssetsMiddleware`` to serve, and the bytes saved are written to
+    ``report_name`` for ``manage.py static_report``.
+    """
+
+    report_name = "staticfiles-report.json"
+
+    def post_process(self, paths, dry_run=False, **options):
+        """Hash and copy as usual, then optimise and precompress every hashed file."""
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if not dry_run:
+            self.__dict__.pop("immutable_names", None)
+            files = [self.optimize(name, hashed_name) for name, hashed_name in sorted(self.hashed_files.items())]
+            self.replace(self.report_name, json.dumps(savings_report(files, list(compressors()))).encode())
+
+    def stored_name(self, name):
+        """The hashed name from the manifest; under DEBUG, the name itself until collectstatic has written one.
+
+        Without DEBUG a missing manifest keeps Django's ValueError, so a forgotten
+        collectstatic fails loudly instead of serving unhashed names as immutable.
+        """
+        if settings.DEBUG and not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    @cached_property
+    def immutable_names(self):
+        """Names carrying a content hash, which can be cached forever."""
+        return frozenset(self.hashed_files.values())
+
+    def optimize(self, name, hashed_name):
+        """Optimise and precompress the hashed copy of ``name``, returning its sizes for the report.
+
+        A PNG's original size comes from the unhashed copy collectstatic left
+        behind, so re-running over already optimised files reports the same savings.
+        """
+        with self.open(hashed_name) as file:
+            data = file.read()
+        sizes = {"name": hashed_name, "original": len(data)}
+        if hashed_name.lower().endswith(".png"):
+            sizes["original"] = self.size(name)
+            data = self.shrink_png(hashed_name, data)
+        sizes["optimized"] = len(data)
+        return {**sizes, **self.precompress(hashed_name, data)}
+
+    def shrink_png(self, name, data):
+        """Replace a collected PNG with its optimised encoding when that is smaller."""
+        optimized = optimize_png(data)
+        return data if optimized is data else self.replace(name, optimized)
+
+    def precompress(self, name, data):
+        """Write each precompressed copy of ``data`` that is smaller, returning their sizes by coding."""
+        if not compressible(name, len(data)):
+            return {}
+        encoded = {coding: compress(data) for coding, compress in compressors().items()}
+        smaller = {coding: body for coding, body in encoded.items() if len(body) < len(data)}
+        for coding, body in smaller.items():
+            self.replace(name + ENCODING_SUFFIXES[coding], body)
+        return {coding: len(body) for coding, body in smaller.items()}
+
+    def replace(self, name, data):
+        """Overwrite ``name`` with ``data``, returning ``data``."""
+        if self.exists(name):
+            self.delete(name)
+        self._save(name, ContentFile(data))
+        return data
+
+    def read_report(self):
+        """The last collectstatic's savings report, or None if there is none."""
+        if not self.exists(self.report_name):
+            return None
+        with self.open(self.report_name) as report:
+            return json.loads(report.read())
@@ -0,0 +1,26 @@
+from django import template
+from django.conf import settings
+
+from ..services.avatars import avatar_url
+
+register = template.Library()
+
+
+def srcset(user, size, fmt):
+    """``srcset`` value offering the 2x variant too when that size is generated."""
+    urls = [f"{avatar_url(user, size, fmt)} 1x"]
+    if size * 2 in settings.AVATAR_SIZES:
+        urls.append(f"{avatar_url(user, size * 2, fmt)} 2x")
+    return ", ".join(urls)
+
+
+@register.inclusion_tag("partials/avatar.html")
+def avatar(user, size=40):
+    """A ``size`` pixel avatar for ``user``: WebP with a JPEG fallback, or their initials."""
+    return {
+        "user": user,
+        "size": size,
+        "webp": user.avatar_hash and srcset(user, size, "webp"),
+        "jpeg": user.avatar_hash and srcset(user, size, "jpeg"),
+        "src": avatar_url(user, size, "jpeg"),
+    }
@@ -0,0 +1,16 @@
+from django import template
+from django.conf import settings
+
+register = template.Library()
+
+
+@register.inclusion_tag("partials/ticket_row.html", takes_context=True)
+def ticket_row(context, ticket, tab):
+    """One dashboard row for ``ticket`` in ``tab``, served from the fragment cache while it is unchanged."""
+    sender_id = ticket.last_message_sender_id
+    return {
+        "t": ticket,
+        "tab": tab,
+        "viewer_is_sender": sender_id is not None and sender_id == context["request"].user.id,
+        "cache_timeout": settings.TICKET_ROW_CACHE_TIMEOUT,
+    }
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+# Tests run with DEBUG off and no collectstatic manifest, so templates link static
+# files by their plain names; the storage tests switch the manifest storage back on.
+TEST_STATICFILES = {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"}
+
+
+class NPlusOneTestRunner(DiscoverRunner):
+    """Test runner that turns every N+1 lazy load hit through the test client into a failure."""
+
+    def setup_test_environment(self, **kwargs):
+        """Switch N+1 detection to raise, and static files to unhashed names, for the whole run."""
+        super().setup_test_environment(**kwargs)
+        self.nplusone_mode = settings.NPLUSONE_MODE
+        settings.NPLUSONE_MODE = "raise"
+        self.static_storage = override_settings(STORAGES={**settings.STORAGES, "staticfiles": TEST_STATICFILES})
+        self.static_storage.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        """Restore the configured N+1 detection mode and static files storage."""
+        self.static_storage.disable()
+        settings.NPLUSONE_MODE = self.nplusone_mode
+        super().teardown_test_environment(**kwargs)
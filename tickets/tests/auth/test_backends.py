@@ -0,0 +1,67 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from tickets.auth_backends import CachedModelBackend, user_cache_key
+
+User = get_user_model()
+
+# The production session and authentication settings.
+CACHED_AUTH = {
+    "SESSION_ENGINE": "tickets.sessions",
+    "AUTHENTICATION_BACKENDS": ["tickets.auth_backends.CachedModelBackend"],
+}
+
+
+@override_settings(**CACHED_AUTH)
+class CachedModelBackendTests(TestCase):
+    """Tests for serving sessions and request.user from the cache."""
+
+    def setUp(self):
+        """Start from an empty cache with a logged-in customer."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="cacheduser",
+            password="password123",
+            email="cached@example.com",
+            first_name="Cash",
+            last_name="Dee",
+        )
+        self.client.force_login(self.user)
+        self.url = reverse("home")
+
+    def test_warm_requests_skip_the_session_and_user_queries(self):
+        """Once the dashboard, session and user are cached a page view runs no queries at all."""
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.context["user"], self.user)
+
+    def test_saving_the_user_drops_the_cached_copy(self):
+        """Profile edits show up on the next request; a password change ends other sessions."""
+        self.client.get(self.url)
+        self.user.first_name = "Renamed"
+        self.user.save()
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+        self.assertEqual(self.client.get(self.url).context["user"].first_name, "Renamed")
+        self.user.set_password("new-password-456")
+        self.user.save()
+        self.assertTemplateUsed(self.client.get(self.url), "landing.html")
+
+    def test_unknown_and_inactive_users_are_not_cached(self):
+        """Only users that may log in are cached."""
+        backend = CachedModelBackend()
+        self.assertIsNone(backend.get_user(0))
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertIsNone(backend.get_user(self.user.pk))
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+
+    async def test_async_lookups_share_the_cache(self):
+        """``aget_user`` fills and reads the same entry as ``get_user``."""
+        backend = CachedModelBackend()
+        self.assertEqual(await backend.aget_user(self.user.pk), self.user)
+        self.assertEqual(await cache.aget(user_cache_key(self.user.pk)), self.user)
+        self.assertEqual(await backend.aget_user(self.user.pk), self.user)
+        self.assertIsNone(await backend.aget_user(0))
@@ -0,0 +1,34 @@
+from django.test import SimpleTestCase, override_settings
+
+from resolveme import production_settings
+from tickets.checks import check_shared_auth_cache
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+SHARED = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://cache:6379/0"}}
+
+
+class SharedAuthCacheCheckTests(SimpleTestCase):
+    """Tests for the system check guarding cached sessions and users."""
+
+    def test_default_settings_pass(self):
+        """Database sessions and ModelBackend need no shared cache."""
+        self.assertEqual(check_shared_auth_cache(None), [])
+
+    @override_settings(
+        CACHES=LOCMEM, SESSION_ENGINE="tickets.sessions",
+        AUTHENTICATION_BACKENDS=["tickets.auth_backends.CachedModelBackend"],
+    )
+    def test_cached_logins_on_a_per_process_cache_fail(self):
+        """Cached sessions or users on locmem are an error."""
+        errors = check_shared_auth_cache(None)
+        self.assertEqual([error.id for error in errors], ["tickets.E001"])
+        self.assertIn("CACHES['default'] is per-process", errors[0].msg)
+
+    @override_settings(CACHES=SHARED, SESSION_ENGINE="tickets.sessions")
+    def test_shared_cache_passes(self):
+        """A cache every worker reaches is accepted."""
+        self.assertEqual(check_shared_auth_cache(None), [])
+
+    def test_production_profile_uses_a_shared_cache(self):
+        """The production profile points 'default' at Redis."""
+        self.assertEqual(production_settings.CACHES["default"]["BACKEND"], SHARED["default"]["BACKEND"])
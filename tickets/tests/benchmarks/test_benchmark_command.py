@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, override_settings
+
+from tickets.benchmarks.command import BenchmarkCommand
+
+
+class EchoBenchmark(BenchmarkCommand):
+    """A benchmark whose results are its seed."""
+
+    benchmark = "echo"
+
+    def run(self, options):
+        """Return the seed it was given."""
+        return {"seed": options["seed"]}
+
+
+class BenchmarkCommandTests(SimpleTestCase):
+    """Tests for the shared benchmark command behaviour."""
+
+    def test_refuses_non_scratch_database(self):
+        """Without the scratch-database flag no benchmark runs."""
+        with self.assertRaises(CommandError):
+            call_command(EchoBenchmark(), stdout=StringIO())
+
+    @override_settings(BENCHMARK_SCRATCH_DATABASE=True)
+    def test_writes_json_report_to_stdout_or_a_file(self):
+        """The report names the benchmark and carries its results, on stdout or in ``--output``."""
+        out = StringIO()
+        call_command(EchoBenchmark(), seed=7, stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual((report["benchmark"], report["results"]), ("echo", {"seed": 7}))
+        self.assertEqual(set(report), {"benchmark", "generated_at", "python", "results"})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.json")
+            out = StringIO()
+            call_command(EchoBenchmark(), output=path, stdout=out)
+            with open(path, encoding="utf-8") as handle:
+                self.assertEqual(json.load(handle)["results"], {"seed": 42})
+        self.assertIn(f"Wrote {path}", out.getvalue())
+
+    def test_benchmarks_must_implement_run(self):
+        """A benchmark command without ``run`` cannot be created."""
+        with self.assertRaises(TypeError):
+            type("Incomplete", (BenchmarkCommand,), {})()
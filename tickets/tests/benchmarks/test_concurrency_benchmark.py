@@ -0,0 +1,54 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.contrib.auth import get_user_model
+
+from tickets.benchmarks.concurrency import MODES, run_load, summarize_load
+from tickets.models import Ticket
+
+User = get_user_model()
+
+
+class LoadSummaryTests(SimpleTestCase):
+    """Tests for reducing load-test samples."""
+
+    def test_summary_reports_throughput_errors_and_percentiles(self):
+        """Samples reduce to requests per second, non-200 responses and latency percentiles."""
+        samples = [(float(ms), 200 if ms % 10 else 500) for ms in range(1, 101)]
+        summary = summarize_load(samples, seconds=2.0, concurrency=8)
+        self.assertEqual((summary["requests"], summary["concurrency"], summary["errors"]), (100, 8, 10))
+        self.assertEqual(summary["throughput_rps"], 50.0)
+        self.assertEqual((summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]), (51.0, 96.0, 100.0))
+
+
+class ConcurrencyBenchmarkTests(TransactionTestCase):
+    """Concurrent requests run on other threads and connections, so their data must be committed."""
+
+    def setUp(self):
+        """Create a user whose dashboard has a few tickets."""
+        self.user = User.objects.create_user(
+            username="loaduser",
+            password="password123",
+            email="load@example.com",
+            first_name="Load",
+            last_name="User",
+        )
+        for i in range(3):
+            Ticket.objects.create(title=f"Load {i}", created_by=self.user)
+
+    def test_every_mode_serves_the_dashboard(self):
+        """WSGI and both ASGI modes answer every concurrent request successfully."""
+        for cached in (False, True):
+            results = run_load(self.user, requests=6, concurrency=3, cached=cached)
+            self.assertEqual(set(results), set(MODES))
+            for summary in results.values():
+                self.assertEqual((summary["requests"], summary["errors"]), (6, 0))
+
+    @override_settings(BENCHMARK_SCRATCH_DATABASE=True)
+    def test_command_reports_results(self):
+        """The report is written as JSON with one summary per mode."""
+        out = StringIO()
+        call_command("benchmark_concurrency", tickets=10, requests=2, concurrency=2, stdout=out)
+        self.assertEqual(set(json.loads(out.getvalue())["results"]["modes"]), set(MODES))
@@ -0,0 +1,67 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import OperationalError
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.contrib.auth import get_user_model
+
+from tickets.benchmarks.contention import PROFILES, contention_workload, run_profile, summarize_operations, timed
+from tickets.models import Ticket, TicketMessage
+
+User = get_user_model()
+
+
+class OperationSummaryTests(SimpleTestCase):
+    """Tests for reducing contention samples."""
+
+    def test_failed_operations_count_as_errors_not_throughput(self):
+        """Lock failures are counted and left out of the per-second rate."""
+        summary = summarize_operations([[(1.0, False), (3.0, True)], [(2.0, False)]], seconds=1.0)
+        self.assertEqual((summary["operations"], summary["errors"], summary["per_second"]), (3, 1, 2.0))
+        self.assertEqual(summary["p50_ms"], 2.0)
+
+    def test_lock_errors_are_recorded_as_failures(self):
+        """An operation that hits "database is locked" is timed and flagged rather than raised."""
+        def locked():
+            """Fail the way a busy SQLite database does."""
+            raise OperationalError("database is locked")
+
+        self.assertTrue(timed(locked)[1])
+        self.assertFalse(timed(lambda: None)[1])
+
+
+class ContentionBenchmarkTests(TransactionTestCase):
+    """Client threads use their own connections, so the data they touch must be committed."""
+
+    def setUp(self):
+        """Create a user with a few tickets to read and reply to."""
+        self.user = User.objects.create_user(
+            username="contender",
+            password="password123",
+            email="contender@example.com",
+            first_name="Con",
+            last_name="Tender",
+        )
+        for i in range(3):
+            Ticket.objects.create(title=f"Busy {i}", created_by=self.user)
+
+    def test_every_profile_reads_and_posts(self):
+        """Both profiles run every reader and writer operation and the replies land through the save signals."""
+        workload = contention_workload()
+        failed = 0
+        for name in PROFILES:
+            results = run_profile(name, workload, readers=2, writers=1, operations=3)
+            self.assertEqual((results["reads"]["operations"], results["writes"]["operations"]), (6, 3))
+            failed += results["writes"]["errors"]
+        self.assertEqual(TicketMessage.objects.count(), 6 - failed)
+        self.assertFalse(Ticket.objects.filter(ticketmessage__isnull=False, last_message=None).exists())
+
+    @override_settings(BENCHMARK_SCRATCH_DATABASE=True)
+    def test_command_reports_results(self):
+        """The report is written as JSON with reads and writes per profile."""
+        out = StringIO()
+        call_command("benchmark_contention", tickets=10, readers=1, writers=1, operations=2, stdout=out)
+        profiles = json.loads(out.getvalue())["results"]["profiles"]
+        self.assertEqual(set(profiles), set(PROFILES))
+        self.assertEqual(set(profiles["production"]), {"reads", "writes"})
@@ -0,0 +1,50 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from tickets.benchmarks.dashboard import run_scale, summarize, time_request, volumes_for
+from tickets.models import Ticket, User
+
+
+class DashboardBenchmarkTests(TestCase):
+    """Tests for the dashboard benchmark helpers and command."""
+
+    def test_time_request_times_queries_and_template_rendering(self):
+        """A request's render time is what its templates took, not the wall time left after the database."""
+        user = User.objects.create_user(username="benchuser", password="password123", email="bench@example.com")
+        Ticket.objects.create(title="Timed", created_by=user)
+        sample = time_request(user)
+        self.assertGreater(sample["queries"], 0)
+        self.assertGreater(sample["db"], 0)
+        self.assertGreater(sample["render"], 0)
+        self.assertLess(sample["db"] + sample["render"], sample["total"])
+
+    def test_summarize_reports_percentiles(self):
+        """Samples reduce to p50/p95 latencies and the worst query count."""
+        samples = [{"total": float(ms), "db": 1.0, "render": ms - 1.0, "queries": ms % 3} for ms in range(1, 21)]
+        summary = summarize(samples)
+        self.assertEqual(summary["requests"], 20)
+        self.assertEqual(summary["p50_ms"], 10.5)
+        self.assertEqual(summary["p95_ms"], 20.0)
+        self.assertEqual(summary["queries"], 2)
+
+    def test_volumes_scale_with_ticket_count(self):
+        """Users and messages grow with the ticket count."""
+        self.assertEqual(volumes_for(10_000), {"users": 100, "departments": 10, "tickets": 10_000, "messages": 100_000})
+
+    def test_run_scale_measures_cold_and_warm_requests(self):
+        """A cold dashboard hits the database; a warm one is served from the cache."""
+        result = run_scale(20, iterations=2, seed=1)
+        self.assertEqual(result["volumes"]["tickets"], 20)
+        self.assertEqual(result["cold"]["queries"], 2)
+        self.assertEqual(result["warm"]["queries"], 0)
+        self.assertGreater(result["peak_memory_kib"], 0)
+
+    @override_settings(BENCHMARK_SCRATCH_DATABASE=True)
+    def test_command_reports_results(self):
+        """The command runs the benchmark and reports its results as JSON."""
+        out = StringIO()
+        call_command("benchmark_dashboard", scales="10", iterations=1, stdout=out)
+        self.assertEqual(json.loads(out.getvalue())["results"][0]["volumes"]["tickets"], 10)
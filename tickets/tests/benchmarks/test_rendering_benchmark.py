@@ -0,0 +1,44 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+
+from tickets.benchmarks.rendering import render_modes, tab_rows, viewer_request
+from tickets.models import Ticket
+
+User = get_user_model()
+
+
+class RenderingBenchmarkTests(TestCase):
+    """Tests for the dashboard row rendering benchmark."""
+
+    def setUp(self):
+        """Create a user with tickets in the active and completed tabs."""
+        self.user = User.objects.create_user(
+            username="renderuser",
+            password="password123",
+            email="render@example.com",
+            first_name="Render",
+            last_name="User",
+        )
+        for status in (Ticket.Status.OPEN, Ticket.Status.OPEN, Ticket.Status.CLOSED):
+            Ticket.objects.create(title="Render", created_by=self.user, status=status)
+
+    def test_every_mode_renders_every_row(self):
+        """Rows are fetched per tab up front, then timed uncached, cold and warm."""
+        rows = tab_rows(self.user)
+        self.assertEqual({tab: len(tickets) for tab, tickets in rows.items()},
+                         {"active": 2, "overdue": 0, "completed": 1})
+        modes = render_modes(viewer_request(self.user), rows, iterations=2)
+        self.assertEqual(set(modes), {"uncached", "cold", "warm"})
+        self.assertTrue(all(summary["renders"] == 2 for summary in modes.values()))
+
+    @override_settings(BENCHMARK_SCRATCH_DATABASE=True)
+    def test_command_reports_results(self):
+        """The report is written as JSON with one summary per mode."""
+        out = StringIO()
+        call_command("benchmark_rendering", tickets=10, iterations=1, stdout=out)
+        results = json.loads(out.getvalue())["results"]
+        self.assertEqual((results["user_tickets"], set(results["modes"])), (10, {"uncached", "cold", "warm"}))
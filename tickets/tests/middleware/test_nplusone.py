@@ -0,0 +1,97 @@
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.http import HttpResponse
+from django.template import engines
+from django.test import RequestFactory, TestCase, override_settings
+from django.contrib.auth import get_user_model
+
+from tickets.middleware import NPlusOneMiddleware
+from tickets.middleware.nplusone import NPlusOneError, call_site, detecting
+from tickets.models import Ticket, TicketMessage
+
+User = get_user_model()
+
+
+def read_senders():
+    """Touch every message's sender without select_related."""
+    return [m.sender.username for m in TicketMessage.objects.all()]
+
+
+class NPlusOneDetectorTests(TestCase):
+    """Tests for the lazy-load N+1 detector."""
+
+    def setUp(self):
+        """Create a ticket with messages from two different senders."""
+        self.user = User.objects.create_user(
+            username="nplususer",
+            password="password123",
+            email="nplus@example.com",
+            first_name="Nplus",
+            last_name="User",
+        )
+        self.staff = User.objects.create_user(
+            username="nplusstaff",
+            password="password123",
+            email="nplusstaff@example.com",
+            first_name="Nplus",
+            last_name="Staff",
+            is_staff=True,
+        )
+        ticket = Ticket.objects.create(title="Loop", created_by=self.user)
+        TicketMessage.objects.create(ticket=ticket, sender=self.user, body="One")
+        TicketMessage.objects.create(ticket=ticket, sender=self.staff, body="Two")
+
+    def test_repeated_lazy_loads_raise_with_source_line(self):
+        """Loading the same relation twice from one line fails and names that line."""
+        with self.assertRaisesRegex(NPlusOneError, r"tickets\.TicketMessage\.sender .*test_nplusone\.py:\d+"):
+            with detecting("raise"):
+                read_senders()
+
+    def test_template_line_is_reported(self):
+        """Lazy loads during rendering are attributed to the template line."""
+        template = engines["django"].from_string("{% for m in messages %}\n{{ m.sender.username }}{% endfor %}")
+        with self.assertRaisesRegex(NPlusOneError, r"from <unknown source>:2;"):
+            with detecting("raise"):
+                template.render({"messages": TicketMessage.objects.all()})
+
+    def test_log_mode_warns_once(self):
+        """In log mode the N+1 is reported once and the code carries on."""
+        with self.assertLogs("tickets.nplusone", level="WARNING") as logs, detecting("log"):
+            self.assertEqual(len(read_senders()), 2)
+        self.assertEqual(len(logs.records), 1)
+
+    def test_select_related_is_not_flagged(self):
+        """Joined relations are never lazily loaded."""
+        with detecting("raise", threshold=1):
+            senders = [m.sender.username for m in TicketMessage.objects.select_related("sender")]
+        self.assertEqual(len(senders), 2)
+
+    def test_no_detector_means_no_checks(self):
+        """Outside a detection block lazy loads are left alone."""
+        self.assertEqual(len(read_senders()), 2)
+
+    def test_call_site_without_project_frames(self):
+        """Call sites outside the project fall back to a placeholder."""
+        with override_settings(BASE_DIR="/nonexistent"):
+            self.assertEqual(call_site(), "<unknown>")
+
+    def test_middleware_detects_in_requests(self):
+        """The middleware raises for N+1s when enabled and is a pass-through when off."""
+        middleware = NPlusOneMiddleware(lambda request: HttpResponse(len(read_senders())))
+        request = RequestFactory().get("/")
+        with self.assertRaises(NPlusOneError):
+            middleware(request)
+        with override_settings(NPLUSONE_MODE=None):
+            self.assertEqual(middleware(request).content, b"2")
+
+    async def test_middleware_detects_in_async_requests(self):
+        """Under ASGI the middleware is async too and follows the request into ORM threads."""
+        async def get_response(request):
+            """Read every sender lazily off the event loop."""
+            return HttpResponse(len(await sync_to_async(read_senders)()))
+
+        middleware = NPlusOneMiddleware(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+        with self.assertRaises(NPlusOneError):
+            await middleware(RequestFactory().get("/"))
+        with override_settings(NPLUSONE_MODE=None):
+            self.assertEqual((await middleware(RequestFactory().get("/"))).content, b"2")
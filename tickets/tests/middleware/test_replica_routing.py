@@ -0,0 +1,119 @@
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from tickets.middleware import ReplicaRoutingMiddleware
+from tickets.middleware.replica_routing import PIN_COOKIE
+from tickets.models import Ticket, TicketMessage
+from tickets.routers import replica_reads
+from tickets.services.search import search
+
+User = get_user_model()
+
+
+class ReplicaTestCase(TransactionTestCase):
+    """Base for routing tests: a ``replica`` alias on its own SQLite file beside the test database."""
+
+    # Resolved once setUpClass has registered the replica, so the runner only creates "default".
+    databases = "__all__"
+
+    @classmethod
+    def setUpClass(cls):
+        """Register the replica alias before the test case checks ``databases``."""
+        directory = Path(tempfile.mkdtemp())
+        cls.addClassCleanup(shutil.rmtree, directory, ignore_errors=True)
+        connections.settings["replica"] = {**connections.settings["default"], "NAME": str(directory / "replica.sqlite3")}
+        cls.addClassCleanup(cls.drop_replica)
+        super().setUpClass()
+
+    @classmethod
+    def drop_replica(cls):
+        """Close and forget the replica alias."""
+        connections["replica"].close()
+        del connections["replica"]
+        del connections.settings["replica"]
+
+    def setUp(self):
+        """Make the alias the only configured replica."""
+        settings_override = override_settings(DATABASE_REPLICAS=["replica"])
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def replicate(self):
+        """Copy the primary's committed state to the replica file, as replication would."""
+        replica = connections["replica"]
+        connection.ensure_connection()
+        replica.ensure_connection()
+        connection.connection.backup(replica.connection)
+
+
+class ReplicaRoutingMiddlewareTests(ReplicaTestCase):
+    """Tests for serving read-only views from a replica."""
+
+    def setUp(self):
+        """Log in a ticket owner, replicate, then rename the ticket on the primary only."""
+        super().setUp()
+        self.user = User.objects.create_user(username="replicauser", password="password123", email="r@example.com")
+        self.ticket = Ticket.objects.create(title="Replicated title", created_by=self.user)
+        self.client.force_login(self.user)
+        self.replicate()
+        Ticket.objects.filter(pk=self.ticket.pk).update(title="Primary title")
+        self.url = reverse("ticket_thread", args=[self.ticket.pk])
+
+    def test_read_only_views_read_from_the_replica(self):
+        """The thread view shows what the replica has, even before it catches up."""
+        self.assertContains(self.client.get(self.url), "Replicated title")
+        with override_settings(DATABASE_REPLICAS=[]):
+            self.assertContains(self.client.get(self.url), "Primary title")
+
+    def test_other_requests_read_from_the_primary(self):
+        """Unlisted views and writes use the primary."""
+        with override_settings(REPLICA_READ_VIEWS=["home"]):
+            self.assertContains(self.client.get(self.url), "Primary title")
+        self.assertEqual(self.client.post(self.url).status_code, 405)
+
+    async def test_async_requests_read_from_the_replica(self):
+        """ORM calls made from threads under ASGI follow the request's routing."""
+        self.async_client.cookies = self.client.cookies
+        response = await self.async_client.get(self.url)
+        self.assertContains(response, "Replicated title")
+
+    def test_writes_pin_later_reads_to_the_primary(self):
+        """Reads after a write in the same request, and the client's next requests, go to the primary."""
+        def view(request):
+            """Read, write, then read the ticket's title again."""
+            before = Ticket.objects.get(pk=self.ticket.pk).title
+            Ticket.objects.filter(pk=self.ticket.pk).update(status=Ticket.Status.CLOSED)
+            return HttpResponse(f"{before} / {Ticket.objects.get(pk=self.ticket.pk).title}")
+        response = ReplicaRoutingMiddleware(view)(RequestFactory().get(self.url))
+        self.assertEqual(response.content, b"Replicated title / Primary title")
+        self.assertEqual(response.cookies[PIN_COOKIE]["max-age"], 5)
+        self.client.cookies[PIN_COOKIE] = "1"
+        self.assertContains(self.client.get(self.url), "Primary title")
+
+    def test_read_only_requests_are_not_pinned(self):
+        """Requests that only read leave no pin cookie behind."""
+        self.assertNotIn(PIN_COOKIE, self.client.get(self.url).cookies)
+
+
+class ReplicaSearchTests(ReplicaTestCase):
+    """Tests for searching on a replica."""
+
+    def test_snippets_come_from_the_database_that_matched(self):
+        """Results and their snippets are both read from the replica the search ran on."""
+        user = User.objects.create_user(username="replicasearch", password="password123", email="s@example.com")
+        ticket = Ticket.objects.create(title="Scanner", created_by=user)
+        message = TicketMessage.objects.create(ticket=ticket, sender=user, body="The scanner smells of toast")
+        self.replicate()
+        message.body = "Fixed now"
+        message.save()
+        with replica_reads("replica"):
+            results, _ = search(user, "toast")
+        self.assertEqual([result.pk for result in results], [ticket.pk])
+        self.assertIn("<mark>toast</mark>", results[0].snippet)
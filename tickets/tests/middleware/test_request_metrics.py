@@ -0,0 +1,102 @@
+import json
+
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import cache
+from django.template import TemplateDoesNotExist, engines
+from django.template.base import Template
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from tickets.middleware import RequestMetricsMiddleware
+from tickets.middleware.request_metrics import RequestMetrics, TimedTemplate, measuring
+from tickets.models import Ticket
+
+User = get_user_model()
+
+
+class RequestMetricsMiddlewareTests(TestCase):
+    """Tests for the per-request SQL and render timing middleware."""
+
+    def setUp(self):
+        """Log in a user who owns one ticket."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="metricsuser",
+            password="password123",
+            email="metrics@example.com",
+            first_name="Metrics",
+            last_name="User",
+        )
+        Ticket.objects.create(title="Timed", created_by=self.user)
+        self.client.login(username="metricsuser", password="password123")
+
+    def get_home(self):
+        """Request the dashboard, capturing the metrics log output."""
+        with self.assertLogs("tickets.metrics", level="INFO") as logs:
+            response = self.client.get(reverse("home"))
+        return response, logs
+
+    def test_server_timing_header_reports_queries_and_phases(self):
+        """The response carries db, template and total durations."""
+        response, _ = self.get_home()
+        header = response["Server-Timing"]
+        self.assertRegex(header, r'^db;dur=[\d.]+;desc="\d+ queries", tpl;dur=[\d.]+, total;dur=[\d.]+$')
+
+    def test_summary_line_is_json_at_info(self):
+        """One structured INFO line describes the request, including its template time."""
+        _, logs = self.get_home()
+        record = logs.records[-1]
+        summary = json.loads(record.getMessage())
+        self.assertEqual(record.levelname, "INFO")
+        self.assertEqual((summary["path"], summary["status"]), ("/", 200))
+        self.assertGreater(summary["queries"], 0)
+        self.assertGreater(summary["template_ms"], 0)
+        self.assertLessEqual(len(summary["slowest"]), 3)
+
+    @override_settings(REQUEST_METRICS_QUERY_BUDGET=0)
+    def test_summary_is_a_warning_when_over_budget(self):
+        """Requests running more queries than the budget are logged as warnings."""
+        _, logs = self.get_home()
+        self.assertEqual(logs.records[-1].levelname, "WARNING")
+
+    @override_settings(REQUEST_METRICS_SLOW_QUERY_MS=0)
+    def test_slow_queries_are_logged_individually(self):
+        """Each statement at or over the threshold gets its own warning."""
+        _, logs = self.get_home()
+        self.assertTrue(any(r.getMessage().startswith("Slow query") for r in logs.records))
+
+    def test_templates_are_timed_by_the_backend(self):
+        """The configured backend hands out timed templates; Django's own class is left unpatched."""
+        backend = engines["django"]
+        self.assertIsInstance(backend.from_string("{{ x }}"), TimedTemplate)
+        self.assertIsInstance(backend.get_template("home.html"), TimedTemplate)
+        self.assertEqual(Template.render.__module__, "django.template.base")
+        with self.assertRaises(TemplateDoesNotExist):
+            backend.get_template("missing.html")
+
+    def test_rendering_outside_a_request_is_not_timed(self):
+        """Templates rendered without active metrics are left alone."""
+        metrics = RequestMetrics()
+        with measuring(metrics):
+            pass
+        self.assertEqual(engines["django"].from_string("{{ x }}").render({"x": 1}), "1")
+        self.assertEqual(metrics.template_seconds, 0.0)
+
+    async def test_async_requests_are_timed(self):
+        """Async requests get their queries, render and total timings without blocking the loop."""
+        async def get_response(request):
+            """Query through the async ORM, then render a template on the event loop."""
+            count = await Ticket.objects.acount()
+            return HttpResponse(engines["django"].from_string("{{ x }}").render({"x": count}))
+
+        middleware = RequestMetricsMiddleware(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+        with self.assertLogs("tickets.metrics", level="INFO") as logs:
+            response = await middleware(RequestFactory().get("/async/"))
+        summary = json.loads(logs.records[-1].getMessage())
+        self.assertGreater(summary["template_ms"], 0)
+        self.assertEqual(summary["queries"], 1)
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+        self.assertEqual(response.content, b"1")
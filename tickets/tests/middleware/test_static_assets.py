@@ -0,0 +1,59 @@
+import gzip
+
+from tickets.middleware.static_assets import accepted_codings
+from tickets.tests.storage.test_storage import StaticFilesTestCase
+
+
+class StaticAssetsMiddlewareTests(StaticFilesTestCase):
+    """Tests for serving collected static files."""
+
+    def setUp(self):
+        """Collect the test files into STATIC_ROOT."""
+        super().setUp()
+        self.collect()
+
+    def get(self, name, **headers):
+        """Fetch a static file and read its whole body."""
+        response = self.client.get(f"/static/{name}", headers=headers)
+        body = b"".join(response.streaming_content) if response.streaming else response.content
+        response.close()
+        return response, body
+
+    def test_hashed_files_are_immutable_and_precompressed(self):
+        """A hashed stylesheet comes gzipped to clients that accept it, cacheable for a year."""
+        response, body = self.get(self.hashed("style.css"), accept_encoding="br;q=0, gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Content-Type"], "text/css")
+        self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(gzip.decompress(body), (self.root / self.hashed("style.css")).read_bytes())
+
+    def test_identity_is_served_without_accept_encoding(self):
+        """Clients that do not accept gzip get the plain file."""
+        response, body = self.get(self.hashed("style.css"))
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(body, (self.root / self.hashed("style.css")).read_bytes())
+
+    def test_unhashed_names_are_cached_briefly(self):
+        """Files requested by their original name must be revalidated soon."""
+        response, _ = self.get("logo.png", accept_encoding="gzip")
+        self.assertEqual(response["Cache-Control"], "public, max-age=60")
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_other_requests_pass_through(self):
+        """Missing files, directories, escapes, non-static paths and writes reach the rest of the stack."""
+        for path in ("/static/missing.css", "/static/", "/static/../settings.py", "/nowhere/"):
+            self.assertEqual(self.client.get(path).status_code, 404, path)
+        self.assertEqual(self.client.post(f"/static/{self.hashed('style.css')}").status_code, 404)
+
+    async def test_async_requests_are_served(self):
+        """Under ASGI the middleware answers static requests before the rest of the stack."""
+        response = await self.async_client.get("/static/logo.png")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Cache-Control"], "public, max-age=60")
+        self.assertEqual((await self.async_client.get("/static/missing.css")).status_code, 404)
+
+    def test_refused_codings_are_not_accepted(self):
+        """``q=0`` refuses a coding; any other weight accepts it."""
+        self.assertEqual(accepted_codings("gzip;q=0.5, br; q=0, deflate;q=0.000"), {"gzip"})
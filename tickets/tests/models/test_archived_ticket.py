@@ -0,0 +1,48 @@
+from django.contrib.auth import get_user_model
+from django.db.utils import IntegrityError
+from django.test import TestCase
+from django.utils import timezone
+
+from tickets.models import ArchivedTicket, ArchivedTicketAssigned, ArchivedTicketMessage, Department
+
+User = get_user_model()
+
+
+class ArchivedTicketModelTests(TestCase):
+    """Tests for the archive models."""
+
+    def setUp(self):
+        """Create an archived ticket as the archiver would, keeping its live id."""
+        self.user = User.objects.create_user(
+            username='archivemodel',
+            password='password123',
+            email='archivemodel@example.com',
+            first_name='Arch',
+            last_name='Ive'
+        )
+        now = timezone.now()
+        self.ticket = ArchivedTicket.objects.create(
+            id=42, title="Old printer", created_by=self.user, created_at=now, updated_at=now
+        )
+        self.department = Department.objects.create(name="IT Support", created_by=self.user)
+
+    def test_defaults_and_str_representation(self):
+        """Archived tickets are closed, stamped when archived, and say so in their name."""
+        self.assertEqual(self.ticket.get_status_display(), "Closed")
+        self.assertIsNotNone(self.ticket.archived_at)
+        self.assertEqual(str(self.ticket), "#42 - Old printer (archived)")
+
+    def test_children_str_representation(self):
+        """Archived messages and assignments name their ticket."""
+        message = ArchivedTicketMessage.objects.create(
+            id=7, ticket=self.ticket, sender=self.user, body="Fixed", timestamp=timezone.now()
+        )
+        assignment = ArchivedTicketAssigned.objects.create(id=3, ticket=self.ticket, department=self.department)
+        self.assertEqual(str(message), f"Archived message 7 for Ticket 42 by User {self.user.id}")
+        self.assertEqual(str(assignment), "Archived assignment: Ticket #42 -> IT Support")
+
+    def test_assignment_uniqueness(self):
+        """A ticket is assigned to a department at most once, as in the live table."""
+        ArchivedTicketAssigned.objects.create(id=1, ticket=self.ticket, department=self.department)
+        with self.assertRaises(IntegrityError):
+            ArchivedTicketAssigned.objects.create(id=2, ticket=self.ticket, department=self.department)
@@ -1,6 +1,6 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from tickets.models import Ticket
+from tickets.models import Ticket, TicketMessage
 
 User = get_user_model()
 
@@ -60,4 +60,28 @@ class TicketModelTests(TestCase):
         user_tickets = self.user.tickets_created.all()
         
         self.assertIn(self.ticket, user_tickets)
-        self.assertEqual(user_tickets.count(), 1)
\ No newline at end of file
+        self.assertEqual(user_tickets.count(), 1)
+
+    def test_stale_instance_save_keeps_signal_maintained_fields(self):
+        """Saving a ticket loaded before a reply does not write back its old latest message or wait."""
+        stale = Ticket.objects.get(pk=self.ticket.pk)
+        message = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="Still broken")
+        stale.status = Ticket.Status.PENDING
+        stale.save()
+        saved = Ticket.objects.get(pk=self.ticket.pk)
+        self.assertEqual((saved.status, saved.last_message_id), (Ticket.Status.PENDING, message.pk))
+        self.assertEqual(saved.awaiting_staff_since, message.timestamp)
+
+    def test_named_update_fields_and_status_changes_still_write_them(self):
+        """Fields named in update_fields are written, and closing clears the wait."""
+        message = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="Help")
+        stale = Ticket.objects.get(pk=self.ticket.pk)
+        stale.last_message = None
+        stale.save(update_fields=["last_message"])
+        self.assertIsNone(Ticket.objects.get(pk=self.ticket.pk).last_message_id)
+        stale.status = Ticket.Status.CLOSED
+        stale.save()
+        self.assertIsNone(Ticket.objects.get(pk=self.ticket.pk).awaiting_staff_since)
+        stale.status = Ticket.Status.OPEN
+        stale.save()
+        self.assertEqual(Ticket.objects.get(pk=self.ticket.pk).awaiting_staff_since, message.timestamp)
@@ -1,6 +1,7 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from tickets.models import Ticket, TicketMessage
+from tickets.signals.awaiting_staff import awaiting_since
 
 User = get_user_model()
 
@@ -44,4 +45,162 @@ class TicketMessageModelTests(TestCase):
         
         messages = list(TicketMessage.objects.all())
         self.assertEqual(messages[0], m2)
-        self.assertEqual(messages[1], m1)
\ No newline at end of file
+        self.assertEqual(messages[1], m1)
+
+    def test_str_does_not_load_relations(self):
+        """The string representation uses the foreign key ids without querying."""
+        TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="Lazy")
+        message = TicketMessage.objects.get()
+        with self.assertNumQueries(0):
+            str(message)
+
+class TicketLatestMessageTests(TestCase):
+    """Tests for the Ticket.last_message pointer maintained by signals."""
+
+    def setUp(self):
+        """Set up a user and a ticket for testing."""
+        self.user = User.objects.create_user(
+            username='latestuser',
+            password='password123',
+            email='latest@example.com',
+            first_name='Latest',
+            last_name='Sender'
+        )
+        self.ticket = Ticket.objects.create(title="Pointer Ticket", created_by=self.user)
+
+    def _pointer(self):
+        """Return the ticket's current last_message_id from the database."""
+        self.ticket.refresh_from_db()
+        return self.ticket.last_message_id
+
+    def test_ticket_without_messages_has_no_pointer(self):
+        """A fresh ticket does not point at any message."""
+        self.assertIsNone(self._pointer())
+
+    def test_new_message_becomes_latest(self):
+        """Each newly created message becomes the ticket's latest message."""
+        m1 = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="First")
+        self.assertEqual(self._pointer(), m1.id)
+        m2 = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="Second")
+        self.assertEqual(self._pointer(), m2.id)
+
+    def test_editing_message_keeps_pointer(self):
+        """Saving an existing message does not move the pointer."""
+        m1 = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="First")
+        m2 = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="Second")
+        m1.body = "Edited"
+        m1.save()
+        self.assertEqual(self._pointer(), m2.id)
+
+    def test_deleting_older_message_keeps_pointer(self):
+        """Deleting a message that is not the latest leaves the pointer alone."""
+        m1 = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="First")
+        m2 = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="Second")
+        m1.delete()
+        self.assertEqual(self._pointer(), m2.id)
+
+    def test_deleting_latest_falls_back_to_previous(self):
+        """Deleting the latest message points the ticket at the next most recent one."""
+        m1 = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="First")
+        m2 = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="Second")
+        m2.delete()
+        self.assertEqual(self._pointer(), m1.id)
+
+    def test_deleting_only_message_clears_pointer(self):
+        """Deleting the last remaining message clears the pointer."""
+        TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="Only").delete()
+        self.assertIsNone(self._pointer())
+
+    def test_deleting_ticket_with_messages_succeeds(self):
+        """Cascading a ticket delete through its messages does not trip the pointer."""
+        TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="First")
+        self.ticket.delete()
+        self.assertFalse(Ticket.objects.exists())
+        self.assertFalse(TicketMessage.objects.exists())
+
+
+class TicketAwaitingStaffTests(TestCase):
+    """Tests for the Ticket.awaiting_staff_since timestamp maintained by signals."""
+
+    def setUp(self):
+        """Set up a customer, a staff member and an open ticket."""
+        self.user = User.objects.create_user(
+            username='waitinguser',
+            password='password123',
+            email='waiting@example.com',
+            first_name='Waiting',
+            last_name='Customer'
+        )
+        self.staff = User.objects.create_user(
+            username='waitingstaff',
+            password='password123',
+            email='waitingstaff@example.com',
+            first_name='Waiting',
+            last_name='Staff',
+            is_staff=True
+        )
+        self.ticket = Ticket.objects.create(title="Waiting Ticket", created_by=self.user)
+
+    def _waiting(self):
+        """Return the ticket's current awaiting_staff_since from the database."""
+        self.ticket.refresh_from_db()
+        return self.ticket.awaiting_staff_since
+
+    def _post(self, sender, body="Hi"):
+        """Post a message to the ticket."""
+        return TicketMessage.objects.create(ticket=self.ticket, sender=sender, body=body)
+
+    def test_first_customer_message_starts_the_wait(self):
+        """The oldest unanswered customer message marks when waiting began."""
+        first = self._post(self.user)
+        self._post(self.user, "Anyone?")
+        self.assertEqual(self._waiting(), first.timestamp)
+
+    def test_staff_reply_clears_and_next_message_restarts(self):
+        """A staff reply ends the wait; the customer's next message starts a new one."""
+        self._post(self.user)
+        self._post(self.staff)
+        self.assertIsNone(self._waiting())
+        again = self._post(self.user, "Still broken")
+        self.assertEqual(self._waiting(), again.timestamp)
+
+    def test_closed_tickets_are_not_waiting(self):
+        """Closing clears the wait and later messages do not restart it."""
+        self._post(self.user)
+        self.ticket.status = Ticket.Status.CLOSED
+        self.ticket.save()
+        self.assertIsNone(self._waiting())
+        self._post(self.user, "Thanks")
+        self.assertIsNone(self._waiting())
+
+    def test_reopening_restores_the_wait(self):
+        """Reopening waits again from the oldest unanswered message; a staff-answered ticket stays clear."""
+        first = self._post(self.user)
+        self._post(self.user, "Thanks")
+        self.ticket.status = Ticket.Status.CLOSED
+        self.ticket.save()
+        self.ticket.status = Ticket.Status.PENDING
+        self.ticket.save()
+        self.assertEqual(self._waiting(), first.timestamp)
+        self._post(self.staff)
+        self.ticket.status = Ticket.Status.CLOSED
+        self.ticket.save()
+        reloaded = Ticket.objects.get(pk=self.ticket.pk)
+        reloaded.status = Ticket.Status.OPEN
+        reloaded.save()
+        self.assertIsNone(self._waiting())
+
+    def test_deleting_staff_reply_restores_the_wait(self):
+        """Removing the only staff reply puts the ticket back to waiting on the first message."""
+        first = self._post(self.user)
+        self._post(self.staff).delete()
+        self.assertEqual(self._waiting(), first.timestamp)
+
+    def test_subquery_agrees_with_signals(self):
+        """Recomputing from the messages gives the value the signals maintained."""
+        self._post(self.user)
+        self._post(self.staff)
+        expected = self._post(self.user, "Follow-up").timestamp
+        self._post(self.user, "Hello?")
+        Ticket.objects.update(awaiting_staff_since=awaiting_since())
+        self.assertEqual(self._waiting(), expected)
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from django.db import DEFAULT_DB_ALIAS
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from tickets.models import Ticket
+from tickets.routers import ReplicaRouter, choose_replica, replica_reads, replica_view
+
+
+def row_from(alias):
+    """A stand-in model instance loaded from ``alias``."""
+    return SimpleNamespace(_state=SimpleNamespace(db=alias))
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaRouterTests(SimpleTestCase):
+    """Tests for ReplicaRouter and choosing a request's replica."""
+
+    router = ReplicaRouter()
+
+    def test_reads_use_the_replica_until_the_first_write(self):
+        """Outside a request everything uses the primary; inside, reads follow the replica until a write."""
+        self.assertEqual(self.router.db_for_read(Ticket), DEFAULT_DB_ALIAS)
+        with replica_reads("replica") as reads:
+            self.assertEqual(self.router.db_for_read(Ticket), "replica")
+            self.assertEqual(self.router.db_for_write(Ticket), DEFAULT_DB_ALIAS)
+            self.assertTrue(reads.wrote)
+            self.assertEqual(self.router.db_for_read(Ticket), DEFAULT_DB_ALIAS)
+        self.assertEqual(self.router.db_for_write(Ticket), DEFAULT_DB_ALIAS)
+
+    def test_replicas_are_never_migrated_but_may_be_related(self):
+        """Replicas get their schema from the primary; rows from any of them can be related."""
+        self.assertFalse(self.router.allow_migrate("replica", "tickets"))
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, "tickets"))
+        self.assertTrue(self.router.allow_relation(row_from("replica"), row_from(DEFAULT_DB_ALIAS)))
+        self.assertIsNone(self.router.allow_relation(row_from("other"), row_from(DEFAULT_DB_ALIAS)))
+
+    def test_only_unpinned_reads_of_listed_views_get_a_replica(self):
+        """Listed views and admin changelists read from a replica unless pinned, written to or unconfigured."""
+        factory = RequestFactory()
+        self.assertEqual(choose_replica(factory.get("/tickets/1/"), pinned=False), "replica")
+        self.assertEqual(choose_replica(factory.get("/tickets/1/"), pinned=True), DEFAULT_DB_ALIAS)
+        self.assertEqual(choose_replica(factory.post("/tickets/1/"), pinned=False), DEFAULT_DB_ALIAS)
+        self.assertEqual(choose_replica(factory.get("/login/"), pinned=False), DEFAULT_DB_ALIAS)
+        with override_settings(DATABASE_REPLICAS=[]):
+            self.assertEqual(choose_replica(factory.get("/tickets/1/"), pinned=False), DEFAULT_DB_ALIAS)
+        self.assertTrue(replica_view("/admin/tickets/ticket/"))
+        self.assertFalse(replica_view("/admin/tickets/ticket/1/change/"))
+        self.assertFalse(replica_view("/no/such/page/"))
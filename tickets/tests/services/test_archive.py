@@ -0,0 +1,102 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from tickets.models import (
+    ArchivedTicket, ArchivedTicketAssigned, ArchivedTicketMessage, Department, Ticket, TicketAssigned, TicketMessage,
+)
+from tickets.services.archive import archive_chunk, archive_tickets, read_through
+from tickets.services.dashboard_cache import dashboard_version
+from tickets.services.search import SEARCH_TABLE, _execute
+
+User = get_user_model()
+
+AGE = timedelta(days=90)
+
+
+class TicketArchiveTests(TestCase):
+    """Tests for moving long-closed tickets into the archive tables and reading them back."""
+
+    def setUp(self):
+        """Create a customer with an old closed ticket, a recent closed one and an old open one."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="archiveuser",
+            password="password123",
+            email="archive@example.com",
+            first_name="Archie",
+            last_name="Ved",
+        )
+        self.department = Department.objects.create(name="Facilities", created_by=self.user)
+        self.old = self._ticket("Old broken chair", Ticket.Status.CLOSED, days=120)
+        self.recent = self._ticket("Recent broken desk", Ticket.Status.CLOSED, days=10)
+        self.stale_open = self._ticket("Never answered", Ticket.Status.OPEN, days=120)
+
+    def _ticket(self, title, status, days):
+        """A ticket with two messages and an assignment, last updated ``days`` ago."""
+        ticket = Ticket.objects.create(title=title, created_by=self.user, status=status)
+        TicketMessage.objects.create(ticket=ticket, sender=self.user, body=f"{title}, first")
+        TicketMessage.objects.create(ticket=ticket, sender=self.user, body=f"{title}, second")
+        TicketAssigned.objects.create(ticket=ticket, department=self.department)
+        Ticket.objects.filter(pk=ticket.pk).update(updated_at=timezone.now() - timedelta(days=days))
+        ticket.refresh_from_db()
+        return ticket
+
+    def test_old_closed_tickets_move_with_their_rows(self):
+        """Only the long-closed ticket leaves the live tables, keeping its ids and columns."""
+        moved = archive_tickets(AGE, chunk_size=1)
+        self.assertEqual(moved, {"tickets_archivedticket": 1, "ticket_messages_archive": 2, "ticket_assigned_archive": 1})
+        self.assertFalse(Ticket.objects.filter(pk=self.old.pk).exists())
+        self.assertFalse(TicketMessage.objects.filter(ticket_id=self.old.pk).exists())
+        self.assertEqual(set(Ticket.objects.all()), {self.recent, self.stale_open})
+        archived = ArchivedTicket.objects.get(pk=self.old.pk)
+        self.assertEqual((archived.title, archived.updated_at), (self.old.title, self.old.updated_at))
+        self.assertEqual(archived.last_message.body, "Old broken chair, second")
+        self.assertEqual(ArchivedTicketMessage.objects.filter(ticket=archived).count(), 2)
+        self.assertEqual(ArchivedTicketAssigned.objects.get().department, self.department)
+
+    def test_archiving_drops_search_rows_and_refreshes_dashboards(self):
+        """Archived tickets leave the search index and their owners' cached dashboards."""
+        before = dashboard_version(self.user.pk)
+        archive_tickets(AGE, chunk_size=10)
+        indexed = {rowid for rowid, in _execute("default", f"SELECT rowid FROM {SEARCH_TABLE}")}
+        self.assertEqual(indexed, {self.recent.pk, self.stale_open.pk})
+        self.assertNotEqual(dashboard_version(self.user.pk), before)
+
+    def test_tickets_reopened_before_their_chunk_stay_live(self):
+        """Each chunk re-checks its tickets, so one reopened since selection is skipped."""
+        Ticket.objects.filter(pk=self.old.pk).update(status=Ticket.Status.OPEN)
+        moved = archive_chunk([self.old.pk], AGE)
+        self.assertEqual(sum(moved.values()), 0)
+        self.assertTrue(Ticket.objects.filter(pk=self.old.pk).exists())
+
+    def test_read_through_finds_archived_tickets_for_their_viewers(self):
+        """Live tickets come first, archived ones after; other customers see neither."""
+        archive_tickets(AGE, chunk_size=10)
+        self.assertEqual(read_through(self.user, self.recent.pk), self.recent)
+        self.assertIsInstance(read_through(self.user, self.old.pk), ArchivedTicket)
+        stranger = User.objects.create_user(username="stranger", password="password123", email="s@example.com")
+        self.assertIsNone(read_through(stranger, self.old.pk))
+        self.assertIsNone(read_through(self.user, 0))
+
+    def test_archived_threads_are_still_readable(self):
+        """The thread view pages archived messages like live ones."""
+        archive_tickets(AGE, chunk_size=10)
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("ticket_thread", args=[self.old.pk]))
+        self.assertContains(response, "Old broken chair, second")
+
+    def test_command_reports_rows_and_run_time(self):
+        """The command lists rows moved per table and the total with its run time."""
+        out = StringIO()
+        call_command("archive_tickets", days=90, chunk_size=1, stdout=out)
+        self.assertIn("ticket_messages_archive: 2 rows", out.getvalue())
+        self.assertRegex(out.getvalue(), r"Archived 4 rows in \d+\.\ds")
+        call_command("archive_tickets", days=1, stdout=out)
+        self.assertIn("tickets_archivedticket: 1 rows", out.getvalue())
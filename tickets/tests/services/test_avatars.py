@@ -0,0 +1,134 @@
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.template import engines
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from PIL import Image
+
+from tickets.services import avatars
+from tickets.services.avatars import content_hash, variant_name, variant_path, variants
+from tickets.services.dashboard_cache import dashboard_version
+
+User = get_user_model()
+
+
+def image_bytes(fmt="JPEG", mode="RGB", size=(300, 200), color="red"):
+    """Encode a solid-colour test picture."""
+    buffer = BytesIO()
+    Image.new(mode, size, color).save(buffer, fmt)
+    return buffer.getvalue()
+
+
+class AvatarTestCase(TestCase):
+    """Base for avatar tests: media goes to a throwaway directory."""
+
+    def setUp(self):
+        """Point MEDIA_ROOT at a temporary directory and create a user."""
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.user = self._user("avataruser")
+
+    def _user(self, username):
+        """Create a user named ``username``."""
+        return User.objects.create_user(
+            username=username,
+            password="password123",
+            email=f"{username}@example.com",
+            first_name="Ava",
+            last_name="Tar",
+        )
+
+    def upload(self, user, data, name="me.jpg"):
+        """Save ``data`` as ``user``'s profile picture."""
+        user.profile_picture = SimpleUploadedFile(name, data)
+        user.save()
+        return user
+
+
+class AvatarPipelineTests(AvatarTestCase):
+    """Tests for generating, deduplicating and backfilling avatar variants."""
+
+    def test_upload_generates_every_variant(self):
+        """Each configured size and format is stored under the picture's content hash."""
+        data = image_bytes()
+        self.upload(self.user, data)
+        self.assertEqual(self.user.avatar_hash, content_hash(data))
+        for size, fmt in variants():
+            with default_storage.open(variant_path(variant_name(self.user.avatar_hash, size, fmt))) as handle:
+                image = Image.open(handle)
+                self.assertEqual((image.size, image.format), ((size, size), fmt.upper()))
+        self.assertTrue(default_storage.exists(self.user.profile_picture.name))
+
+    def test_identical_pictures_are_encoded_once(self):
+        """A second upload of the same bytes reuses the stored variants."""
+        data = image_bytes()
+        self.upload(self.user, data)
+        with patch.object(avatars, "encode_variant") as encode:
+            other = self.upload(self._user("avatarother"), data, "copy.jpg")
+        encode.assert_not_called()
+        self.assertEqual(other.avatar_hash, self.user.avatar_hash)
+
+    def test_unchanged_pictures_are_not_reprocessed(self):
+        """Saves that keep the picture, or leave it out of update_fields, skip the pipeline."""
+        self.upload(self.user, image_bytes())
+        version = dashboard_version(self.user.pk)
+        with patch.object(avatars, "ensure_variants") as ensure:
+            self.user.save()
+            User.objects.get(pk=self.user.pk).save(update_fields=["last_login"])
+            User.objects.only("username").get(pk=self.user.pk).save()
+        ensure.assert_not_called()
+        self.assertEqual(dashboard_version(self.user.pk), version)
+
+    def test_changing_the_picture_refreshes_the_dashboard(self):
+        """A new or removed picture changes the hash and invalidates the owner's dashboard."""
+        self.upload(self.user, image_bytes())
+        version = dashboard_version(self.user.pk)
+        self.user.profile_picture = None
+        self.user.save()
+        self.assertEqual(self.user.avatar_hash, "")
+        self.assertNotEqual(dashboard_version(self.user.pk), version)
+
+    def test_transparency_is_flattened_onto_white(self):
+        """Transparent PNGs get a white background rather than a black one."""
+        self.upload(self.user, image_bytes("PNG", "RGBA", color=(0, 0, 0, 0)), "clear.png")
+        path = variant_path(variant_name(self.user.avatar_hash, 40, "jpeg"))
+        with default_storage.open(path) as handle:
+            self.assertGreater(min(Image.open(handle).convert("RGB").getpixel((20, 20))), 240)
+
+    def test_unreadable_pictures_get_no_avatar(self):
+        """Files Pillow cannot decode are logged and leave the avatar blank."""
+        with self.assertLogs("tickets.avatars", level="WARNING"):
+            self.upload(self.user, b"not an image", "broken.jpg")
+        self.assertEqual(self.user.avatar_hash, "")
+
+    def test_backfill_command(self):
+        """Stored pictures without avatars are processed in batches; --all re-checks the rest."""
+        for user in (self.user, self._user("avatarsecond"), self._user("avatarthird")):
+            self.upload(user, image_bytes(color="blue"))
+        User.objects.update(avatar_hash="")
+        out = StringIO()
+        call_command("backfill_avatars", batch_size=2, stdout=out)
+        self.assertEqual(set(User.objects.values_list("avatar_hash", flat=True)), {content_hash(image_bytes(color="blue"))})
+        self.assertIn("2 users, 0 variants encoded", out.getvalue())
+        call_command("backfill_avatars", all=True, stdout=out)
+        self.assertIn("Backfilled avatars for 3 users (0 variants encoded)", out.getvalue())
+
+    def test_avatar_tag(self):
+        """The tag offers WebP and JPEG with a 2x variant, or initials without a picture."""
+        render = engines["django"].from_string("{% load avatars %}{% avatar user 20 %}").render
+        self.assertIn(">AT</span>", render({"user": self.user}))
+        self.upload(self.user, image_bytes())
+        html = render({"user": self.user})
+        self.assertIn(f'type="image/webp" srcset="/avatars/{self.user.avatar_hash}-20.webp 1x, ', html)
+        self.assertIn('-40.jpg 2x"', html)
+        largest = engines["django"].from_string("{% load avatars %}{% avatar user 80 %}").render({"user": self.user})
+        self.assertNotIn(" 2x", largest)
@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from tickets.models import Ticket, TicketMessage
+from tickets.services.bulk import auto_timestamp_fields, chunked, preserve_auto_timestamps
+
+User = get_user_model()
+
+
+class BulkHelperTests(TestCase):
+    """Tests for the bulk-loading helpers."""
+
+    def setUp(self):
+        """Create a ticket owner."""
+        self.user = User.objects.create_user(
+            username="bulkuser",
+            password="password123",
+            email="bulk@example.com",
+            first_name="Bulk",
+            last_name="User",
+        )
+
+    def test_chunked_splits_into_bounded_lists(self):
+        """Items are yielded in order in lists no longer than the chunk size."""
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(chunked([], 3)), [])
+
+    def test_auto_timestamp_fields_finds_auto_fields(self):
+        """Only auto_now and auto_now_add fields are returned."""
+        names = {f.name for f in auto_timestamp_fields(Ticket, TicketMessage)}
+        self.assertEqual(names, {"created_at", "updated_at", "timestamp"})
+
+    def test_preserve_auto_timestamps_keeps_explicit_values(self):
+        """Bulk inserts inside the block keep the supplied timestamps."""
+        past = timezone.now() - timedelta(days=30)
+        with preserve_auto_timestamps(Ticket):
+            Ticket.objects.bulk_create([
+                Ticket(title="Old", created_by=self.user, created_at=past, updated_at=past)
+            ])
+        ticket = Ticket.objects.get(title="Old")
+        self.assertEqual((ticket.created_at, ticket.updated_at), (past, past))
+
+    def test_preserve_auto_timestamps_restores_flags(self):
+        """The auto flags come back afterwards, even if the block raises."""
+        with self.assertRaises(RuntimeError), preserve_auto_timestamps(Ticket):
+            raise RuntimeError
+        field = Ticket._meta.get_field("created_at")
+        self.assertTrue(field.auto_now_add)
+        self.assertTrue(Ticket._meta.get_field("updated_at").auto_now)
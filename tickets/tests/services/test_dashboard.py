@@ -0,0 +1,142 @@
+from base64 import urlsafe_b64encode
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from tickets.models import Ticket, TicketMessage
+from tickets.services.bulk import preserve_auto_timestamps
+from tickets.services.dashboard import (
+    adashboard_summary,
+    apaginate,
+    dashboard_summary,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    tab_counts,
+    tab_querysets,
+)
+
+User = get_user_model()
+
+
+class DashboardServiceTests(TestCase):
+    """Tests for the dashboard tab querysets, counts and keyset pagination."""
+
+    def setUp(self):
+        """Create a ticket owner and a staff member."""
+        self.user = User.objects.create_user(
+            username="dashuser",
+            password="password123",
+            email="dash@example.com",
+            first_name="Dash",
+            last_name="User",
+        )
+        self.staff = User.objects.create_user(
+            username="dashstaff",
+            password="password123",
+            email="dashstaff@example.com",
+            first_name="Dash",
+            last_name="Staff",
+            is_staff=True,
+        )
+
+    def _ticket(self, status=Ticket.Status.OPEN, days_since_message=None, sender=None):
+        """Create a ticket, optionally with one message backdated by some days."""
+        ticket = Ticket.objects.create(title="Ticket", created_by=self.user, status=status)
+        if days_since_message is not None:
+            stamp = timezone.now() - timedelta(days=days_since_message)
+            with preserve_auto_timestamps(TicketMessage):
+                TicketMessage.objects.create(ticket=ticket, sender=sender or self.user, body="Hi", timestamp=stamp)
+        return ticket
+
+    def test_cursor_round_trip(self):
+        """Encoding then decoding a cursor returns the ticket's sort key."""
+        ticket = self._ticket()
+        moment, pk = decode_cursor(encode_cursor(ticket, "updated_at"))
+        self.assertEqual((moment, pk), (ticket.updated_at, ticket.pk))
+
+    def test_decode_cursor_rejects_garbage(self):
+        """Malformed cursors raise ValueError."""
+        bad_timestamp = urlsafe_b64encode(b"yesterday|3").decode()
+        bad_id = urlsafe_b64encode(b"2026-01-01T00:00:00+00:00|x").decode()
+        for cursor in ("not base64!", bad_timestamp, bad_id):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+    def test_paginate_walks_every_ticket_once_in_order(self):
+        """Following cursors visits each ticket exactly once, newest first, even with ties."""
+        tickets = [self._ticket() for _ in range(5)]
+        Ticket.objects.update(updated_at=timezone.now())
+        qs = tab_querysets(self.user)["active"]
+        seen, cursor = [], None
+        while True:
+            page, cursor = paginate(qs, "active", cursor, size=2)
+            seen.extend(t.pk for t in page)
+            if cursor is None:
+                break
+        self.assertEqual(seen, sorted((t.pk for t in tickets), reverse=True))
+
+    def test_paginate_last_page_has_no_cursor(self):
+        """A page that reaches the end of the tab returns no next cursor."""
+        self._ticket()
+        page, cursor = paginate(tab_querysets(self.user)["active"], "active", size=1)
+        self.assertEqual(len(page), 1)
+        self.assertIsNone(cursor)
+
+    def test_overdue_tab_paginates_on_waiting_time(self):
+        """The overdue tab is ordered by, and paged on, when the customer started waiting."""
+        older = self._ticket(days_since_message=20)
+        newer = self._ticket(days_since_message=10)
+        qs = tab_querysets(self.user)["overdue"]
+        first, cursor = paginate(qs, "overdue", size=1)
+        second, end = paginate(qs, "overdue", cursor, size=1)
+        self.assertEqual([first[0].pk, second[0].pk, end], [newer.pk, older.pk, None])
+
+    def test_tab_counts_match_tab_querysets(self):
+        """The single aggregate agrees with the size of each tab's queryset."""
+        self._ticket()
+        self._ticket(days_since_message=1)
+        self._ticket(days_since_message=9)
+        self._ticket(status=Ticket.Status.PENDING, days_since_message=9, sender=self.staff)
+        self._ticket(status=Ticket.Status.CLOSED, days_since_message=30)
+        expected = {name: qs.count() for name, qs in tab_querysets(self.user).items()}
+        with self.assertNumQueries(1):
+            counts = tab_counts(self.user)
+        self.assertEqual(counts, expected)
+        self.assertEqual(counts, {"active": 3, "overdue": 1, "completed": 1})
+
+    def test_overdue_logic_is_not_nested_as_a_subquery(self):
+        """Tab querysets classify tickets with one CASE instead of an id__in subquery."""
+        sql = str(tab_querysets(self.user)["active"].query)
+        self.assertIn("CASE WHEN", sql)
+        self.assertNotIn("IN (SELECT", sql)
+
+    def test_tickets_outside_known_statuses_fall_in_no_tab(self):
+        """A ticket with an unexpected status is counted in no tab, as before."""
+        Ticket.objects.create(title="Odd", created_by=self.user, status="archived")
+        self.assertEqual(tab_counts(self.user), {"active": 0, "overdue": 0, "completed": 0})
+
+    async def test_async_summary_matches_sync(self):
+        """The async ORM builds the same dashboard data as the sync path."""
+        for days in (None, 1, 20):
+            await self._aticket(days)
+        expected = await sync_to_async(dashboard_summary)(self.user)
+        self.assertEqual(await adashboard_summary(self.user), expected)
+
+    async def test_async_paginate_follows_cursors(self):
+        """Async pages continue from the cursor exactly like sync ones."""
+        for _ in range(3):
+            await self._aticket()
+        qs = tab_querysets(self.user)["active"]
+        first, cursor = await apaginate(qs, "active", size=2)
+        rest, end = await apaginate(qs, "active", cursor, size=2)
+        self.assertEqual(first + rest, (await sync_to_async(paginate)(qs, "active", size=3))[0])
+        self.assertIsNone(end)
+
+    async def _aticket(self, days_since_message=None):
+        """Async wrapper around ``_ticket``."""
+        return await sync_to_async(self._ticket)(days_since_message=days_since_message)
+
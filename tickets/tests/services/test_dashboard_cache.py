@@ -0,0 +1,120 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from tickets.models import Department, Ticket, TicketAssigned, TicketMessage
+from tickets.services.dashboard import dashboard_summary
+from tickets.signals.dashboard_cache import invalidate_for_ticket_child
+from tickets.services.dashboard_cache import (
+    VERSION_KEY,
+    acached_dashboard,
+    bump_dashboard_version,
+    cache_timeout,
+    cached_dashboard,
+    dashboard_cache_stats,
+    dashboard_version,
+)
+
+User = get_user_model()
+
+
+@override_settings(DASHBOARD_CACHE_TIMEOUT=300)
+class DashboardCacheTests(TestCase):
+    """Tests for the versioned per-user dashboard cache."""
+
+    def setUp(self):
+        """Start from an empty cache with one ticket owner."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="cacheuser",
+            password="password123",
+            email="cache@example.com",
+            first_name="Cache",
+            last_name="User",
+        )
+
+    def test_bump_moves_to_a_new_version(self):
+        """Bumping changes the version, even after the version key was evicted."""
+        first = dashboard_version(self.user.pk)
+        bump_dashboard_version(self.user.pk)
+        self.assertNotEqual(dashboard_version(self.user.pk), first)
+        cache.delete(VERSION_KEY.format(user_id=self.user.pk))
+        bump_dashboard_version(self.user.pk)
+        self.assertIsNotNone(cache.get(VERSION_KEY.format(user_id=self.user.pk)))
+
+    def test_hits_and_misses_are_counted(self):
+        """The first lookup builds and misses; the second is served from the cache."""
+        build = Mock(return_value={"next_overdue_at": None})
+        cached_dashboard(self.user, build)
+        cached_dashboard(self.user, build)
+        build.assert_called_once_with(self.user)
+        self.assertEqual(dashboard_cache_stats(), {"hits": 1, "misses": 1})
+
+    async def test_async_lookups_share_the_cache(self):
+        """The async cache path reads what the sync one stored and counts its hits and misses."""
+        build = AsyncMock(return_value={"next_overdue_at": None})
+        await acached_dashboard(self.user, build)
+        await acached_dashboard(self.user, build)
+        build.assert_awaited_once_with(self.user)
+        self.assertEqual(await sync_to_async(cached_dashboard)(self.user, Mock()), {"next_overdue_at": None})
+        self.assertEqual(await sync_to_async(dashboard_cache_stats)(), {"hits": 2, "misses": 1})
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+    def test_cache_that_stores_nothing_still_builds(self):
+        """With a dummy cache every lookup builds, and the hit/miss counters are skipped."""
+        build = Mock(return_value={"next_overdue_at": None})
+        cached_dashboard(self.user, build)
+        cached_dashboard(self.user, build)
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual(dashboard_cache_stats(), {"hits": 0, "misses": 0})
+
+    def test_timeout_defaults_to_setting(self):
+        """With nothing about to turn overdue the configured TTL is used."""
+        self.assertEqual(cache_timeout(None), 300)
+        self.assertEqual(cache_timeout(timezone.now() + timedelta(days=1)), 300)
+
+    def test_timeout_stops_at_next_overdue_ticket(self):
+        """Entries expire when the next ticket crosses the overdue cutoff."""
+        self.assertLessEqual(cache_timeout(timezone.now() + timedelta(seconds=30)), 30)
+        self.assertEqual(cache_timeout(timezone.now() - timedelta(seconds=5)), 1)
+
+    def test_summary_reports_when_next_ticket_turns_overdue(self):
+        """The summary carries the moment the oldest unanswered active ticket goes overdue."""
+        ticket = Ticket.objects.create(title="Waiting", created_by=self.user)
+        msg = TicketMessage.objects.create(ticket=ticket, sender=self.user, body="Hello?")
+        summary = dashboard_summary(self.user)
+        self.assertEqual(summary["next_overdue_at"], msg.timestamp + timedelta(days=7))
+
+    def _assert_invalidates(self, action):
+        """Assert that running ``action`` changes the user's dashboard version, but only once it commits."""
+        before = dashboard_version(self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            action()
+            self.assertEqual(dashboard_version(self.user.pk), before)
+        self.assertNotEqual(dashboard_version(self.user.pk), before)
+
+    def test_ticket_message_and_assignment_changes_invalidate(self):
+        """Saving or deleting tickets, messages and assignments bumps the owner's version."""
+        ticket = Ticket.objects.create(title="T", created_by=self.user)
+        dept = Department.objects.create(name="IT", created_by=self.user)
+        self._assert_invalidates(ticket.save)
+        msg = TicketMessage(ticket=ticket, sender=self.user, body="Hi")
+        self._assert_invalidates(msg.save)
+        self._assert_invalidates(msg.delete)
+        assignment = TicketAssigned(ticket=ticket, department=dept)
+        self._assert_invalidates(assignment.save)
+        self._assert_invalidates(assignment.delete)
+        self._assert_invalidates(ticket.delete)
+
+    def test_orphaned_child_does_not_fail(self):
+        """A child whose ticket is already gone bumps nobody's version."""
+        before = dashboard_version(self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            invalidate_for_ticket_child(TicketMessage, TicketMessage(ticket_id=999999), using="default")
+        self.assertEqual(callbacks, [])
+        self.assertEqual(dashboard_version(self.user.pk), before)
@@ -0,0 +1,157 @@
+import asyncio
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+
+from tickets.models import Department, Ticket, TicketAssigned, TicketMessage
+from tickets.services import events
+from tickets.services.events import (
+    Broker,
+    EventStream,
+    LocalBroker,
+    department_channel,
+    format_event,
+    get_broker,
+    next_frame,
+    ticket_audience,
+    user_channel,
+)
+
+User = get_user_model()
+
+
+async def subscribe(broker, channels):
+    """Subscribe on the running loop, for use with ``asyncio.run``."""
+    return broker.subscribe(channels)
+
+
+class BrokerTests(TestCase):
+    """Tests for the in-process event broker and its subscriptions."""
+
+    async def test_publish_fans_out_once_per_subscriber(self):
+        """A subscriber on several matching channels still gets each event once."""
+        broker = LocalBroker()
+        both = broker.subscribe(["a", "b"])
+        other = broker.subscribe(["c"])
+        broker.publish(["a", "b"], {"n": 1})
+        self.assertEqual(await both.get(1), {"n": 1})
+        await asyncio.sleep(0)
+        self.assertTrue(both.queue.empty())
+        self.assertTrue(other.queue.empty())
+
+    async def test_slow_subscribers_drop_the_oldest_events(self):
+        """A full queue discards its oldest event to make room."""
+        broker = LocalBroker(queue_size=2)
+        subscription = broker.subscribe(["a"])
+        for n in range(3):
+            broker.publish(["a"], n)
+        await asyncio.sleep(0)
+        self.assertEqual([await subscription.get(1), await subscription.get(1)], [1, 2])
+        self.assertEqual(subscription.dropped, 1)
+
+    async def test_closing_removes_empty_channels(self):
+        """Closed subscriptions stop receiving and leave no empty channels behind."""
+        broker = LocalBroker()
+        first = broker.subscribe(["a", "b"])
+        second = broker.subscribe(["b"])
+        first.close()
+        self.assertEqual(dict(broker.subscribers), {"b": {second}})
+
+    def test_subscriptions_on_a_closed_loop_are_dropped(self):
+        """Publishing to a subscription whose event loop has gone away unsubscribes it."""
+        broker = LocalBroker()
+        asyncio.run(subscribe(broker, ["a"]))
+        broker.publish(["a"], {})
+        self.assertEqual(dict(broker.subscribers), {})
+
+    def test_broker_interface_and_configured_backend(self):
+        """A broker missing any method cannot be created; the configured backend is a shared instance."""
+        methods = {"publish": lambda self, channels, event: None, "subscribe": lambda self, channels: None}
+        with self.assertRaises(TypeError):
+            Broker()
+        with self.assertRaisesMessage(TypeError, "unsubscribe"):
+            type("PartialBroker", (Broker,), methods)()
+        self.assertIsInstance(get_broker(), LocalBroker)
+        self.assertIs(get_broker(), get_broker())
+
+
+class StreamTests(TestCase):
+    """Tests for turning subscriptions into Server-Sent Events frames."""
+
+    def test_format_event(self):
+        """Events become a named frame with a JSON data line."""
+        frame = format_event({"type": "status", "ticket": 3})
+        self.assertEqual(frame, 'event: status\ndata: {"type": "status", "ticket": 3}\n\n')
+
+    async def test_keepalive_after_silence(self):
+        """An idle stream sends a comment frame instead of waiting forever."""
+        subscription = LocalBroker().subscribe(["a"])
+        self.assertEqual(await next_frame(subscription, 0.01), ": keepalive\n\n")
+
+    async def test_event_stream_frames_and_close(self):
+        """The stream opens with a reconnect hint, relays events and unsubscribes on close."""
+        broker = LocalBroker()
+        stream = EventStream(broker.subscribe(["a"]))
+        frames = aiter(stream)
+        self.assertTrue((await anext(frames)).startswith("retry: 5000\n"))
+        broker.publish(["a"], {"type": "message"})
+        self.assertEqual(await anext(frames), 'event: message\ndata: {"type": "message"}\n\n')
+        await frames.aclose()
+        stream.close()
+        self.assertEqual(dict(broker.subscribers), {})
+
+
+class TicketEventTests(TestCase):
+    """Tests for publishing ticket messages and status changes to their audience."""
+
+    def setUp(self):
+        """Create a customer's ticket assigned to one department."""
+        self.user = User.objects.create_user(
+            username="eventsuser",
+            password="password123",
+            email="events@example.com",
+            first_name="Events",
+            last_name="User",
+        )
+        self.ticket = Ticket.objects.create(title="Live", created_by=self.user)
+        self.department = Department.objects.create(name="Support", created_by=self.user)
+        TicketAssigned.objects.create(ticket=self.ticket, department=self.department)
+        self.audience = [user_channel(self.user.pk), department_channel(self.department.pk)]
+
+    def published(self, action):
+        """Run ``action`` and commit, returning the (channels, event) pairs published."""
+        with patch.object(events, "get_broker") as broker:
+            with self.captureOnCommitCallbacks(execute=True):
+                action()
+        return [c.args for c in broker.return_value.publish.call_args_list]
+
+    def test_audience_is_owner_and_departments(self):
+        """A ticket's events go to its owner and to each department it is assigned to."""
+        self.assertEqual(ticket_audience(self.ticket.pk), self.audience)
+        with self.assertNumQueries(1):
+            self.assertEqual(ticket_audience(self.ticket.pk, self.user.pk), self.audience)
+        self.assertEqual(ticket_audience(0), [])
+
+    def test_new_messages_are_published_after_commit(self):
+        """Posting a message publishes it, with a cursor for fetching the thread."""
+        [(channels, event)] = self.published(
+            lambda: TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="Hi")
+        )
+        self.assertEqual(channels, self.audience)
+        self.assertEqual((event["type"], event["ticket"], event["body"]), ("message", self.ticket.pk, "Hi"))
+        self.assertTrue(event["cursor"])
+
+    def test_status_changes_are_published(self):
+        """Changing the status publishes the old and new status; other saves do not."""
+        self.ticket.status = Ticket.Status.CLOSED
+        [(channels, event)] = self.published(self.ticket.save)
+        self.assertEqual(channels, self.audience)
+        self.assertEqual((event["status"], event["previous"]), ("closed", "open"))
+        self.assertEqual(self.published(self.ticket.save), [])
+
+    def test_unknown_previous_status_is_not_published(self):
+        """Tickets loaded without their status cannot tell whether it changed."""
+        ticket = Ticket.objects.only("title").get(pk=self.ticket.pk)
+        ticket.status = Ticket.Status.PENDING
+        self.assertEqual(self.published(ticket.save), [])
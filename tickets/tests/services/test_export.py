@@ -0,0 +1,99 @@
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from tickets.models import Department, Ticket, TicketAssigned, TicketMessage
+from tickets.services.archive import archive_tickets
+from tickets.services.export import export_filename, export_stream, keyset_batches
+
+User = get_user_model()
+
+
+def read(dataset, fmt, batch_size=2, compress=False):
+    """A whole export as text."""
+    data = b"".join(export_stream(dataset, fmt, batch_size, compress))
+    return (gzip.decompress(data) if compress else data).decode()
+
+
+class ExportTests(TestCase):
+    """Tests for streaming table exports."""
+
+    def setUp(self):
+        """Create five tickets, one with a message and an assignment."""
+        self.user = User.objects.create_user(
+            username="exportuser",
+            password="password123",
+            email="export@example.com",
+            first_name="Ex",
+            last_name="Porter",
+        )
+        self.tickets = [Ticket.objects.create(title=f"Ticket {i}", created_by=self.user) for i in range(5)]
+        TicketMessage.objects.create(ticket=self.tickets[0], sender=self.user, body='Says "hi",\nthen leaves')
+        department = Department.objects.create(name="IT", created_by=self.user)
+        TicketAssigned.objects.create(ticket=self.tickets[0], department=department)
+
+    def test_rows_are_read_in_bounded_keyset_batches(self):
+        """Each batch is one query of at most batch_size rows; an empty one ends the walk."""
+        with self.assertNumQueries(4):
+            batches = list(keyset_batches(Ticket, ("id", "title"), 2))
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual([row[0] for batch in batches for row in batch], [t.pk for t in self.tickets])
+
+    def test_csv_has_a_header_and_quotes_awkward_values(self):
+        """CSV exports start with the column names and round-trip commas, quotes and newlines."""
+        rows = list(csv.reader(io.StringIO(read("messages", "csv"))))
+        self.assertEqual(rows[0], ["id", "ticket_id", "sender_id", "timestamp", "body"])
+        self.assertEqual(rows[1][4], 'Says "hi",\nthen leaves')
+        self.assertEqual(len(list(csv.reader(io.StringIO(read("tickets", "csv"))))), 6)
+
+    def test_jsonl_has_one_object_per_row(self):
+        """JSON Lines exports key every value by column, with ISO timestamps."""
+        lines = [json.loads(line) for line in read("tickets", "jsonl").splitlines()]
+        self.assertEqual([line["title"] for line in lines], [f"Ticket {i}" for i in range(5)])
+        self.assertEqual(lines[0]["created_by_id"], self.user.pk)
+        self.assertIn("T", lines[0]["created_at"])
+
+    def test_archived_rows_follow_the_live_ones(self):
+        """Tickets moved to the archive tables stay in every export, after the live rows."""
+        self.tickets[0].status = Ticket.Status.CLOSED
+        self.tickets[0].save()
+        archive_tickets(timedelta(0), chunk_size=10)
+        self.assertFalse(TicketMessage.objects.exists())
+        lines = [json.loads(line) for line in read("tickets", "jsonl").splitlines()]
+        self.assertEqual([line["id"] for line in lines], [t.pk for t in self.tickets[1:]] + [self.tickets[0].pk])
+        self.assertEqual(lines[-1]["status"], "closed")
+        self.assertIn("then leaves", read("messages", "csv"))
+        self.assertEqual(len(read("assignments", "jsonl").splitlines()), 1)
+
+    def test_gzip_is_compressed_on_the_fly(self):
+        """Gzipped exports decompress to the plain export."""
+        self.assertEqual(read("assignments", "jsonl", compress=True), read("assignments", "jsonl"))
+        self.assertEqual(export_filename("messages", "csv", compress=True), "messages.csv.gz")
+
+    def test_command_writes_the_export_to_a_file(self):
+        """The command streams to --output, or to <dataset>.<format>[.gz] in the working directory."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(os.rmdir, directory)
+        path = os.path.join(directory, "out.jsonl.gz")
+        out = StringIO()
+        call_command("export_tickets", "tickets", format="jsonl", gzip=True, output=path, batch_size=2, stdout=out)
+        with gzip.open(path, "rt") as export:
+            self.assertEqual(len(export.read().splitlines()), 5)
+        os.remove(path)
+        self.assertIn(f"bytes to {path}", out.getvalue())
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        os.chdir(directory)
+        call_command("export_tickets", "assignments", stdout=out)
+        self.assertEqual(Path("assignments.csv").read_text().splitlines()[0], "id,ticket_id,department_id")
+        os.remove("assignments.csv")
@@ -0,0 +1,120 @@
+import json
+import shutil
+import tempfile
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from tickets.management.commands.import_tickets import rate
+from tickets.models import Department, ImportCheckpoint, Ticket, TicketAssigned, TicketMessage
+from tickets.services.bulk import preserve_auto_timestamps
+from tickets.services.importer import checkpoint_for, import_tickets
+from tickets.services.search import search
+
+User = get_user_model()
+
+
+def record(title, **fields):
+    """One ticket as exported from another helpdesk."""
+    return {
+        "title": title,
+        "created_by": "importcustomer",
+        "created_at": "2024-03-01T09:00:00Z",
+        "messages": [
+            {"sender": "importcustomer", "body": f"{title}: help", "timestamp": "2024-03-01T09:00:00Z"},
+            {"sender": "importstaff", "body": f"{title}: on it", "timestamp": "2024-03-02T10:30:00Z"},
+        ],
+        "departments": ["IT Support", "IT Support"],
+        **fields,
+    }
+
+
+class TicketImportTests(TestCase):
+    """Tests for the JSON Lines ticket importer."""
+
+    def setUp(self):
+        """Create the users and department the records refer to, and a scratch directory."""
+        self.customer = User.objects.create_user(
+            username="importcustomer",
+            password="password123",
+            email="importcustomer@example.com",
+            first_name="Imp",
+            last_name="Orter",
+        )
+        self.staff = User.objects.create_user(
+            username="importstaff", password="password123", email="importstaff@example.com", is_staff=True
+        )
+        self.department = Department.objects.create(name="IT Support", created_by=self.staff)
+        directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        self.path = directory / "tickets.jsonl"
+
+    def write(self, *lines):
+        """Write records (or raw strings) to the import file, one per line."""
+        self.path.write_text("".join((line if isinstance(line, str) else json.dumps(line)) + "\n" for line in lines))
+
+    def run_import(self, batch_size=2, restart=False):
+        """Run the importer to completion, returning the final totals."""
+        with preserve_auto_timestamps(Ticket, TicketMessage):
+            return list(import_tickets(self.path, batch_size, checkpoint_for(self.path, restart)))[-1]
+
+    def test_records_become_tickets_with_their_rows_and_timestamps(self):
+        """Tickets, messages and assignments are inserted with the source's own times and derived fields."""
+        self.write(record("Printer jam", status="closed", updated_at="2024-03-03T08:00:00"), "", record("VPN down"))
+        totals = self.run_import()
+        self.assertEqual(totals, {"lines": 3, "tickets": 2, "messages": 4, "assignments": 2})
+        ticket = Ticket.objects.select_related("last_message").get(title="Printer jam")
+        self.assertEqual(ticket.created_at, datetime(2024, 3, 1, 9, tzinfo=dt_timezone.utc))
+        self.assertEqual(ticket.updated_at, datetime(2024, 3, 3, 8, tzinfo=dt_timezone.utc))
+        self.assertEqual(ticket.last_message.body, "Printer jam: on it")
+        self.assertEqual(TicketAssigned.objects.get(ticket=ticket).department, self.department)
+        open_ticket = Ticket.objects.get(title="VPN down")
+        self.assertEqual((open_ticket.status, open_ticket.updated_at), ("open", open_ticket.created_at))
+        self.assertIsNone(open_ticket.awaiting_staff_since)
+        self.assertEqual([t.title for t in search(self.customer, "printer")[0]], ["Printer jam"])
+
+    def test_import_resumes_after_the_last_committed_batch(self):
+        """A bad record stops the import after the batches before it; rerunning skips what was imported."""
+        self.write(record("One"), record("Two"), record("Three", created_by="nobody"))
+        with self.assertRaisesMessage(ValueError, "line 3: unknown user 'nobody'"):
+            self.run_import()
+        self.assertEqual(Ticket.objects.count(), 2)
+        self.assertEqual(str(ImportCheckpoint.objects.get()), f"{self.path} @ line 2")
+        self.write(record("One"), record("Two"), record("Three"), record("Four"))
+        self.assertEqual(self.run_import(), {"lines": 4, "tickets": 2, "messages": 4, "assignments": 2})
+        self.assertEqual(sorted(Ticket.objects.values_list("title", flat=True)), ["Four", "One", "Three", "Two"])
+        self.run_import(restart=True)
+        self.assertEqual(Ticket.objects.count(), 8)
+
+    def test_bad_records_name_their_line(self):
+        """Malformed JSON, missing fields and invalid values are reported with the line number."""
+        cases = {
+            "not json": "line 1: Expecting value",
+            json.dumps(["a list"]): "line 1: 'list' object has no attribute 'get'",
+            json.dumps({"title": "No owner"}): "line 1: missing field 'created_at'",
+            json.dumps(record("Odd", status="lost")): "line 1: invalid status 'lost'",
+            json.dumps(record("Late", created_at="yesterday")): "line 1: invalid timestamp 'yesterday'",
+            json.dumps(record("Lost", departments=["Nowhere"])): "line 1: unknown department 'Nowhere'",
+        }
+        for line, message in cases.items():
+            self.write(line)
+            with self.subTest(line=line), self.assertRaisesMessage(ValueError, message):
+                self.run_import(restart=True)
+        self.assertFalse(Ticket.objects.exists())
+
+    def test_command_reports_throughput_and_resumable_errors(self):
+        """The command prints rows per second, and on failure where a rerun will resume."""
+        self.write(record("One"), record("Two"), "{broken")
+        out = StringIO()
+        with self.assertRaisesMessage(CommandError, "rerun to resume after line 2."):
+            call_command("import_tickets", str(self.path), batch_size=2, stdout=out)
+        self.assertRegex(out.getvalue(), r"line 2: 2 tickets, 4 messages, 2 assignments \(\d+ rows/s\)")
+        self.write(record("One"), record("Two"), record("Three"))
+        call_command("import_tickets", str(self.path), stdout=out)
+        self.assertIn("Resuming after line 2", out.getvalue())
+        self.assertRegex(out.getvalue(), r"Imported 4 rows in \d+\.\ds \(\d+ rows/s\)")
+        self.assertEqual(rate(10, 0), 10)
@@ -0,0 +1,70 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from tickets.models import Ticket, TicketMessage
+from tickets.services.bulk import preserve_auto_timestamps
+from tickets.services.dashboard import overdue_cutoff
+from tickets.services.dashboard_cache import dashboard_version
+from tickets.services.overdue import newly_overdue, sweep_overdue
+
+User = get_user_model()
+
+
+class OverdueSweepTests(TestCase):
+    """Tests for finding tickets that have just crossed the overdue cutoff."""
+
+    def setUp(self):
+        """Create a customer and tickets waiting for various lengths of time."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="sweepuser",
+            password="password123",
+            email="sweep@example.com",
+            first_name="Sweep",
+            last_name="User",
+        )
+        cutoff = overdue_cutoff()
+        self.just_overdue = self._waiting(cutoff - timedelta(minutes=10))
+        self.long_overdue = self._waiting(cutoff - timedelta(days=3))
+        self.not_yet = self._waiting(cutoff + timedelta(minutes=10))
+
+    def _waiting(self, since):
+        """Create an open ticket whose customer has been waiting since ``since``."""
+        ticket = Ticket.objects.create(title="Waiting", created_by=self.user)
+        with preserve_auto_timestamps(TicketMessage):
+            TicketMessage.objects.create(ticket=ticket, sender=self.user, body="Any news?", timestamp=since)
+        return ticket
+
+    def test_only_tickets_crossing_within_the_window_are_found(self):
+        """Tickets overdue for longer than the window, or not yet overdue, are skipped."""
+        found = list(newly_overdue(timedelta(hours=1)))
+        self.assertEqual(found, [self.just_overdue])
+
+    @override_settings(TICKET_OVERDUE_AFTER=timedelta(days=1))
+    def test_cutoff_comes_from_settings(self):
+        """A shorter configured cutoff makes the same tickets overdue sooner."""
+        self.assertFalse(newly_overdue(timedelta(hours=1)).exists())
+        self.assertIn(self.not_yet, newly_overdue(timedelta(days=7)))
+
+    def test_sweep_refreshes_owner_dashboards(self):
+        """Owners of newly overdue tickets get their cached dashboard invalidated."""
+        before = dashboard_version(self.user.pk)
+        ids, owners = sweep_overdue(timedelta(hours=1))
+        self.assertEqual((ids, owners), ([self.just_overdue.pk], {self.user.pk}))
+        self.assertNotEqual(dashboard_version(self.user.pk), before)
+
+    def test_command_reports_newly_overdue_tickets(self):
+        """The command prints a summary, and the ticket ids when verbose."""
+        out = StringIO()
+        call_command("sweep_overdue", window=60, verbosity=2, stdout=out)
+        self.assertIn(f"#{self.just_overdue.pk}", out.getvalue())
+        self.assertIn("1 ticket(s) became overdue for 1 user(s).", out.getvalue())
+        quiet = StringIO()
+        call_command("sweep_overdue", window=1, stdout=quiet)
+        self.assertEqual(quiet.getvalue().strip(), "0 ticket(s) became overdue for 0 user(s).")
@@ -0,0 +1,141 @@
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from tickets.models import DepartmentDailyMetrics, Department, RollupClosure, RollupWatermark, Ticket, TicketAssigned, TicketMessage
+from tickets.services.archive import archive_tickets
+from tickets.services.rollups import department_report, rollup_metrics
+
+User = get_user_model()
+
+
+def at(day, hour):
+    """A moment in May 2024, UTC."""
+    return datetime(2024, 5, day, hour, tzinfo=dt_timezone.utc)
+
+
+def rollups():
+    """Every rollup row as (department, day, opened, closed, close hours, first replies, first reply hours)."""
+    return {
+        (row.department.name, row.day.day, row.opened, row.closed, row.close_time / timedelta(hours=1),
+         row.first_replies, row.first_reply_time / timedelta(hours=1))
+        for row in DepartmentDailyMetrics.objects.select_related("department")
+    }
+
+
+class DepartmentRollupTests(TestCase):
+    """Tests for the per department and day metric rollups."""
+
+    def setUp(self):
+        """Create a ticket answered and closed in IT, and a shared one answered a day after it was opened."""
+        self.customer = User.objects.create_user(
+            username="rollupcustomer",
+            password="password123",
+            email="rollupcustomer@example.com",
+            first_name="Rol",
+            last_name="Lup",
+        )
+        self.staff = User.objects.create_user(
+            username="rollupstaff", password="password123", email="rollupstaff@example.com", is_staff=True
+        )
+        self.it = Department.objects.create(name="IT Support", created_by=self.staff)
+        self.hr = Department.objects.create(name="HR", created_by=self.staff)
+        self.printer = self._ticket("Printer", [self.it], at(1, 9), [(self.customer, at(1, 9)), (self.staff, at(1, 11))])
+        self._stamp(self.printer, at(1, 9), at(2, 9), Ticket.Status.CLOSED)
+        self.laptop = self._ticket(
+            "Laptop", [self.it, self.hr], at(2, 10), [(self.customer, at(2, 10)), (self.staff, at(3, 10)), (self.staff, at(3, 12))]
+        )
+
+    def _ticket(self, title, departments, created_at, messages):
+        """A ticket in ``departments`` created at ``created_at`` with (sender, timestamp) messages."""
+        ticket = Ticket.objects.create(title=title, created_by=self.customer)
+        for sender, timestamp in messages:
+            message = TicketMessage.objects.create(ticket=ticket, sender=sender, body=title)
+            TicketMessage.objects.filter(pk=message.pk).update(timestamp=timestamp)
+        TicketAssigned.objects.bulk_create(TicketAssigned(ticket=ticket, department=d) for d in departments)
+        return self._stamp(ticket, created_at, created_at, Ticket.Status.OPEN)
+
+    def _stamp(self, ticket, created_at, updated_at, status):
+        """Set a ticket's times and status as if it had lived through them."""
+        Ticket.objects.filter(pk=ticket.pk).update(created_at=created_at, updated_at=updated_at, status=status)
+        return ticket
+
+    def test_first_run_rolls_up_every_day(self):
+        """Openings, first staff replies and closures land on their department and day; reruns change nothing."""
+        self.assertEqual(rollup_metrics(chunk_days=2), {"days": 3, "rows": 5})
+        expected = {
+            ("IT Support", 1, 1, 0, 0, 1, 2),
+            ("IT Support", 2, 1, 1, 24, 0, 0),
+            ("HR", 2, 1, 0, 0, 0, 0),
+            ("IT Support", 3, 0, 0, 0, 1, 24),
+            ("HR", 3, 0, 0, 0, 1, 24),
+        }
+        self.assertEqual(rollups(), expected)
+        last = TicketMessage.objects.order_by("-pk").first()
+        self.assertEqual(str(RollupWatermark.objects.get()), f"department_daily @ message {last.pk}")
+        self.assertEqual(rollup_metrics(chunk_days=2), {"days": 0, "rows": 0})
+        self.assertEqual(rollup_metrics(chunk_days=2, full=True), {"days": 3, "rows": 5})
+        self.assertEqual(rollups(), expected)
+
+    def test_later_runs_recompute_only_touched_days(self):
+        """New messages and updates since the watermark recompute their days; archived tickets still count."""
+        rollup_metrics(chunk_days=31)
+        TicketMessage.objects.create(ticket=self.laptop, sender=self.staff, body="Fixed")
+        self.laptop.refresh_from_db()
+        self.laptop.status = Ticket.Status.CLOSED
+        self.laptop.save()
+        self.assertEqual(rollup_metrics(chunk_days=31)["days"], 3)
+        self.assertEqual(DepartmentDailyMetrics.objects.filter(day=timezone.localdate(), closed=1).count(), 2)
+        archive_tickets(timedelta(0), chunk_size=10)
+        self.assertFalse(Ticket.objects.exists())
+        before = rollups()
+        self.assertEqual(rollup_metrics(chunk_days=31, full=True)["days"], 4)
+        self.assertEqual(rollups(), before)
+
+    def _set_status(self, ticket, status):
+        """Change a ticket's status through a normal save, as staff would."""
+        ticket.refresh_from_db()
+        ticket.status = status
+        ticket.save()
+
+    def test_reopened_and_reclosed_tickets_are_counted_closed_once(self):
+        """A reopen uncounts the old close day; closing again counts only the new one."""
+        rollup_metrics(chunk_days=31)
+        self.assertEqual(str(RollupClosure.objects.get()), f"Ticket {self.printer.pk} closed on 2024-05-02")
+        self._set_status(self.printer, Ticket.Status.OPEN)
+        rollup_metrics(chunk_days=31)
+        self.assertEqual(DepartmentDailyMetrics.objects.get(department=self.it, day=date(2024, 5, 2)).closed, 0)
+        self.assertFalse(RollupClosure.objects.exists())
+        self._set_status(self.printer, Ticket.Status.CLOSED)
+        rollup_metrics(chunk_days=31)
+        it = {row["department"]: row for row in department_report(date(2024, 5, 1))}["IT Support"]
+        self.assertEqual((it["closed"], it["backlog"]), (1, 1))
+        self.assertEqual(RollupClosure.objects.get().day, timezone.localdate())
+
+    def test_full_rebuild_drops_stale_rows(self):
+        """A full rebuild starts from an empty table, so rows of days without events disappear."""
+        DepartmentDailyMetrics.objects.create(department=self.hr, day=date(2024, 5, 20), closed=4)
+        RollupClosure.objects.create(ticket_id=999, day=date(2024, 5, 20))
+        rollup_metrics(chunk_days=31, full=True)
+        self.assertFalse(DepartmentDailyMetrics.objects.filter(day=date(2024, 5, 20)).exists())
+        self.assertEqual(RollupClosure.objects.get().ticket_id, self.printer.pk)
+
+    def test_report_reads_totals_averages_and_backlog(self):
+        """The report sums the window's rollups per department and the backlog over all of them."""
+        rollup_metrics(chunk_days=31)
+        report = {row["department"]: row for row in department_report(date(2024, 5, 2))}
+        it, hr = report["IT Support"], report["HR"]
+        self.assertEqual((it["opened"], it["closed"], it["first_replies"]), (1, 1, 1))
+        self.assertEqual((it["close_hours"], it["first_reply_hours"], it["backlog"]), (24.0, 24.0, 1))
+        self.assertEqual((hr["opened"], hr["closed"], hr["close_hours"], hr["backlog"]), (1, 0, None, 1))
+        self.assertEqual(str(DepartmentDailyMetrics.objects.get(department=self.hr, day=date(2024, 5, 2))), "HR on 2024-05-02")
+
+    def test_command_reports_days_and_rows(self):
+        """The command prints what it recomputed and how long it took."""
+        out = StringIO()
+        call_command("rollup_metrics", "--full", stdout=out)
+        self.assertRegex(out.getvalue(), r"Rolled up 3 days into 5 rows in \d+\.\ds")
@@ -0,0 +1,163 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+
+from tickets.models import Ticket, TicketMessage
+from tickets.services import search as search_service
+from tickets.services.search import (
+    SEARCH_TABLE,
+    decode_search_cursor,
+    highlight,
+    match_expression,
+    search,
+)
+
+User = get_user_model()
+
+
+def indexed_ids():
+    """Return the ticket ids currently in the search index."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT rowid FROM {SEARCH_TABLE} ORDER BY rowid")
+        return [row[0] for row in cursor.fetchall()]
+
+
+class SearchServiceTests(TestCase):
+    """Tests for the FTS5-backed ticket search and its index maintenance."""
+
+    def setUp(self):
+        """Create a customer, another customer and a staff member with a few tickets."""
+        self.user = self._user("searchuser")
+        self.other = self._user("otheruser")
+        self.staff = self._user("searchstaff", is_staff=True)
+        self.printer = Ticket.objects.create(title="Printer jammed", created_by=self.user)
+        self.wifi = Ticket.objects.create(title="Wi-Fi down", created_by=self.user)
+        TicketMessage.objects.create(ticket=self.wifi, sender=self.user, body="The printer is fine, but no wifi.")
+        self.foreign = Ticket.objects.create(title="Printer toner", created_by=self.other)
+
+    def _user(self, username, **extra):
+        """Create a user named ``username``."""
+        return User.objects.create_user(
+            username=username,
+            password="password123",
+            email=f"{username}@example.com",
+            first_name="Search",
+            last_name="User",
+            **extra,
+        )
+
+    def ids(self, user, query, **kwargs):
+        """Ids of the first page of results for ``query``."""
+        return [t.pk for t in search(user, query, **kwargs)[0]]
+
+    @override_settings(SEARCH_INDEX_MESSAGES=1)
+    def test_only_the_newest_messages_are_indexed(self):
+        """Long threads index their newest SEARCH_INDEX_MESSAGES bodies only."""
+        TicketMessage.objects.create(ticket=self.printer, sender=self.staff, body="Cleared the jam")
+        self.assertEqual(self.ids(self.user, "jam"), [self.printer.pk])
+        self.assertEqual(self.ids(self.user, "cleared"), [self.printer.pk])
+        self.assertEqual(self.ids(self.user, "wifi"), [self.wifi.pk])
+        TicketMessage.objects.create(ticket=self.wifi, sender=self.staff, body="Router rebooted")
+        self.assertEqual(self.ids(self.user, "wifi"), [])
+
+    def test_title_matches_outrank_body_matches(self):
+        """A hit in the title ranks above one buried in a message body."""
+        self.assertEqual(self.ids(self.user, "printer"), [self.printer.pk, self.wifi.pk])
+
+    def test_results_are_scoped_to_the_user(self):
+        """Customers only find their own tickets; staff find everyone's."""
+        self.assertNotIn(self.foreign.pk, self.ids(self.user, "toner printer"))
+        self.assertEqual(self.ids(self.staff, "toner"), [self.foreign.pk])
+
+    def test_stemming_and_prefix_matching(self):
+        """Word forms match through the porter stemmer and the last term is a prefix."""
+        self.assertEqual(self.ids(self.user, "jamming"), [self.printer.pk])
+        self.assertEqual(self.ids(self.user, "pri"), [self.printer.pk, self.wifi.pk])
+
+    def test_blank_or_symbol_only_query_returns_nothing(self):
+        """Queries without any word characters short-circuit without a lookup."""
+        with self.assertNumQueries(0):
+            self.assertEqual(search(self.user, ' "*() '), ([], None))
+
+    def test_snippets_are_escaped_and_highlighted(self):
+        """Message matches come back with escaped, highlighted snippets."""
+        TicketMessage.objects.create(ticket=self.printer, sender=self.user, body="<b>paper</b> stuck")
+        result = search(self.user, "paper")[0][0]
+        self.assertEqual(result.snippet, "&lt;b&gt;<mark>paper</mark>&lt;/b&gt; stuck")
+        self.assertEqual(highlight("a\x02b\x03"), "a<mark>b</mark>")
+
+    def test_keyset_pages_cover_every_match_once(self):
+        """Following cursors walks all matches in rank order without repeats."""
+        for i in range(4):
+            Ticket.objects.create(title=f"Printer {i}", created_by=self.user)
+        first, cursor = search(self.user, "printer", size=3)
+        second, end = search(self.user, "printer", cursor, size=3)
+        self.assertIsNone(end)
+        seen = [t.pk for t in first + second]
+        self.assertEqual(sorted(seen), sorted(self.ids(self.user, "printer", size=10)))
+        self.assertEqual(len(seen), 6)
+        self.assertEqual([t.score for t in first + second], sorted(t.score for t in first + second))
+
+    def test_bad_cursor_raises_value_error(self):
+        """Malformed cursors are reported as ValueError."""
+        with self.assertRaises(ValueError):
+            search(self.user, "printer", cursor="garbage!")
+        self.assertEqual(decode_search_cursor("LTEuNXw3"), (-1.5, 7))
+
+    def test_match_expression_quotes_terms(self):
+        """Each term is quoted and the last one is a prefix."""
+        self.assertEqual(match_expression(["wifi", "down"]), '"wifi" "down"*')
+
+    def test_index_follows_edits_and_deletes(self):
+        """Renaming, new messages and deletes keep the index current."""
+        self.printer.title = "Scanner jammed"
+        self.printer.save()
+        self.assertEqual(self.ids(self.user, "scanner"), [self.printer.pk])
+        message = TicketMessage.objects.create(ticket=self.printer, sender=self.user, body="Toner everywhere")
+        self.assertEqual(self.ids(self.user, "toner"), [self.printer.pk])
+        message.delete()
+        self.assertEqual(self.ids(self.user, "toner"), [])
+        self.printer.delete()
+        self.assertNotIn(self.printer.pk, indexed_ids())
+
+    def test_saves_that_skip_the_title_do_not_reindex(self):
+        """Saving with update_fields that leave out the title does not touch the index."""
+        self.printer.status = Ticket.Status.CLOSED
+        with self.assertNumQueries(1):
+            self.printer.save(update_fields=["status", "awaiting_staff_since"])
+
+    def test_fallback_search_without_fts(self):
+        """Other databases fall back to icontains over titles and bodies, newest first."""
+        with patch.object(search_service, "fts_enabled", return_value=False):
+            page, cursor = search(self.user, "printer", size=1)
+            rest, end = search(self.user, "printer", cursor, size=1)
+            self.assertEqual([t.pk for t in page + rest], [self.wifi.pk, self.printer.pk])
+            self.assertEqual(self.ids(self.staff, "toner"), [self.foreign.pk])
+        self.assertIsNone(end)
+
+    def test_rebuild_command_repopulates_and_prunes(self):
+        """The command re-indexes every ticket in batches and drops stale rows."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [self.wifi.pk])
+            cursor.execute(f"INSERT INTO {SEARCH_TABLE} (rowid, title) VALUES (999999, 'ghost')")
+        out = StringIO()
+        call_command("rebuild_search_index", batch_size=2, stdout=out)
+        self.assertEqual(indexed_ids(), sorted([self.printer.pk, self.wifi.pk, self.foreign.pk]))
+        self.assertIn("indexed 2 tickets", out.getvalue())
+        self.assertIn("Indexed 3 tickets", out.getvalue())
+
+    def test_index_maintenance_is_skipped_without_fts(self):
+        """Without FTS5 the index helpers do nothing and the rebuild command refuses to run."""
+        with patch.object(search_service, "fts_enabled", return_value=False):
+            search_service.index_tickets([self.printer.pk])
+            search_service.unindex_ticket(self.printer.pk)
+            search_service.prune_index()
+        self.assertIn(self.printer.pk, indexed_ids())
+        with patch("tickets.management.commands.rebuild_search_index.fts_enabled", return_value=False):
+            with self.assertRaises(CommandError):
+                call_command("rebuild_search_index")
@@ -0,0 +1,89 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from tickets.management.commands.seed import HISTORY, SEED_PREFIX
+from tickets.models import Department, DepartmentDailyMetrics, RollupClosure, Ticket, TicketAssigned, TicketMessage
+from tickets.services.bulk import auto_timestamp_fields
+from tickets.services.rollups import rollup_metrics
+
+User = get_user_model()
+
+SEEDED_MODELS = (Department, Ticket, TicketMessage)
+
+
+def auto_flags():
+    """The auto_now/auto_now_add flags of every field the seed command overrides."""
+    return [(field, field.auto_now, field.auto_now_add) for field in auto_timestamp_fields(*SEEDED_MODELS)]
+
+
+class SeedCommandTests(TestCase):
+    """Tests for the seed and unseed load-testing commands."""
+
+    def setUp(self):
+        """Create a real user and ticket that seeding and unseeding must leave alone."""
+        self.flags = auto_flags()
+        self.user = User.objects.create_user(
+            username="realuser", password="password123", email="real@example.com", first_name="Real", last_name="User"
+        )
+        self.ticket = Ticket.objects.create(title="Real ticket", created_by=self.user)
+
+    def seed(self, **options):
+        """Seed a small dataset, returning the command output."""
+        out = StringIO()
+        call_command("seed", users=6, departments=2, tickets=8, messages=24, batch_size=3, stdout=out, **options)
+        return out.getvalue()
+
+    def test_seed_keeps_historical_timestamps_and_restores_the_flags(self):
+        """Seeded rows keep their generated past times, and auto timestamps work again afterwards."""
+        started = timezone.now()
+        self.assertIn("Seeded", self.seed())
+        tickets = Ticket.objects.filter(created_by__username__startswith=SEED_PREFIX)
+        self.assertEqual((User.objects.filter(username__startswith=SEED_PREFIX).count(), tickets.count()), (6, 8))
+        self.assertTrue(all(t.created_at <= t.updated_at <= started for t in tickets))
+        self.assertTrue(all(d.created_on < started - HISTORY + timedelta(minutes=1) for d in Department.objects.all()))
+        for message in TicketMessage.objects.select_related("ticket"):
+            self.assertTrue(message.ticket.created_at <= message.timestamp <= message.ticket.updated_at)
+        self.assertTrue(all(t.last_message_id == t.ticketmessage_set.order_by("-timestamp", "-pk")[0].pk
+                            for t in tickets.exclude(last_message=None)))
+        self.assertEqual(auto_flags(), self.flags)
+        fresh = Ticket.objects.create(title="After seeding", created_by=self.user)
+        self.assertGreaterEqual(fresh.created_at, started)
+
+    def test_flags_are_restored_when_seeding_fails(self):
+        """An error part way through still puts the auto timestamp flags back."""
+        with patch("tickets.management.commands.seed.index_tickets", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                self.seed()
+        self.assertEqual(auto_flags(), self.flags)
+
+    def test_seeding_twice_is_refused(self):
+        """The command will not seed on top of existing seed data."""
+        self.seed()
+        with self.assertRaises(CommandError):
+            self.seed()
+
+    def test_unseed_removes_only_seeded_rows(self):
+        """Unseeding deletes every seeded row and keeps real users' data."""
+        self.seed()
+        out = StringIO()
+        call_command("unseed", stdout=out)
+        self.assertIn("Removed", out.getvalue())
+        self.assertFalse(User.objects.filter(username__startswith=SEED_PREFIX).exists())
+        self.assertFalse(Department.objects.exists() or TicketAssigned.objects.exists())
+        self.assertEqual(list(Ticket.objects.all()), [self.ticket])
+        self.assertFalse(TicketMessage.objects.exists())
+
+    def test_unseed_after_rollups_removes_their_rows(self):
+        """Rollup rows of seeded departments and tickets go with them instead of failing the delete."""
+        self.seed()
+        rollup_metrics(chunk_days=31)
+        self.assertTrue(DepartmentDailyMetrics.objects.exists() and RollupClosure.objects.exists())
+        call_command("unseed", stdout=StringIO())
+        self.assertFalse(DepartmentDailyMetrics.objects.exists() or RollupClosure.objects.exists())
+        self.assertFalse(Department.objects.exists())
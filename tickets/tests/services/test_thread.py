@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from tickets.models import Ticket, TicketMessage
+from tickets.services.thread import iter_thread, page_queryset, thread_page, visible_tickets
+
+User = get_user_model()
+
+
+class ThreadServiceTests(TestCase):
+    """Tests for keyset paging over one ticket's conversation."""
+
+    def setUp(self):
+        """Create a ticket with seven messages, two of which share a timestamp."""
+        self.user = User.objects.create_user(
+            username="threaduser",
+            password="password123",
+            email="thread@example.com",
+            first_name="Thread",
+            last_name="User",
+        )
+        self.ticket = Ticket.objects.create(title="Long thread", created_by=self.user)
+        start = timezone.now() - timedelta(hours=1)
+        self.messages = []
+        for i in range(7):
+            message = TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body=f"Message {i}")
+            TicketMessage.objects.filter(pk=message.pk).update(timestamp=start + timedelta(minutes=min(i, 5)))
+            self.messages.append(message.pk)
+
+    def walk(self, direction):
+        """Follow cursors in ``direction`` and return every page's ids."""
+        pages, cursor = [], None
+        while True:
+            page, cursor = thread_page(self.ticket, direction, cursor, size=3)
+            pages.append([m.pk for m in page])
+            if cursor is None:
+                return pages
+
+    def test_before_pages_walk_back_from_the_newest(self):
+        """Paging backwards starts at the newest messages; each page reads oldest first."""
+        m = self.messages
+        self.assertEqual(self.walk("before"), [m[4:7], m[1:4], m[0:1]])
+
+    def test_after_pages_walk_forward_from_the_oldest(self):
+        """Paging forwards visits every message once, including timestamp ties."""
+        m = self.messages
+        self.assertEqual(self.walk("after"), [m[0:3], m[3:6], m[6:7]])
+
+    def test_each_page_is_one_query_with_senders_joined(self):
+        """A page costs one query however long the thread is, and senders need no extra queries."""
+        with self.assertNumQueries(1):
+            page, _ = thread_page(self.ticket, size=3)
+            [m.sender.first_name for m in page]
+
+    def test_iter_thread_yields_everything_in_batches(self):
+        """Iterating the whole thread yields keyset batches in reading order."""
+        batches = [[m.pk for m in batch] for batch in iter_thread(self.ticket, batch_size=4)]
+        self.assertEqual(batches, [self.messages[:4], self.messages[4:]])
+
+    def test_visible_tickets_scope(self):
+        """Customers see only their own tickets; staff see all."""
+        other = User.objects.create_user(username="threadother", password="password123", email="o@example.com")
+        staff = User.objects.create_user(username="threadstaff", password="password123", email="s@example.com", is_staff=True)
+        self.assertFalse(visible_tickets(other).exists())
+        self.assertEqual(list(visible_tickets(staff)), [self.ticket])
+
+    def test_pages_read_the_thread_index_in_both_directions(self):
+        """Both directions are range scans on (ticket, -timestamp, -id) with no sort step."""
+        for direction in ("before", "after"):
+            _, cursor = thread_page(self.ticket, direction, size=3)
+            plan = page_queryset(self.ticket, direction, cursor).explain()
+            self.assertIn("msg_ticket_ts_idx", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
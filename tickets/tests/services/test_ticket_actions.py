@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+
+from tickets.models import Department, Ticket, TicketAssigned, TicketMessage
+from tickets.services import events
+from tickets.services.dashboard_cache import dashboard_version
+from tickets.services.events import department_channel, ticket_audiences, user_channel
+from tickets.services.ticket_actions import close_tickets, reassign_tickets
+
+User = get_user_model()
+
+
+class TicketActionTests(TestCase):
+    """Tests for the single-statement bulk ticket actions."""
+
+    def setUp(self):
+        """Create two customers' tickets, one of them waiting on staff and assigned to IT."""
+        self.user = self._user("actionuser")
+        self.other = self._user("actionother")
+        self.it = Department.objects.create(name="IT", created_by=self.user)
+        self.hr = Department.objects.create(name="HR", created_by=self.user)
+        self.waiting = Ticket.objects.create(title="Waiting", created_by=self.user)
+        TicketMessage.objects.create(ticket=self.waiting, sender=self.user, body="Help")
+        TicketAssigned.objects.create(ticket=self.waiting, department=self.it)
+        self.pending = Ticket.objects.create(title="Pending", created_by=self.other, status=Ticket.Status.PENDING)
+        self.done = Ticket.objects.create(title="Done", created_by=self.other, status=Ticket.Status.CLOSED)
+
+    def _user(self, username):
+        """Create a user named ``username``."""
+        return User.objects.create_user(
+            username=username,
+            password="password123",
+            email=f"{username}@example.com",
+            first_name="Action",
+            last_name="User",
+        )
+
+    def test_close_is_one_update_with_bulk_side_effects(self):
+        """Open tickets close in one UPDATE, stop waiting, bump dashboards and publish events."""
+        versions = [dashboard_version(u.pk) for u in (self.user, self.other)]
+        with patch.object(events, "get_broker") as broker, self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(4):
+                self.assertEqual(close_tickets(Ticket.objects.all()), 2)
+        self.assertEqual(set(Ticket.objects.values_list("status", flat=True)), {Ticket.Status.CLOSED})
+        self.waiting.refresh_from_db()
+        self.assertIsNone(self.waiting.awaiting_staff_since)
+        self.assertNotEqual([dashboard_version(u.pk) for u in (self.user, self.other)], versions)
+        published = {event["ticket"]: event["previous"] for _, event in
+                     (c.args for c in broker.return_value.publish.call_args_list)}
+        self.assertEqual(published, {self.waiting.pk: "open", self.pending.pk: "pending"})
+
+    def test_reassign_replaces_assignments(self):
+        """Every selected ticket ends up assigned to exactly the chosen department."""
+        TicketAssigned.objects.create(ticket=self.pending, department=self.hr)
+        with self.assertNumQueries(5):
+            moved = reassign_tickets(Ticket.objects.exclude(pk=self.done.pk), self.hr)
+        self.assertEqual(moved, 2)
+        self.assertEqual(
+            set(TicketAssigned.objects.values_list("ticket_id", "department_id")),
+            {(self.waiting.pk, self.hr.pk), (self.pending.pk, self.hr.pk)},
+        )
+
+    def test_audiences_are_looked_up_together(self):
+        """Many tickets' audiences come from a single assignments query."""
+        with self.assertNumQueries(1):
+            audiences = ticket_audiences({self.waiting.pk: self.user.pk, self.pending.pk: self.other.pk})
+        self.assertEqual(audiences, {
+            self.waiting.pk: [user_channel(self.user.pk), department_channel(self.it.pk)],
+            self.pending.pk: [user_channel(self.other.pk)],
+        })
@@ -0,0 +1,37 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from tickets.sessions import SessionStore
+
+
+@override_settings(SESSION_ENGINE="tickets.sessions", SESSION_CLEANUP_BATCH_SIZE=2)
+class SessionCleanupTests(TestCase):
+    """Tests for clearing expired sessions in batches."""
+
+    def setUp(self):
+        """Create five expired sessions and one live one."""
+        now = timezone.now()
+        for i in range(5):
+            Session.objects.create(session_key=f"expired{i}", session_data="", expire_date=now - timedelta(days=1))
+        Session.objects.create(session_key="live", session_data="", expire_date=now + timedelta(days=1))
+
+    def test_expired_sessions_are_deleted_a_batch_at_a_time(self):
+        """Each batch is one select and one bounded delete; live sessions stay."""
+        with self.assertNumQueries(7):
+            SessionStore.clear_expired()
+        self.assertEqual(list(Session.objects.values_list("pk", flat=True)), ["live"])
+
+    def test_clearsessions_uses_the_batched_cleanup(self):
+        """``manage.py clearsessions`` goes through the engine's batched ``clear_expired``."""
+        call_command("clearsessions", stdout=StringIO())
+        self.assertEqual(Session.objects.count(), 1)
+
+    async def test_async_cleanup(self):
+        """``aclear_expired`` runs the same batched cleanup."""
+        await SessionStore.aclear_expired()
+        self.assertEqual(await Session.objects.acount(), 1)
@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tickets.models import Ticket, TicketMessage
+from tickets.signals.cascade import deleting_tickets
+
+User = get_user_model()
+
+
+class TicketDeleteCascadeTests(TestCase):
+    """Tests for skipping per-message upkeep when whole tickets are deleted."""
+
+    def setUp(self):
+        """Create a customer and a staff member who replies."""
+        self.customer = User.objects.create_user(
+            username="cascadecustomer", password="password123", email="cascadecustomer@example.com"
+        )
+        self.staff = User.objects.create_user(
+            username="cascadestaff", password="password123", email="cascadestaff@example.com", is_staff=True
+        )
+
+    def _ticket(self, replies):
+        """A customer's ticket with a question and ``replies`` staff replies."""
+        ticket = Ticket.objects.create(title=f"{replies} replies", created_by=self.customer)
+        TicketMessage.objects.create(ticket=ticket, sender=self.customer, body="Question")
+        for _ in range(replies):
+            TicketMessage.objects.create(ticket=ticket, sender=self.staff, body="Reply")
+        return ticket
+
+    def _delete_queries(self, delete):
+        """How many statements ``delete`` runs."""
+        with CaptureQueriesContext(connection) as queries:
+            delete()
+        return len(queries)
+
+    def test_deleting_tickets_costs_the_same_however_long_the_thread(self):
+        """Deleting a ticket, or a queryset of them, runs no per-message queries."""
+        short, long = self._ticket(0), self._ticket(6)
+        self.assertEqual(self._delete_queries(short.delete), self._delete_queries(long.delete))
+        short, long = self._ticket(0), self._ticket(6)
+        self.assertEqual(
+            self._delete_queries(Ticket.objects.filter(pk=short.pk).delete),
+            self._delete_queries(Ticket.objects.filter(pk=long.pk).delete),
+        )
+        self.assertFalse(TicketMessage.objects.exists())
+
+    def test_deleting_a_sender_still_repoints_surviving_tickets(self):
+        """Messages removed with their sender, not their ticket, still get the ticket's upkeep."""
+        ticket = self._ticket(1)
+        self.staff.delete()
+        ticket.refresh_from_db()
+        self.assertEqual(ticket.last_message.body, "Question")
+        self.assertIsNotNone(ticket.awaiting_staff_since)
+
+    def test_only_ticket_origins_count(self):
+        """Tickets and ticket querysets are ticket deletes; messages, users and no origin are not."""
+        self.assertTrue(deleting_tickets(Ticket()) and deleting_tickets(Ticket.objects.all()))
+        self.assertFalse(any(map(deleting_tickets, [TicketMessage(), User.objects.all(), None])))
@@ -0,0 +1,38 @@
+import os
+import tempfile
+from types import SimpleNamespace
+
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase, override_settings
+
+from resolveme import production_settings
+from tickets.signals.sqlite_pragmas import pragma_statements, tune_sqlite_connection
+
+
+class SqlitePragmaTests(SimpleTestCase):
+    """Tests for tuning new SQLite connections."""
+
+    databases = {"default"}
+
+    def connect(self, directory):
+        """Open a new connection to a throwaway database file, firing ``connection_created``."""
+        wrapper = DatabaseWrapper({**connection.settings_dict, "NAME": os.path.join(directory, "tuned.sqlite3")})
+        wrapper.ensure_connection()
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    @override_settings(SQLITE_PRAGMAS=production_settings.SQLITE_PRAGMAS)
+    def test_production_pragmas_are_applied_to_new_connections(self):
+        """WAL, relaxed syncing, the busy timeout and the memory settings are in force on connect."""
+        with tempfile.TemporaryDirectory() as directory:
+            raw = self.connect(directory).connection
+            read = lambda name: raw.execute(f"PRAGMA {name}").fetchone()[0]  # noqa: E731
+            self.assertEqual(read("journal_mode"), "wal")
+            self.assertEqual(read("synchronous"), 1)
+            self.assertEqual((read("busy_timeout"), read("cache_size"), read("temp_store")), (5000, -64000, 2))
+
+    def test_statements_and_other_vendors(self):
+        """Pragmas become one statement each, and non-SQLite connections are left alone."""
+        self.assertEqual(pragma_statements({"synchronous": "NORMAL"}), ["PRAGMA synchronous = NORMAL"])
+        self.assertIsNone(tune_sqlite_connection(sender=None, connection=SimpleNamespace(vendor="postgresql")))
@@ -0,0 +1,175 @@
+import gzip
+import json
+import shutil
+import sys
+import tempfile
+import zlib
+from io import BytesIO, StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import CommandError, call_command
+from django.template import engines
+from django.test import SimpleTestCase, override_settings
+from PIL import Image
+
+from tickets.storage import compressors, optimize_png, optional_module, savings_report
+
+# Repetitive stylesheet, long enough to be precompressed.
+STYLESHEET = "body { color: #222; }\n" * 40 + ".logo { background: url('logo.png'); }\n"
+# Only collect the files written by the test, not the admin's.
+FILESYSTEM_FINDER = ["django.contrib.staticfiles.finders.FileSystemFinder"]
+# The storage under test; the test runner otherwise serves plain names.
+MANIFEST_STORAGE = {"BACKEND": "tickets.storage.PrecompressedManifestStaticFilesStorage"}
+FAKE_BROTLI = SimpleNamespace(compress=lambda data, quality: zlib.compress(data, 9))
+
+
+def unoptimized_png():
+    """A PNG saved without compression, which Pillow's optimiser can shrink losslessly."""
+    buffer = BytesIO()
+    Image.new("RGB", (64, 64), "navy").save(buffer, "PNG", compress_level=0)
+    return buffer.getvalue()
+
+
+class StaticFilesTestCase(SimpleTestCase):
+    """Base for static pipeline tests: sources and STATIC_ROOT live in throwaway directories."""
+
+    def setUp(self):
+        """Write a stylesheet, a tiny text file and an unoptimised PNG to a source directory."""
+        self.source, self.root = Path(tempfile.mkdtemp()), Path(tempfile.mkdtemp())
+        for directory in (self.source, self.root):
+            self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        (self.source / "style.css").write_text(STYLESHEET)
+        (self.source / "note.txt").write_text("short")
+        (self.source / "logo.png").write_bytes(unoptimized_png())
+        settings_override = override_settings(
+            STATIC_ROOT=self.root, STATICFILES_DIRS=[self.source], STATICFILES_FINDERS=FILESYSTEM_FINDER,
+            STORAGES={**settings.STORAGES, "staticfiles": MANIFEST_STORAGE},
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def collect(self, **options):
+        """Run collectstatic into the temporary STATIC_ROOT."""
+        call_command("collectstatic", interactive=False, verbosity=0, stdout=StringIO(), **options)
+
+    def hashed(self, name):
+        """The hashed name collectstatic gave ``name``."""
+        return staticfiles_storage.hashed_files[name]
+
+
+class PrecompressionTests(SimpleTestCase):
+    """Tests for the compression and PNG helpers."""
+
+    def test_brotli_is_used_only_when_installed(self):
+        """Without the brotli module only gzip is available; with it, br comes first."""
+        self.assertIsNone(optional_module("no_such_module_here"))
+        with patch.dict(sys.modules, {"brotli": None}):
+            self.assertEqual(list(compressors()), ["gzip"])
+        with patch.dict(sys.modules, {"brotli": FAKE_BROTLI}):
+            self.assertEqual(list(compressors()), ["br", "gzip"])
+            self.assertEqual(compressors()["br"](b"aaaa"), zlib.compress(b"aaaa", 9))
+
+    def test_gzip_output_is_reproducible(self):
+        """The gzip copy does not embed a timestamp, so rebuilding gives identical bytes."""
+        compress = compressors()["gzip"]
+        self.assertEqual(compress(b"x" * 1000), compress(b"x" * 1000))
+        self.assertEqual(gzip.decompress(compress(b"x" * 1000)), b"x" * 1000)
+
+    def test_png_optimisation_is_lossless_and_never_grows(self):
+        """Optimised PNGs keep every pixel; already tight or unreadable files come back untouched."""
+        original = unoptimized_png()
+        optimized = optimize_png(original)
+        self.assertLess(len(optimized), len(original))
+        self.assertEqual(Image.open(BytesIO(optimized)).tobytes(), Image.open(BytesIO(original)).tobytes())
+        self.assertIs(optimize_png(optimized), optimized)
+        self.assertEqual(optimize_png(b"not a png"), b"not a png")
+
+    def test_savings_report_counts_uncompressed_files_at_their_optimised_size(self):
+        """Files without a smaller copy in some coding count at their optimised size in its total."""
+        files = [
+            {"name": "a.css", "original": 1000, "optimized": 1000, "gzip": 300},
+            {"name": "b.png", "original": 500, "optimized": 400},
+        ]
+        report = savings_report(files, ["gzip"])
+        self.assertEqual(report["totals"], {"optimized": 1400, "gzip": 700})
+        self.assertEqual(report["saved"], {"optimized": 100, "gzip": 800})
+
+
+class PrecompressedStorageTests(StaticFilesTestCase):
+    """Tests for collecting through PrecompressedManifestStaticFilesStorage."""
+
+    def test_collectstatic_hashes_optimises_and_precompresses(self):
+        """Hashed text files get a smaller .gz copy, PNGs shrink, and tiny files are left alone."""
+        with patch.dict(sys.modules, {"brotli": None}):
+            self.collect()
+        css = self.root / self.hashed("style.css")
+        self.assertEqual(gzip.decompress((self.root / f"{self.hashed('style.css')}.gz").read_bytes()), css.read_bytes())
+        self.assertIn(self.hashed("logo.png"), css.read_text())
+        self.assertFalse((self.root / f"{self.hashed('style.css')}.br").exists())
+        self.assertFalse((self.root / f"{self.hashed('note.txt')}.gz").exists())
+        self.assertLess((self.root / self.hashed("logo.png")).stat().st_size, len(unoptimized_png()))
+        self.assertEqual((self.root / "logo.png").read_bytes(), unoptimized_png())
+
+    def test_brotli_copies_are_written_when_available(self):
+        """With brotli installed, hashed text files also get a .br copy."""
+        with patch.dict(sys.modules, {"brotli": FAKE_BROTLI}):
+            self.collect()
+        self.assertTrue((self.root / f"{self.hashed('style.css')}.br").exists())
+        self.assertEqual(list(staticfiles_storage.read_report()["totals"]), ["optimized", "br", "gzip"])
+
+    def test_report_is_stable_across_runs(self):
+        """Collecting again over optimised files reports the same savings and rewrites the report."""
+        self.collect()
+        first = staticfiles_storage.read_report()
+        self.collect()
+        self.assertEqual(staticfiles_storage.read_report(), first)
+        self.assertGreater(first["saved"]["optimized"], 0)
+        self.assertEqual(json.loads((self.root / "staticfiles-report.json").read_text()), first)
+
+    def test_dry_run_writes_nothing(self):
+        """A dry run neither hashes nor writes a report."""
+        self.collect(dry_run=True)
+        self.assertIsNone(staticfiles_storage.read_report())
+        self.assertEqual(list(self.root.iterdir()), [])
+
+    def test_urls_use_hashed_names_once_collected(self):
+        """Templates link hashed names from the manifest; before collectstatic only DEBUG falls back to plain names."""
+        template = engines["django"].from_string("{% load static %}{% static 'style.css' %}")
+        with self.assertRaisesMessage(ValueError, "Missing staticfiles manifest entry for 'style.css'"):
+            template.render()
+        with override_settings(DEBUG=True):
+            self.assertEqual(staticfiles_storage.stored_name("style.css"), "style.css")
+        self.collect()
+        self.assertEqual(template.render(), f"/static/{self.hashed('style.css')}")
+        self.assertIn(self.hashed("style.css"), staticfiles_storage.immutable_names)
+        self.assertNotIn("style.css", staticfiles_storage.immutable_names)
+
+
+class StaticReportCommandTests(StaticFilesTestCase):
+    """Tests for the static_report management command."""
+
+    def test_reports_totals_and_optionally_every_file(self):
+        """The totals are always shown; --files adds one line per collected file."""
+        self.collect()
+        out = StringIO()
+        call_command("static_report", stdout=out)
+        self.assertIn("3 static files", out.getvalue())
+        self.assertIn("gzip:", out.getvalue())
+        self.assertNotIn(self.hashed("logo.png"), out.getvalue())
+        call_command("static_report", files=True, stdout=out)
+        self.assertIn(f"{self.hashed('logo.png')}: {len(unoptimized_png())} bytes", out.getvalue())
+
+    def test_missing_report_is_an_error(self):
+        """Without a report, or with a storage that does not write one, the command fails clearly."""
+        with self.assertRaisesMessage(CommandError, "run collectstatic"):
+            call_command("static_report", stdout=StringIO())
+        plain = {
+            "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+            "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+        }
+        with override_settings(STORAGES=plain), self.assertRaises(CommandError):
+            call_command("static_report", stdout=StringIO())
@@ -0,0 +1,45 @@
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from tickets.benchmarks.concurrency import AsyncDashboardURLs
+from tickets.models import Ticket
+from tickets.services.dashboard_cache import dashboard_cache_stats
+
+User = get_user_model()
+
+
+@override_settings(ROOT_URLCONF=AsyncDashboardURLs)
+class AsyncHomeViewTests(TestCase):
+    """Tests for the async-ORM dashboard served under ASGI."""
+
+    def setUp(self):
+        """Create a user with an open and a closed ticket."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="asynchome",
+            password="password123",
+            email="asynchome@example.com",
+            first_name="Async",
+            last_name="Home",
+        )
+        self.open = Ticket.objects.create(title="Still open", created_by=self.user)
+        Ticket.objects.create(title="All done", created_by=self.user, status=Ticket.Status.CLOSED)
+
+    async def test_anonymous_users_see_the_landing_page(self):
+        """Without a session the landing page is rendered."""
+        response = await self.async_client.get(reverse("home"))
+        self.assertTemplateUsed(response, "landing.html")
+
+    async def test_dashboard_is_built_with_the_async_orm(self):
+        """The dashboard renders the first active page and tab counts, then serves from the cache."""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("home"))
+        self.assertTemplateUsed(response, "home.html")
+        self.assertEqual(response.context["counts"], {"active": 1, "overdue": 0, "completed": 1})
+        self.assertEqual(response.context["tickets"], [self.open])
+        self.assertContains(response, "Still open")
+        await self.async_client.get(reverse("home"))
+        self.assertEqual(await sync_to_async(dashboard_cache_stats)(), {"hits": 1, "misses": 1})
@@ -0,0 +1,22 @@
+from django.urls import reverse
+
+from tickets.services.avatars import variant_name
+from tickets.tests.services.test_avatars import AvatarTestCase, image_bytes
+
+
+class AvatarViewTests(AvatarTestCase):
+    """Tests for serving avatar variants."""
+
+    def test_variants_are_served_with_immutable_caching(self):
+        """Stored variants come back with their type and a year-long immutable cache lifetime."""
+        self.upload(self.user, image_bytes())
+        response = self.client.get(reverse("avatar", args=[variant_name(self.user.avatar_hash, 40, "webp")]))
+        self.assertEqual(response["Content-Type"], "image/webp")
+        self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+        self.assertTrue(b"".join(response.streaming_content).startswith(b"RIFF"))
+        response.close()
+
+    def test_unknown_or_malformed_names_are_not_found(self):
+        """Names that are not content-hashed variants, or not stored, are 404s."""
+        for name in ("settings.py", variant_name("0" * 64, 40, "jpeg")):
+            self.assertEqual(self.client.get(reverse("avatar", args=[name])).status_code, 404)
@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from tickets.models import Department, DepartmentDailyMetrics, RollupWatermark
+
+User = get_user_model()
+
+
+class DepartmentReportViewTests(TestCase):
+    """Tests for the department report page."""
+
+    def setUp(self):
+        """Create a staff member, a customer and two days of rollups for one department."""
+        self.staff = User.objects.create_user(
+            username="reportstaff",
+            password="password123",
+            email="reportstaff@example.com",
+            first_name="Staff",
+            last_name="Reporter",
+            is_staff=True,
+        )
+        self.customer = User.objects.create_user(
+            username="reportcustomer",
+            password="password123",
+            email="reportcustomer@example.com",
+            first_name="Cus",
+            last_name="Tomer",
+        )
+        department = Department.objects.create(name="Facilities", created_by=self.staff)
+        today = timezone.localdate()
+        DepartmentDailyMetrics.objects.create(department=department, day=today - timedelta(days=40), opened=3, closed=1)
+        DepartmentDailyMetrics.objects.create(
+            department=department, day=today, opened=2, closed=1, close_time=timedelta(hours=5),
+            first_replies=2, first_reply_time=timedelta(hours=3),
+        )
+        self.url = reverse("department_report")
+
+    def test_staff_see_the_window_and_the_backlog(self):
+        """Totals cover the requested days, the backlog every rollup, in a fixed number of queries."""
+        self.client.force_login(self.staff)
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "department_report.html")
+        row = response.context["rows"][0]
+        self.assertEqual((row["department"], row["opened"], row["closed"], row["backlog"]), ("Facilities", 2, 1, 3))
+        self.assertEqual((row["first_reply_hours"], row["close_hours"]), (1.5, 5.0))
+        self.assertContains(response, "No rollups yet")
+        RollupWatermark.objects.create(name="department_daily")
+        response = self.client.get(self.url, {"days": "60"})
+        self.assertEqual(response.context["rows"][0]["opened"], 5)
+        self.assertContains(response, "Figures as of")
+
+    def test_invalid_days_and_non_staff_are_refused(self):
+        """Out of range or non-numeric windows are bad requests; customers are forbidden."""
+        self.client.force_login(self.staff)
+        for days in ("0", "367", "week"):
+            with self.subTest(days=days):
+                self.assertEqual(self.client.get(self.url, {"days": days}).status_code, 400)
+        self.client.force_login(self.customer)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
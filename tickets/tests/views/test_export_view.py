@@ -0,0 +1,58 @@
+import gzip
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from tickets.models import Ticket
+
+User = get_user_model()
+
+
+class TicketExportViewTests(TestCase):
+    """Tests for the streaming export endpoint."""
+
+    def setUp(self):
+        """Create a staff member, a customer and a ticket."""
+        self.staff = User.objects.create_user(
+            username="exportstaff",
+            password="password123",
+            email="exportstaff@example.com",
+            first_name="Staff",
+            last_name="Exporter",
+            is_staff=True,
+        )
+        self.customer = User.objects.create_user(
+            username="exportcustomer",
+            password="password123",
+            email="exportcustomer@example.com",
+            first_name="Cus",
+            last_name="Tomer",
+        )
+        Ticket.objects.create(title="Exported ticket", created_by=self.customer)
+        self.url = reverse("ticket_export", args=["tickets"])
+
+    def test_staff_get_a_streamed_csv_download(self):
+        """The default export is CSV, streamed as an attachment."""
+        self.client.force_login(self.staff)
+        response = self.client.get(self.url)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="tickets.csv"')
+        self.assertIn(b"Exported ticket", b"".join(response.streaming_content))
+
+    def test_gzipped_jsonl(self):
+        """``format=jsonl&gzip=1`` streams a gzip file of JSON Lines."""
+        self.client.force_login(self.staff)
+        response = self.client.get(self.url, {"format": "jsonl", "gzip": "1"})
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="tickets.jsonl.gz"')
+        self.assertIn(b'"title": "Exported ticket"', gzip.decompress(b"".join(response.streaming_content)))
+
+    def test_bad_requests_and_customers_are_refused(self):
+        """Unknown datasets 404, unknown formats 400, and customers get 403."""
+        self.client.force_login(self.staff)
+        self.assertEqual(self.client.get(reverse("ticket_export", args=["users"])).status_code, 404)
+        self.assertEqual(self.client.get(self.url, {"format": "xml"}).status_code, 400)
+        self.client.force_login(self.customer)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
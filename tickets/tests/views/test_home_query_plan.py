@@ -0,0 +1,72 @@
+import re
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+
+from tickets.models import Ticket, TicketMessage
+from tickets.signals.latest_message import latest_message_id
+from tickets.services.dashboard import tab_counts, tab_querysets
+from tickets.services.overdue import newly_overdue
+
+User = get_user_model()
+
+# A bare "SCAN <table>" line (no "USING ... INDEX") is a full table scan.
+FULL_SCAN = re.compile(r"\bSCAN (\w+)$", re.MULTILINE)
+
+
+class HomeQueryPlanTests(TestCase):
+    """Check that the dashboard querysets are served from indexes."""
+
+    def setUp(self):
+        """Create a user with tickets in every state and a few messages."""
+        self.user = User.objects.create_user(
+            username="planuser",
+            password="password123",
+            email="plan@example.com",
+            first_name="Plan",
+            last_name="User",
+        )
+        for status in Ticket.Status.values:
+            ticket = Ticket.objects.create(title=status, created_by=self.user, status=status)
+            TicketMessage.objects.create(ticket=ticket, sender=self.user, body="Hello")
+
+    def assertNoFullScan(self, queryset):
+        """Fail if EXPLAIN QUERY PLAN reports a full table scan."""
+        plan = queryset.explain()
+        self.assertEqual(FULL_SCAN.findall(plan), [], msg=plan)
+
+    def test_dashboard_querysets_use_indexes(self):
+        """The active, overdue and completed querysets never scan a whole table."""
+        for queryset in tab_querysets(self.user).values():
+            self.assertNoFullScan(queryset)
+
+    def test_tab_counts_use_indexes(self):
+        """The single tab-count aggregate never scans a whole table."""
+        with CaptureQueriesContext(connection) as ctx:
+            tab_counts(self.user)
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN QUERY PLAN " + ctx.captured_queries[0]["sql"])
+            plan = "\n".join(row[-1] for row in cursor.fetchall())
+        self.assertEqual(FULL_SCAN.findall(plan), [], msg=plan)
+
+    def test_latest_message_lookup_uses_thread_index(self):
+        """Finding a ticket's latest message reads the (ticket, -timestamp, -id) index."""
+        ticket = Ticket.objects.first()
+        qs = Ticket.objects.filter(pk=ticket.pk).annotate(latest=latest_message_id())
+        plan = qs.explain()
+        self.assertIn("msg_ticket_ts_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_overdue_tab_is_a_range_scan_on_the_waiting_index(self):
+        """The overdue tab reads the partial (created_by, awaiting_staff_since) index."""
+        plan = tab_querysets(self.user)["overdue"].explain()
+        self.assertIn("ticket_owner_awaiting_idx", plan)
+
+    def test_overdue_sweep_is_a_range_scan_on_the_waiting_index(self):
+        """Finding newly overdue tickets for everyone reads the partial awaiting_staff_since index."""
+        plan = newly_overdue(timedelta(hours=1)).explain()
+        self.assertIn("ticket_awaiting_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
@@ -1,20 +1,28 @@
+import re
 from datetime import timedelta
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.test import TestCase, Client
 from django.urls import reverse
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
 from tickets.models import Ticket, TicketMessage  # adjust import path if needed
+from tickets.services import dashboard
+from tickets.services.bulk import preserve_auto_timestamps
 
 User = get_user_model()
 
+TITLE = re.compile(r'<span class="ticket-title">(.*?)</span>')
+
 
 class HomeViewTests(TestCase):
     """Tests for the Home view."""
 
     def setUp(self):
         """Set up the test client and user."""
+        cache.clear()
         self.client = Client()
         self.url = reverse("home")
 
@@ -36,6 +44,11 @@ class HomeViewTests(TestCase):
             is_staff=True,
         )
 
+    def _message(self, ticket, sender, body, age=timedelta(0)):
+        """Post a message through the normal save path and signals, dated ``age`` ago."""
+        with preserve_auto_timestamps(TicketMessage):
+            return TicketMessage.objects.create(ticket=ticket, sender=sender, body=body, timestamp=timezone.now() - age)
+
     def test_home_view_anonymous(self):
         """Anonymous users should see the landing page."""
         response = self.client.get(self.url)
@@ -49,6 +62,11 @@ class HomeViewTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "home.html")
 
+    def _shown(self, tab):
+        """Titles of the tickets rendered on ``tab``: the dashboard itself for active, the tab fragment otherwise."""
+        url = self.url if tab == "active" else reverse("ticket_tab", args=[tab])
+        return TITLE.findall(self.client.get(url).content.decode())
+
     def test_home_view_only_shows_current_users_tickets(self):
         """Tickets should be filtered to created_by=request.user."""
         other = User.objects.create_user(
@@ -59,30 +77,21 @@ class HomeViewTests(TestCase):
             last_name="User",
         )
 
-        my_ticket = Ticket.objects.create(title="Mine", created_by=self.user, status=Ticket.Status.OPEN)
-        other_ticket = Ticket.objects.create(title="Not mine", created_by=other, status=Ticket.Status.OPEN)
+        Ticket.objects.create(title="Mine", created_by=self.user, status=Ticket.Status.OPEN)
+        Ticket.objects.create(title="Not mine", created_by=other, status=Ticket.Status.OPEN)
 
         self.client.force_login(self.user)
-        response = self.client.get(self.url)
-
-        active_ids = list(response.context["active_tickets"].values_list("id", flat=True))
-        self.assertIn(my_ticket.id, active_ids)
-        self.assertNotIn(other_ticket.id, active_ids)
+        self.assertEqual(self._shown("active"), ["Mine"])
 
     def test_completed_tickets_go_to_completed(self):
-        """Closed tickets appear under completed_tickets."""
-        closed = Ticket.objects.create(title="Closed ticket", created_by=self.user, status=Ticket.Status.CLOSED)
-        open_t = Ticket.objects.create(title="Open ticket", created_by=self.user, status=Ticket.Status.OPEN)
+        """Closed tickets are rendered on the completed tab, open ones on the dashboard."""
+        Ticket.objects.create(title="Closed ticket", created_by=self.user, status=Ticket.Status.CLOSED)
+        Ticket.objects.create(title="Open ticket", created_by=self.user, status=Ticket.Status.OPEN)
 
         self.client.force_login(self.user)
-        response = self.client.get(self.url)
-
-        completed_ids = list(response.context["completed_tickets"].values_list("id", flat=True))
-        active_ids = list(response.context["active_tickets"].values_list("id", flat=True))
 
-        self.assertIn(closed.id, completed_ids)
-        self.assertNotIn(closed.id, active_ids)
-        self.assertIn(open_t.id, active_ids)
+        self.assertEqual(self._shown("completed"), ["Closed ticket"])
+        self.assertEqual(self._shown("active"), ["Open ticket"])
 
     def test_overdue_requires_last_message_older_than_7_days_and_from_non_staff(self):
         """
@@ -90,39 +99,28 @@ class HomeViewTests(TestCase):
         """
         t = Ticket.objects.create(title="Should be overdue", created_by=self.user, status=Ticket.Status.OPEN)
 
-        # Create a message from the (non-staff) user, then manually set timestamp to old
-        msg = TicketMessage.objects.create(ticket=t, sender=self.user, body="User asked something")
-        TicketMessage.objects.filter(pk=msg.pk).update(timestamp=timezone.now() - timedelta(days=8))
+        # A (non-staff) user message posted eight days ago, still unanswered
+        self._message(t, self.user, "User asked something", timedelta(days=8))
 
         self.client.force_login(self.user)
-        response = self.client.get(self.url)
-
-        overdue_ids = list(response.context["overdue_tickets"].values_list("id", flat=True))
-        active_ids = list(response.context["active_tickets"].values_list("id", flat=True))
 
-        self.assertIn(t.id, overdue_ids)
-        self.assertNotIn(t.id, active_ids)
+        self.assertEqual(self._shown("overdue"), ["Should be overdue"])
+        self.assertEqual(self._shown("active"), [])
 
     def test_not_overdue_if_last_message_is_from_staff_even_if_old(self):
         """If the last message is from staff, it should NOT be overdue."""
         t = Ticket.objects.create(title="Not overdue due to staff last", created_by=self.user, status=Ticket.Status.OPEN)
 
         # Old user message
-        m1 = TicketMessage.objects.create(ticket=t, sender=self.user, body="User ping")
-        TicketMessage.objects.filter(pk=m1.pk).update(timestamp=timezone.now() - timedelta(days=10))
+        self._message(t, self.user, "User ping", timedelta(days=10))
 
-        # Staff reply is the latest (make it old too, but it's the latest and from staff)
-        m2 = TicketMessage.objects.create(ticket=t, sender=self.staff, body="Staff replied")
-        TicketMessage.objects.filter(pk=m2.pk).update(timestamp=timezone.now() - timedelta(days=8))
+        # Staff reply is the latest (old too, but it's the latest and from staff)
+        self._message(t, self.staff, "Staff replied", timedelta(days=8))
 
         self.client.force_login(self.user)
-        response = self.client.get(self.url)
-
-        overdue_ids = list(response.context["overdue_tickets"].values_list("id", flat=True))
-        active_ids = list(response.context["active_tickets"].values_list("id", flat=True))
 
-        self.assertNotIn(t.id, overdue_ids)
-        self.assertIn(t.id, active_ids)
+        self.assertEqual(self._shown("overdue"), [])
+        self.assertEqual(self._shown("active"), ["Not overdue due to staff last"])
 
     def test_not_overdue_if_last_message_is_recent(self):
         """If the last message is within 7 days, it should be active not overdue."""
@@ -130,32 +128,107 @@ class HomeViewTests(TestCase):
         TicketMessage.objects.create(ticket=t, sender=self.user, body="Recent ping")  # timestamp defaults to now
 
         self.client.force_login(self.user)
-        response = self.client.get(self.url)
-
-        overdue_ids = list(response.context["overdue_tickets"].values_list("id", flat=True))
-        active_ids = list(response.context["active_tickets"].values_list("id", flat=True))
 
-        self.assertNotIn(t.id, overdue_ids)
-        self.assertIn(t.id, active_ids)
+        self.assertEqual(self._shown("overdue"), [])
+        self.assertEqual(self._shown("active"), ["Recent message"])
 
-    def test_ticket_annotations_exist_in_queryset(self):
-        """Annotated fields should exist on tickets returned to the template."""
+    def test_rendered_row_shows_latest_message(self):
+        """A row shows its ticket's latest message body."""
         t = Ticket.objects.create(title="Annotated", created_by=self.user, status=Ticket.Status.OPEN)
         TicketMessage.objects.create(ticket=t, sender=self.user, body="Hello")
 
         self.client.force_login(self.user)
         response = self.client.get(self.url)
 
-        ticket = response.context["active_tickets"].first()
-        self.assertIsNotNone(ticket)
+        self.assertContains(response, '<div class="latest-body">Hello</div>', html=True)
+        self.assertContains(response, "<strong>You</strong>", html=True)
+
+    def test_latest_message_details_follow_newest_message(self):
+        """The dashboard shows the newest message and its sender, not an earlier one."""
+        t = Ticket.objects.create(title="Thread", created_by=self.user, status=Ticket.Status.OPEN)
+        TicketMessage.objects.create(ticket=t, sender=self.user, body="Question")
+        TicketMessage.objects.create(ticket=t, sender=self.staff, body="Answer")
+
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "Answer")
+        self.assertNotContains(response, "Question")
+        self.assertContains(response, "<strong>Staff User</strong>", html=True)
+        self.assertNotIn("active_tickets", response.context)
+
+    def test_tab_counts_come_from_counts_context(self):
+        """Tab badges show the counts for every tab."""
+        Ticket.objects.create(title="Open", created_by=self.user, status=Ticket.Status.OPEN)
+        Ticket.objects.create(title="Closed", created_by=self.user, status=Ticket.Status.CLOSED)
+
+        self.client.force_login(self.user)
+        response = self.client.get(self.url)
 
-        # These come from annotate(...)
-        self.assertTrue(hasattr(ticket, "last_message_at"))
-        self.assertTrue(hasattr(ticket, "last_message_body"))
-        self.assertTrue(hasattr(ticket, "last_message_sender_id"))
-        self.assertTrue(hasattr(ticket, "last_sender_is_staff"))
-        self.assertTrue(hasattr(ticket, "last_sender_first"))
-        self.assertTrue(hasattr(ticket, "last_sender_last"))
+        self.assertEqual(response.context["counts"], {"active": 1, "overdue": 0, "completed": 1})
+
+    def test_only_first_active_page_is_rendered(self):
+        """The dashboard renders the first active page and defers the other tabs."""
+        closed = Ticket.objects.create(title="Closed one", created_by=self.user, status=Ticket.Status.CLOSED)
+        tickets = [Ticket.objects.create(title=f"Open {i}", created_by=self.user) for i in range(3)]
+
+        self.client.force_login(self.user)
+        with patch.object(dashboard, "PAGE_SIZE", 2):
+            response = self.client.get(self.url)
+
+        self.assertEqual([t.pk for t in response.context["tickets"]], [tickets[2].pk, tickets[1].pk])
+        self.assertIsNotNone(response.context["next_cursor"])
+        self.assertNotContains(response, closed.title)
+        self.assertContains(response, reverse("ticket_tab", args=["completed"]))
+
+    def _add_tickets_in_every_bucket(self, count):
+        """Create ``count`` active, overdue and completed tickets with messages."""
+        for i in range(count):
+            active = Ticket.objects.create(title=f"Active {i}", created_by=self.user)
+            TicketMessage.objects.create(ticket=active, sender=self.staff, body="Reply")
+            overdue = Ticket.objects.create(title=f"Overdue {i}", created_by=self.user)
+            self._message(overdue, self.user, "Ping", timedelta(days=8))
+            Ticket.objects.create(title=f"Done {i}", created_by=self.user, status=Ticket.Status.CLOSED)
+
+    def test_query_count_does_not_grow_with_ticket_volume(self):
+        """Session, user, tab counts and first page on a miss; just session and user on a hit."""
+        self.client.force_login(self.user)
+        total = 0
+        for count in (1, 15):
+            with self.captureOnCommitCallbacks(execute=True):
+                self._add_tickets_in_every_bucket(count)
+            total += count
+            with self.assertNumQueries(4):
+                response = self.client.get(self.url)
+            with self.assertNumQueries(2):
+                self.client.get(self.url)
+            expected = {"active": total, "overdue": total, "completed": total}
+            self.assertEqual(response.context["counts"], expected)
+
+    def test_new_message_invalidates_cached_dashboard(self):
+        """A cached dashboard is rebuilt once one of the user's tickets gets a message."""
+        t = Ticket.objects.create(title="Cached", created_by=self.user, status=Ticket.Status.OPEN)
+        self.client.force_login(self.user)
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TicketMessage.objects.create(ticket=t, sender=self.staff, body="Fresh reply")
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "Fresh reply")
+
+    def test_editing_latest_message_refreshes_cached_row(self):
+        """Editing the latest message's body re-renders its row rather than serving the cached one."""
+        t = Ticket.objects.create(title="Edited", created_by=self.user, status=Ticket.Status.OPEN)
+        message = TicketMessage.objects.create(ticket=t, sender=self.staff, body="First draft")
+        self.client.force_login(self.user)
+        self.assertContains(self.client.get(self.url), "First draft")
+
+        message.body = "Final wording"
+        with self.captureOnCommitCallbacks(execute=True):
+            message.save()
+        response = self.client.get(self.url)
 
-        self.assertIsNotNone(ticket.last_message_at)
-        self.assertEqual(ticket.last_message_body, "Hello")
\ No newline at end of file
+        self.assertIsNotNone(message.edited_at)
+        self.assertContains(response, "Final wording")
+        self.assertNotContains(response, "First draft")
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from tickets.models import Ticket, TicketMessage
+from tickets.services import search as search_service
+
+User = get_user_model()
+
+
+class SearchViewTests(TestCase):
+    """Tests for the ticket search page."""
+
+    def setUp(self):
+        """Log in a user who owns a few searchable tickets."""
+        self.user = User.objects.create_user(
+            username="searchview",
+            password="password123",
+            email="searchview@example.com",
+            first_name="Search",
+            last_name="View",
+        )
+        self.url = reverse("search")
+        for i in range(3):
+            ticket = Ticket.objects.create(title=f"Printer {i}", created_by=self.user)
+            TicketMessage.objects.create(ticket=ticket, sender=self.user, body="Paper jam again")
+        self.client.login(username="searchview", password="password123")
+
+    def test_requires_login(self):
+        """Anonymous users are sent to the login page."""
+        self.client.logout()
+        response = self.client.get(self.url, {"q": "printer"})
+        self.assertEqual(response.status_code, 302)
+
+    def test_empty_query_renders_the_form(self):
+        """Without a query the page shows just the search form."""
+        response = self.client.get(self.url)
+        self.assertTemplateUsed(response, "search.html")
+        self.assertEqual(list(response.context["results"]), [])
+        self.assertNotContains(response, "No tickets match")
+
+    def test_results_page_and_load_more(self):
+        """The first page renders in full; the cursor link returns just the next fragment."""
+        with patch.object(search_service, "PAGE_SIZE", 2):
+            response = self.client.get(self.url, {"q": "paper"})
+        self.assertTemplateUsed(response, "search.html")
+        self.assertContains(response, "<mark>Paper</mark>", count=2)
+        with patch.object(search_service, "PAGE_SIZE", 2):
+            more = self.client.get(self.url, {"q": "paper", "cursor": response.context["next_cursor"]})
+        self.assertTemplateNotUsed(more, "search.html")
+        self.assertEqual(len(more.context["results"]), 1)
+        self.assertNotContains(more, "load-more")
+
+    def test_no_matches_message(self):
+        """A query that matches nothing says so."""
+        response = self.client.get(self.url, {"q": "keyboard"})
+        self.assertContains(response, "No tickets match “keyboard”.")
+
+    def test_bad_cursor_is_rejected(self):
+        """A corrupted cursor gets a 400 instead of a server error."""
+        response = self.client.get(self.url, {"q": "paper", "cursor": "%%%"})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,75 @@
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from tickets.services.events import department_channel, get_broker, user_channel
+
+User = get_user_model()
+
+
+class TicketEventsViewTests(TestCase):
+    """Tests for the Server-Sent Events endpoint."""
+
+    def setUp(self):
+        """Create a customer and a staff member."""
+        self.user = self._user("sseuser")
+        self.staff = self._user("ssestaff", is_staff=True)
+        self.url = reverse("ticket_events")
+
+    def _user(self, username, **extra):
+        """Create a user named ``username``."""
+        return User.objects.create_user(
+            username=username,
+            password="password123",
+            email=f"{username}@example.com",
+            first_name="Sse",
+            last_name="User",
+            **extra,
+        )
+
+    async def open_stream(self, user, query=""):
+        """Log in as ``user`` and open the stream, returning the response and its frames."""
+        await self.async_client.aforce_login(user)
+        response = await self.async_client.get(f"{self.url}{query}")
+        frames = aiter(response.streaming_content)
+        await anext(frames)
+        return response, frames
+
+    async def test_anonymous_users_are_forbidden(self):
+        """Event streams require a logged-in user."""
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 403)
+
+    def test_wsgi_requests_are_refused_and_pages_skip_the_stream(self):
+        """Under WSGI the stream answers 204 and the dashboard does not open an EventSource."""
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(self.url).status_code, 204)
+        self.assertNotContains(self.client.get(reverse("home")), "EventSource")
+
+    async def test_asgi_pages_open_the_stream(self):
+        """Pages served over ASGI subscribe to live events."""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("home"))
+        self.assertContains(response, "new EventSource")
+
+    async def test_streams_the_users_events(self):
+        """The owner's channel is relayed as event-stream frames until the client leaves."""
+        response, frames = await self.open_stream(self.user)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        get_broker().publish([user_channel(self.user.pk)], {"type": "status", "ticket": 1})
+        self.assertIn(b'"ticket": 1', await anext(frames))
+        await frames.aclose()
+        await sync_to_async(response.close)()
+        self.assertNotIn(user_channel(self.user.pk), get_broker().subscribers)
+
+    async def test_only_staff_may_follow_departments(self):
+        """Department channels are honoured for staff and ignored for customers."""
+        staff_response, _ = await self.open_stream(self.staff, "?department=7&department=x")
+        self.assertIn(department_channel(7), get_broker().subscribers)
+        user_response, _ = await self.open_stream(self.user, "?department=8")
+        self.assertNotIn(department_channel(8), get_broker().subscribers)
+        for response in (staff_response, user_response):
+            await sync_to_async(response.close)()
+        self.assertNotIn(department_channel(7), get_broker().subscribers)
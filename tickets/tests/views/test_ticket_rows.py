@@ -0,0 +1,70 @@
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from tickets.models import Ticket, TicketMessage
+
+User = get_user_model()
+
+
+class TicketRowCacheTests(TestCase):
+    """Tests for the shared, fragment-cached dashboard row."""
+
+    def setUp(self):
+        """Log in a user with one active ticket and start from an empty cache."""
+        caches["template_fragments"].clear()
+        self.user = User.objects.create_user(
+            username="rowuser",
+            password="password123",
+            email="row@example.com",
+            first_name="Row",
+            last_name="User",
+        )
+        self.staff = User.objects.create_user(
+            username="rowstaff",
+            password="password123",
+            email="rowstaff@example.com",
+            first_name="Sam",
+            last_name="Staff",
+            is_staff=True,
+        )
+        self.ticket = Ticket.objects.create(title="Printer jam", created_by=self.user)
+        self.client.force_login(self.user)
+
+    def tab(self, name="active"):
+        """Render one dashboard tab."""
+        return self.client.get(reverse("ticket_tab", args=[name]))
+
+    def test_unchanged_rows_come_from_the_cache(self):
+        """A row is reused until the ticket's updated_at moves on."""
+        self.assertContains(self.tab(), "Printer jam")
+        Ticket.objects.filter(pk=self.ticket.pk).update(title="Renamed behind the cache's back")
+        self.assertContains(self.tab(), "Printer jam")
+        self.ticket.refresh_from_db()
+        self.ticket.save()
+        self.assertContains(self.tab(), "Renamed behind the cache&#x27;s back")
+
+    def test_new_messages_refresh_the_row(self):
+        """The latest message is part of the key, and the viewer's own messages say "You"."""
+        self.assertContains(self.tab(), "No messages yet.")
+        TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body="Still jammed")
+        response = self.tab()
+        self.assertContains(response, "Still jammed")
+        self.assertContains(response, "<strong>You</strong>", html=True)
+        TicketMessage.objects.create(ticket=self.ticket, sender=self.staff, body="On our way")
+        response = self.tab()
+        self.assertContains(response, "<strong>Sam Staff</strong>", html=True)
+        self.assertContains(response, '<span class="latest-tag">STAFF</span>', html=True)
+
+    def test_each_tab_renders_its_own_row_markup(self):
+        """Completed rows use the thread layout and DONE pill; the same ticket is cached per tab."""
+        TicketMessage.objects.create(ticket=self.ticket, sender=self.staff, body="Fixed")
+        self.assertContains(self.tab(), "status-active")
+        self.ticket.refresh_from_db()
+        self.ticket.status = Ticket.Status.CLOSED
+        self.ticket.save()
+        response = self.tab("completed")
+        self.assertContains(response, '<span class="pill status status-completed">DONE</span>', html=True)
+        self.assertContains(response, "msg-staff")
+        self.assertNotContains(response, "status-active")
@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from tickets.models import Ticket
+from tickets.services import dashboard
+
+User = get_user_model()
+
+
+class TicketTabViewTests(TestCase):
+    """Tests for the keyset-paginated dashboard tab endpoint."""
+
+    def setUp(self):
+        """Set up the test client and a logged-in user."""
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="tabuser",
+            password="password123",
+            email="tab@example.com",
+            first_name="Tab",
+            last_name="User",
+        )
+        self.client.force_login(self.user)
+
+    def test_anonymous_users_are_redirected_to_login(self):
+        """The endpoint requires authentication."""
+        self.client.logout()
+        response = self.client.get(reverse("ticket_tab", args=["active"]))
+        self.assertRedirects(response, f"{reverse('login')}?next=/tabs/active/", fetch_redirect_response=False)
+
+    def test_unknown_tab_is_404(self):
+        """Only the three dashboard tabs are served."""
+        response = self.client.get(reverse("ticket_tab", args=["archived"]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_invalid_cursor_is_400(self):
+        """A malformed cursor is rejected."""
+        response = self.client.get(reverse("ticket_tab", args=["active"]), {"cursor": "bogus"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_empty_first_page_shows_empty_state(self):
+        """An empty tab renders its empty-state message."""
+        response = self.client.get(reverse("ticket_tab", args=["completed"]))
+        self.assertContains(response, "No completed tickets yet.")
+        self.assertNotContains(response, "load-more")
+
+    def test_pages_follow_the_cursor(self):
+        """Each page links to the next until the tab is exhausted."""
+        tickets = [Ticket.objects.create(title=f"T{i}", created_by=self.user) for i in range(3)]
+        url = reverse("ticket_tab", args=["active"])
+        with patch.object(dashboard, "PAGE_SIZE", 2):
+            first = self.client.get(url)
+            second = self.client.get(url, {"cursor": first.context["next_cursor"]})
+        self.assertEqual([t.pk for t in first.context["tickets"]], [tickets[2].pk, tickets[1].pk])
+        self.assertContains(first, "load-more")
+        self.assertEqual([t.pk for t in second.context["tickets"]], [tickets[0].pk])
+        self.assertIsNone(second.context["next_cursor"])
+        self.assertNotContains(second, "No active tickets right now.")
@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+from tickets.models import Ticket, TicketMessage
+from tickets.services import thread
+
+User = get_user_model()
+
+
+class TicketThreadViewTests(TestCase):
+    """Tests for the paged and streamed ticket conversation views."""
+
+    def setUp(self):
+        """Log in the owner of a ticket with a staff reply and a few messages."""
+        self.user = User.objects.create_user(
+            username="threadview",
+            password="password123",
+            email="threadview@example.com",
+            first_name="Thread",
+            last_name="Viewer",
+        )
+        self.staff = User.objects.create_user(
+            username="threadstaffview",
+            password="password123",
+            email="threadstaffview@example.com",
+            first_name="Helpful",
+            last_name="Agent",
+            is_staff=True,
+        )
+        self.ticket = Ticket.objects.create(title="Laptop won't boot", created_by=self.user)
+        for i in range(4):
+            TicketMessage.objects.create(ticket=self.ticket, sender=self.user, body=f"Question {i}")
+        TicketMessage.objects.create(ticket=self.ticket, sender=self.staff, body="Try holding power")
+        self.url = reverse("ticket_thread", args=[self.ticket.pk])
+        self.client.login(username="threadview", password="password123")
+
+    def test_shows_newest_messages_with_senders(self):
+        """The first page ends with the newest message and labels staff replies."""
+        response = self.client.get(self.url)
+        self.assertTemplateUsed(response, "ticket_thread.html")
+        self.assertContains(response, "Helpful Agent")
+        self.assertContains(response, "STAFF")
+        self.assertEqual(response.context["messages"][-1].body, "Try holding power")
+
+    def test_load_older_and_newer_fragments(self):
+        """Cursors fetch older or newer messages as fragments with their own load-more buttons."""
+        with patch.object(thread, "PAGE_SIZE", 2):
+            first = self.client.get(self.url)
+            older = self.client.get(self.url, {"before": first.context["next_cursor"]})
+            newer = self.client.get(self.url, {"after": older.context["latest_cursor"]})
+        self.assertTemplateNotUsed(older, "ticket_thread.html")
+        self.assertEqual([m.body for m in older.context["messages"]], ["Question 1", "Question 2"])
+        self.assertContains(older, "Load older messages")
+        self.assertEqual([m.body for m in newer.context["messages"]], ["Question 3", "Try holding power"])
+        self.assertNotContains(newer, "Load newer messages")
+
+    def test_query_count_does_not_grow_with_thread_length(self):
+        """Session, user, ticket and one page of messages, however long the thread."""
+        for i in range(30):
+            TicketMessage.objects.create(ticket=self.ticket, sender=self.staff, body=f"More {i}")
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
+
+    def test_other_users_tickets_are_not_found(self):
+        """Customers get a 404 for tickets they do not own."""
+        other = Ticket.objects.create(title="Not yours", created_by=self.staff)
+        response = self.client.get(reverse("ticket_thread", args=[other.pk]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_bad_cursor_is_rejected(self):
+        """A corrupted cursor gets a 400."""
+        self.assertEqual(self.client.get(self.url, {"before": "%%%"}).status_code, 400)
+
+    def test_empty_thread(self):
+        """A ticket without messages says so."""
+        empty = Ticket.objects.create(title="Quiet", created_by=self.user)
+        response = self.client.get(reverse("ticket_thread", args=[empty.pk]))
+        self.assertContains(response, "No messages yet.")
+
+    def test_full_thread_is_streamed_in_batches(self):
+        """The full view streams the shell and every message, oldest first."""
+        with patch.object(thread, "STREAM_BATCH_SIZE", 2):
+            response = self.client.get(reverse("ticket_thread_full", args=[self.ticket.pk]))
+            chunks = [chunk.decode() for chunk in response.streaming_content]
+        self.assertTrue(response.streaming)
+        self.assertEqual(len(chunks), 5)
+        body = "".join(chunks)
+        self.assertLess(body.index("Question 0"), body.index("Try holding power"))
+        self.assertIn("</html>", chunks[-1])
+
+    def test_dashboard_links_to_the_thread(self):
+        """The dashboard's "Open full ticket" link points at the thread view."""
+        response = self.client.get(reverse("home"))
+        self.assertContains(response, f'href="{self.url}"')
@@ -1,2 +1,9 @@
-from .home import HomeView
-from .auth import CustomLoginView
\ No newline at end of file
+from .home import AsyncHomeView, HomeView
+from .auth import CustomLoginView
+from .ticket_tab import TicketTabView
+from .search import SearchView
+from .ticket_thread import TicketThreadView, TicketThreadStreamView
+from .ticket_events import TicketEventsView
+from .avatar import AvatarView
+from .export import TicketExportView
+from .reports import DepartmentReportView
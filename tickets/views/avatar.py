@@ -0,0 +1,22 @@
+import re
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404
+from django.views import View
+
+from ..services.avatars import CONTENT_TYPES, variant_path
+
+AVATAR_NAME = re.compile(r"^[0-9a-f]{64}-\d+\.(webp|jpg)$")
+
+
+class AvatarView(View):
+    """Serve a resized avatar variant; names are content hashes, so responses are cacheable forever."""
+    def get(self, request, name):
+        """Stream the variant with long-lived, immutable cache headers."""
+        match = AVATAR_NAME.match(name)
+        if not match or not default_storage.exists(variant_path(name)):
+            raise Http404("No such avatar.")
+        response = FileResponse(default_storage.open(variant_path(name)), content_type=CONTENT_TYPES[match[1]])
+        response["Cache-Control"] = f"public, max-age={settings.AVATAR_CACHE_SECONDS}, immutable"
+        return response
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import Http404, HttpResponseBadRequest, StreamingHttpResponse
+from django.views import View
+
+from ..services.export import CONTENT_TYPES, DATASETS, export_filename, export_stream
+
+
+class TicketExportView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """Stream a full table export as CSV or JSON Lines for staff, optionally gzipped."""
+    def test_func(self):
+        """Only staff may export every ticket."""
+        return self.request.user.is_staff
+
+    def get(self, request, dataset):
+        """Stream ``dataset`` in the ``format`` query parameter, gzipped when ``gzip=1``."""
+        if dataset not in DATASETS:
+            raise Http404("Unknown export.")
+        fmt, compress = request.GET.get("format", "csv"), request.GET.get("gzip") == "1"
+        if fmt not in CONTENT_TYPES:
+            return HttpResponseBadRequest("Unknown export format.")
+        stream = export_stream(dataset, fmt, settings.TICKET_EXPORT_BATCH_SIZE, compress)
+        response = StreamingHttpResponse(stream, content_type="application/gzip" if compress else CONTENT_TYPES[fmt])
+        response["Content-Disposition"] = f'attachment; filename="{export_filename(dataset, fmt, compress)}"'
+        return response
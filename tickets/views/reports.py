@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import HttpResponseBadRequest
+from django.shortcuts import render
+from django.utils import timezone
+from django.views import View
+
+from ..models import RollupWatermark
+from ..services.rollups import WATERMARK, department_report
+
+
+class DepartmentReportView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """Response times, closures and backlog per department, read only from the daily rollups."""
+    def test_func(self):
+        """Only staff may see every department's figures."""
+        return self.request.user.is_staff
+
+    def get(self, request):
+        """Render the report over the last ``days`` days (default ROLLUP_REPORT_DAYS)."""
+        days = request.GET.get("days", str(settings.ROLLUP_REPORT_DAYS))
+        if not days.isdigit() or not 1 <= int(days) <= 366:
+            return HttpResponseBadRequest("Invalid number of days.")
+        since = timezone.localdate() - timedelta(days=int(days) - 1)
+        return render(request, "department_report.html", {
+            "days": int(days),
+            "since": since,
+            "rows": department_report(since),
+            "watermark": RollupWatermark.objects.filter(name=WATERMARK).first(),
+        })
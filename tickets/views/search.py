@@ -0,0 +1,25 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpResponseBadRequest
+from django.shortcuts import render
+from django.views import View
+
+from ..services.search import search
+
+
+class SearchView(LoginRequiredMixin, View):
+    """Ranked full-text search over the tickets the user can see."""
+    def get(self, request):
+        """Render the results page, or just the next page of results when a cursor is given."""
+        query = request.GET.get("q", "").strip()
+        cursor = request.GET.get("cursor")
+        try:
+            results, next_cursor = search(request.user, query, cursor)
+        except ValueError:
+            return HttpResponseBadRequest("Invalid cursor.")
+
+        return render(request, "partials/search_page.html" if cursor else "search.html", {
+            "query": query,
+            "results": results,
+            "next_cursor": next_cursor,
+            "is_first_page": not cursor,
+        })
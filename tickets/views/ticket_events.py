@@ -0,0 +1,35 @@
+from django.http import HttpResponse, HttpResponseForbidden, StreamingHttpResponse
+from django.views import View
+
+from ..services.events import EventStream, department_channel, get_broker, served_over_asgi, user_channel
+
+
+def event_channels(user, departments):
+    """Channels a user may listen on: their own tickets, plus the requested departments for staff."""
+    channels = [user_channel(user.pk)]
+    if user.is_staff:
+        channels += [department_channel(int(d)) for d in departments if d.isdigit()]
+    return channels
+
+
+class TicketEventsView(View):
+    """Push ticket messages and status changes to the browser as Server-Sent Events.
+
+    The view is async, so each open stream is a suspended coroutine on the ASGI
+    event loop rather than a blocked worker thread. Under WSGI the endless stream
+    would pin a worker for good, so it is refused with 204 No Content, which tells
+    EventSource clients to stop reconnecting.
+    """
+    async def get(self, request):
+        """Subscribe to the user's channels and stream events until the client goes away."""
+        user = await request.auser()
+        if not user.is_authenticated:
+            return HttpResponseForbidden()
+        if not served_over_asgi(request):
+            return HttpResponse(status=204)
+        subscription = get_broker().subscribe(event_channels(user, request.GET.getlist("department")))
+        return StreamingHttpResponse(
+            EventStream(subscription),
+            content_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
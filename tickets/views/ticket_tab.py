@@ -0,0 +1,26 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, HttpResponseBadRequest
+from django.shortcuts import render
+from django.views import View
+
+from ..services.dashboard import TAB_SORT_FIELDS, paginate, tab_querysets
+
+
+class TicketTabView(LoginRequiredMixin, View):
+    """Serve one keyset-paginated page of a dashboard tab as an HTML fragment."""
+    def get(self, request, tab):
+        """Render the page of ``tab`` that follows the ``cursor`` query parameter."""
+        if tab not in TAB_SORT_FIELDS:
+            raise Http404("Unknown tab.")
+        cursor = request.GET.get("cursor")
+        try:
+            tickets, next_cursor = paginate(tab_querysets(request.user)[tab], tab, cursor)
+        except ValueError:
+            return HttpResponseBadRequest("Invalid cursor.")
+
+        return render(request, "partials/ticket_page.html", {
+            "tab": tab,
+            "tickets": tickets,
+            "next_cursor": next_cursor,
+            "is_first_page": not cursor,
+        })
@@ -0,0 +1,57 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, HttpResponseBadRequest, StreamingHttpResponse
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.views import View
+
+from ..services.archive import read_through
+from ..services.dashboard import encode_cursor
+from ..services.thread import iter_thread, thread_page
+
+# Where ticket_thread_full.html splits so messages can be streamed in between.
+STREAM_MARKER = "<!-- thread-messages -->"
+
+
+def get_visible_ticket(request, pk):
+    """The ticket ``pk``, live or archived, if the requesting user may open it, else 404."""
+    ticket = read_through(request.user, pk)
+    if ticket is None:
+        raise Http404("No ticket matches the given query.")
+    return ticket
+
+
+class TicketThreadView(LoginRequiredMixin, View):
+    """Show a ticket's conversation one keyset page at a time, in either direction."""
+    def get(self, request, pk):
+        """Render the newest page, or the older/newer fragment named by ``before``/``after``."""
+        ticket = get_visible_ticket(request, pk)
+        direction = "after" if "after" in request.GET else "before"
+        cursor = request.GET.get(direction)
+        try:
+            messages, next_cursor = thread_page(ticket, direction, cursor)
+        except ValueError:
+            return HttpResponseBadRequest("Invalid cursor.")
+
+        return render(request, "partials/thread_page.html" if cursor else "ticket_thread.html", {
+            "direction": direction,
+            "ticket": ticket, "messages": messages,
+            "next_cursor": next_cursor,
+            "latest_cursor": encode_cursor(messages[-1], "timestamp") if messages else "",
+        })
+
+
+class TicketThreadStreamView(LoginRequiredMixin, View):
+    """Stream a whole conversation in keyset batches instead of building it in memory."""
+    def get(self, request, pk):
+        """Send the page shell straight away, then each batch of messages as it is read."""
+        ticket = get_visible_ticket(request, pk)
+        page = render_to_string("ticket_thread_full.html", {"ticket": ticket}, request)
+        head, tail = page.split(STREAM_MARKER)
+        return StreamingHttpResponse(self.stream(request, ticket, head, tail), content_type="text/html; charset=utf-8")
+
+    def stream(self, request, ticket, head, tail):
+        """Yield the shell's head, the rendered message batches, then its tail."""
+        yield head
+        for batch in iter_thread(ticket):
+            yield render_to_string("partials/thread_messages.html", {"messages": batch}, request)
+        yield tail